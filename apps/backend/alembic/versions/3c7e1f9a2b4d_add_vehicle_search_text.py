@@ -0,0 +1,41 @@
+"""Add vehicle search text
+
+Revision ID: 3c7e1f9a2b4d
+Revises: 9a4af8cfa8b2
+Create Date: 2026-10-18 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7e1f9a2b4d'
+down_revision: Union[str, None] = '9a4af8cfa8b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('vehicles', sa.Column(
+        'search_text',
+        sa.String(),
+        sa.Computed("model || ' ' || vin_number || ' ' || registration_number", persisted=True),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_vehicles_search_text_trgm',
+        'vehicles',
+        ['search_text'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicles_search_text_trgm', table_name='vehicles', postgresql_using='gin')
+    op.drop_column('vehicles', 'search_text')
@@ -0,0 +1,71 @@
+"""Add customer search keys
+
+Revision ID: 5d2b8e4f6a1c
+Revises: 3c7e1f9a2b4d
+Create Date: 2026-10-18 10:03:17.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b8e4f6a1c'
+down_revision: Union[str, None] = '3c7e1f9a2b4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('customers', sa.Column(
+        'email_normalized',
+        sa.String(),
+        sa.Computed("lower(email)", persisted=True),
+        nullable=True,
+    ))
+    op.add_column('customers', sa.Column(
+        'phone_normalized',
+        sa.String(),
+        sa.Computed("regexp_replace(regexp_replace(phone, '[^0-9]', '', 'g'), '^00', '')", persisted=True),
+        nullable=True,
+    ))
+    op.add_column('customers', sa.Column(
+        'name_search',
+        sa.String(),
+        sa.Computed("lower(first_name || ' ' || last_name)", persisted=True),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_customers_organization_id_email_normalized',
+        'customers',
+        ['organization_id', 'email_normalized'],
+        unique=False,
+        postgresql_ops={'email_normalized': 'text_pattern_ops'},
+    )
+    op.create_index(
+        'ix_customers_organization_id_phone_normalized',
+        'customers',
+        ['organization_id', 'phone_normalized'],
+        unique=False,
+        postgresql_ops={'phone_normalized': 'text_pattern_ops'},
+    )
+    op.create_index(
+        'ix_customers_name_search_trgm',
+        'customers',
+        ['name_search'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name_search': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customers_name_search_trgm', table_name='customers', postgresql_using='gin')
+    op.drop_index('ix_customers_organization_id_phone_normalized', table_name='customers')
+    op.drop_index('ix_customers_organization_id_email_normalized', table_name='customers')
+    op.drop_column('customers', 'name_search')
+    op.drop_column('customers', 'phone_normalized')
+    op.drop_column('customers', 'email_normalized')
@@ -0,0 +1,37 @@
+"""Add organization daily statistics
+
+Revision ID: 8e1f4c7b2d9a
+Revises: 5d2b8e4f6a1c
+Create Date: 2026-10-18 11:24:05.318842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1f4c7b2d9a'
+down_revision: Union[str, None] = '5d2b8e4f6a1c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'organization_daily_statistics',
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('sales_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('revenue', sa.Float(), server_default='0', nullable=False),
+        sa.Column('new_customers', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('listings', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('delistings', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id', 'day'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('organization_daily_statistics')
@@ -0,0 +1,26 @@
+"""Add organization data version
+
+Revision ID: a3c5e7f9b1d2
+Revises: 8e1f4c7b2d9a
+Create Date: 2026-10-18 16:02:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d2'
+down_revision: Union[str, None] = '8e1f4c7b2d9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('organizations', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('organizations', 'data_version')
@@ -0,0 +1,52 @@
+"""Scope vehicle search index by organization
+
+Revision ID: a8c0e2f4b6d7
+Revises: f7a9b1c3d5e6
+Create Date: 2026-10-19 10:02:13.845120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c0e2f4b6d7'
+down_revision: Union[str, None] = 'f7a9b1c3d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gin lets organization_id be a column of the trigram GIN index, so a search
+    # only walks the postings of its own organization
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_vehicles_organization_id_search_text_trgm',
+            'vehicles',
+            ['organization_id', 'search_text'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_vehicles_search_text_trgm', table_name='vehicles', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_vehicles_search_text_trgm',
+            'vehicles',
+            ['search_text'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_vehicles_organization_id_search_text_trgm', table_name='vehicles', postgresql_concurrently=True
+        )
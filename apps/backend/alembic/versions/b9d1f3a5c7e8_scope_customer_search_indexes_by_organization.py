@@ -0,0 +1,58 @@
+"""Scope customer search indexes by organization
+
+Revision ID: b9d1f3a5c7e8
+Revises: a8c0e2f4b6d7
+Create Date: 2026-10-19 10:14:52.603981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d1f3a5c7e8'
+down_revision: Union[str, None] = 'a8c0e2f4b6d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (global index, per-organization index, column)
+INDEXES = [
+    ('ix_customers_name_search_trgm', 'ix_customers_organization_id_name_search_trgm', 'name_search'),
+    ('ix_customers_email_normalized_trgm', 'ix_customers_organization_id_email_normalized_trgm', 'email_normalized'),
+    ('ix_customers_phone_normalized_trgm', 'ix_customers_organization_id_phone_normalized_trgm', 'phone_normalized'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    with op.get_context().autocommit_block():
+        for old_name, name, column in INDEXES:
+            op.create_index(
+                name,
+                'customers',
+                ['organization_id', column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(old_name, table_name='customers', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for old_name, name, column in reversed(INDEXES):
+            op.create_index(
+                old_name,
+                'customers',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(name, table_name='customers', postgresql_concurrently=True)
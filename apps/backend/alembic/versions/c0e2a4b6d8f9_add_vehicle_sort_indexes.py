@@ -0,0 +1,37 @@
+"""Add vehicle sort indexes
+
+Revision ID: c0e2a4b6d8f9
+Revises: b9d1f3a5c7e8
+Create Date: 2026-10-19 11:02:37.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0e2a4b6d8f9'
+down_revision: Union[str, None] = 'b9d1f3a5c7e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_vehicles_organization_id_created_by_id_price', ['organization_id', 'created_by_id', 'price', 'id']),
+    ('ix_vehicles_organization_id_created_by_id_kms_driven', ['organization_id', 'created_by_id', 'kms_driven', 'id']),
+    ('ix_vehicles_organization_id_created_by_id_model_year', ['organization_id', 'created_by_id', 'model_year', 'id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, and does not block writes while building
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, 'vehicles', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='vehicles', postgresql_concurrently=True)
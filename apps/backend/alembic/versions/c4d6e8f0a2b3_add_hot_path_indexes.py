@@ -0,0 +1,52 @@
+"""Add hot path indexes
+
+Revision ID: c4d6e8f0a2b3
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-18 16:41:09.527364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d6e8f0a2b3'
+down_revision: Union[str, None] = 'a3c5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_vehicles_organization_id_created_by_id_created_at', 'vehicles',
+     ['organization_id', 'created_by_id', 'created_at', 'id'], None),
+    ('ix_vehicles_unsold_organization_id_created_by_id_created_at', 'vehicles',
+     ['organization_id', 'created_by_id', 'created_at', 'id'], 'sold_to_id IS NULL'),
+    ('ix_vehicles_organization_id_sold_at', 'vehicles',
+     ['organization_id', 'sold_at'], 'sold_at IS NOT NULL'),
+    ('ix_vehicles_sold_to_id', 'vehicles',
+     ['sold_to_id'], 'sold_to_id IS NOT NULL'),
+    ('ix_customers_organization_id_created_at', 'customers',
+     ['organization_id', 'created_at', 'id'], None),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, and does not block writes while building
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
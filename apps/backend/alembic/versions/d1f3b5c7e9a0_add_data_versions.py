@@ -0,0 +1,31 @@
+"""Add data versions
+
+Revision ID: d1f3b5c7e9a0
+Revises: c0e2a4b6d8f9
+Create Date: 2026-10-19 11:48:15.630942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e9a0'
+down_revision: Union[str, None] = 'c0e2a4b6d8f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'data_versions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
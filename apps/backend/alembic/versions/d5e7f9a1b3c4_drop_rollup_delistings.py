@@ -0,0 +1,31 @@
+"""Drop rollup delistings
+
+Revision ID: d5e7f9a1b3c4
+Revises: c4d6e8f0a2b3
+Create Date: 2026-10-18 18:12:37.604915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e7f9a1b3c4'
+down_revision: Union[str, None] = 'c4d6e8f0a2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Deleting a vehicle now reverts its listing, rebuild the rollup afterwards
+    # so listings of vehicles deleted before this revision are dropped too
+    op.drop_column('organization_daily_statistics', 'delistings')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'organization_daily_statistics',
+        sa.Column('delistings', sa.Integer(), server_default='0', nullable=False),
+    )
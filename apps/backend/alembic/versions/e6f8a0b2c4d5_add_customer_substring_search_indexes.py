@@ -0,0 +1,44 @@
+"""Add customer substring search indexes
+
+Revision ID: e6f8a0b2c4d5
+Revises: d5e7f9a1b3c4
+Create Date: 2026-10-18 18:47:52.081266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f8a0b2c4d5'
+down_revision: Union[str, None] = 'd5e7f9a1b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_customers_email_normalized_trgm', 'email_normalized'),
+    ('ix_customers_phone_normalized_trgm', 'phone_normalized'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name,
+                'customers',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='customers', postgresql_using='gin', postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""Add vehicle deletions and rollup delistings
+
+Revision ID: f7a9b1c3d5e6
+Revises: e6f8a0b2c4d5
+Create Date: 2026-10-19 09:21:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a9b1c3d5e6'
+down_revision: Union[str, None] = 'e6f8a0b2c4d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Vehicles deleted before this revision had their listing reverted and left no deletion
+    # row, a rebuild agrees with that, so there is nothing to backfill
+    op.add_column(
+        'organization_daily_statistics',
+        sa.Column('delistings', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.create_table(
+        'vehicle_deletions',
+        sa.Column('vehicle_id', sa.UUID(), nullable=False),
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('listed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('vehicle_id'),
+    )
+    op.create_index('ix_vehicle_deletions_organization_id', 'vehicle_deletions', ['organization_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicle_deletions_organization_id', table_name='vehicle_deletions')
+    op.drop_table('vehicle_deletions')
+    op.drop_column('organization_daily_statistics', 'delistings')
@@ -0,0 +1,99 @@
+import argparse
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from pydantic import TypeAdapter
+
+from app.models.pagination_model import CursorPage
+from app.models.vehicle_model import VehicleResponse
+from app.schemas import Vehicle
+from app.services.vehicles_service import VEHICLE_RESPONSE_COLUMNS
+from app.utilities.response_utility import dumps
+
+
+def _make_rows(count: int):
+    organization_id = uuid.uuid4()
+    brand_id = uuid.uuid4()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    rows = []
+    for index in range(count):
+        row = {
+            "id": uuid.uuid4(),
+            "registration_number": f"REG{index:06d}",
+            "vin_number": f"VIN{index:014d}",
+            "is_new": index % 2 == 0,
+            "sold_to_id": uuid.uuid4() if index % 3 == 0 else None,
+            "sold_at": created_at + timedelta(days=index % 90) if index % 3 == 0 else None,
+            "kms_driven": index * 17,
+            "brand_id": brand_id,
+            "organization_id": organization_id,
+            "model": "Corolla",
+            "model_year": 2000 + index % 25,
+            "fuel_type": "petrol",
+            "color": "Red",
+            "description": "Well maintained vehicle with all service records available.",
+            "price": 10000 + index * 0.5,
+            "first_registration": date(2020, 1, 1) + timedelta(days=index % 365),
+            "created_at": created_at + timedelta(minutes=index),
+            "updated_at": created_at + timedelta(minutes=index),
+        }
+        rows.append({name: row.get(name) for name in VEHICLE_RESPONSE_COLUMNS})
+    return rows
+
+
+def _before(vehicles):
+    # What list endpoints did before: per item validation in the service, a second validation
+    # against the response_model and the stdlib encoder used by JSONResponse
+    page = CursorPage(items=[VehicleResponse.model_validate(vehicle) for vehicle in vehicles], size=len(vehicles))
+    adapter = TypeAdapter(CursorPage[VehicleResponse])
+    content = adapter.dump_python(adapter.validate_python(page), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _after(rows):
+    # Projected rows are encoded as they come from the database
+    return dumps(CursorPage(items=rows, size=len(rows)))
+
+
+def _measure(fn, argument, repeat: int):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn(argument)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the per row cost of serializing a vehicle list page the old way "
+            "(ORM objects validated into response models, stdlib json) and the projected way (dicts, orjson). "
+            "Only serialization is timed, no database is needed."
+        )
+    )
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs, the best one is reported (default: 200)")
+    args = parser.parse_args()
+
+    rows = _make_rows(args.rows)
+    vehicles = [Vehicle(**row) for row in rows]
+
+    before, before_body = _measure(_before, vehicles, args.repeat)
+    after, after_body = _measure(_after, rows, args.repeat)
+
+    if json.loads(before_body) != json.loads(after_body):
+        raise SystemExit("Serialized pages differ")
+
+    print(f"{'path':<10} {'page (ms)':>10} {'per row (us)':>13}")
+    print(f"{'before':<10} {before * 1000:>10.3f} {before / args.rows * 1e6:>13.2f}")
+    print(f"{'after':<10} {after * 1000:>10.3f} {after / args.rows * 1e6:>13.2f}")
+    print(f"Speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import date
+
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.models.customer_model import CustomerFilter
+from app.models.pagination_model import CursorParams
+from app.models.vehicle_model import FuelType, VehicleCreate, VehicleFilter, VehicleMarkAsSold
+from app.schemas import Customer, User, Vehicle
+from app.services.customers_service import CustomerService
+from app.services.statistics_rollup_service import StatisticsRollupService
+from app.services.statistics_service import StatisticsService
+from app.services.vehicles_service import VehiclesService
+from app.utilities.response_utility import dumps
+from app.utilities.seed_utility import SEED_AS_OF, seed_brands, seed_organization, seed_user
+from app.utilities.statistics_cache_utility import dashboard_cache
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+BENCHMARK_PASSWORD = "benchmark-password"
+
+# Customers seeded per vehicle in each benchmark organization
+CUSTOMERS_PER_VEHICLE = 0.1
+
+# Metrics compared against the baseline, and whether a higher value is a regression
+COMPARED_METRICS = ["median_ms", "queries", "peak_kib"]
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+def _prepare(seed: int, size: int, as_of: date):
+    db = SessionLocal()
+    try:
+        user_id = seed_user(db, BENCHMARK_EMAIL, BENCHMARK_PASSWORD)
+        brand_ids = seed_brands(db, user_id)
+        organization_id = seed_organization(
+            db,
+            random.Random(f"{seed}-{size}"),
+            user_id,
+            brand_ids,
+            f"Benchmark {size}",
+            size,
+            int(size * CUSTOMERS_PER_VEHICLE),
+            as_of,
+        )
+
+        user = db.get(User, user_id)
+        db.expunge(user)
+        customer_id = db.query(Customer.id).filter(Customer.organization_id == organization_id).limit(1).scalar()
+        vehicle_id = (
+            db.query(Vehicle.id)
+            .filter(Vehicle.organization_id == organization_id, Vehicle.sold_to_id == None)
+            .limit(1)
+            .scalar()
+        )
+        return organization_id, user, brand_ids[0], customer_id, vehicle_id
+    finally:
+        db.close()
+
+
+def _benchmarks(organization_id, user, brand_id, customer_id, vehicle_id, created_ids):
+    def list_vehicles(db):
+        VehiclesService(db).get_all(user, organization_id, VehicleFilter(), CursorParams())
+
+    def search_vehicles(db):
+        VehiclesService(db).get_all(user, organization_id, VehicleFilter(search="corolla"), CursorParams())
+
+    def create_vehicle(db):
+        vin = uuid.uuid4().hex[:17].upper()
+        vehicle = VehiclesService(db).create(
+            VehicleCreate(
+                registration_number=vin[:8],
+                vin_number=vin,
+                is_new=True,
+                kms_driven=0,
+                brand_id=brand_id,
+                model="Corolla",
+                model_year=date.today().year,
+                fuel_type=FuelType.PETROL,
+                price=25000.0,
+                first_registration=date.today(),
+            ),
+            user,
+            organization_id,
+        )
+        created_ids.append(vehicle.id)
+
+    def mark_as_sold(db):
+        VehiclesService(db).mark_as_sold(vehicle_id, VehicleMarkAsSold(sold_to_id=customer_id), user, organization_id)
+
+    def list_customers(db):
+        CustomerService(db).get_all(organization_id, user, CursorParams())
+
+    def search_customers(db):
+        CustomerService(db).get_all(organization_id, user, CursorParams(), CustomerFilter(search="anna"))
+
+    def dashboard(db):
+        # An empty dashboard cache, so every run computes the statistics
+        dashboard_cache.clear()
+        StatisticsService(db).get_dashboard_statistics(organization_id, user)
+
+    db = SessionLocal()
+    try:
+        page = VehiclesService(db).get_all(user, organization_id, VehicleFilter(), CursorParams(size=100))
+    finally:
+        db.close()
+
+    def serialize_vehicles(db):
+        dumps(page)
+
+    return [
+        ("vehicles.get_all", list_vehicles),
+        ("vehicles.get_all search", search_vehicles),
+        ("vehicles.create", create_vehicle),
+        ("vehicles.mark_as_sold", mark_as_sold),
+        ("customers.get_all", list_customers),
+        ("customers.get_all search", search_customers),
+        ("statistics.get_dashboard_statistics", dashboard),
+        ("vehicles serialization (100 rows)", serialize_vehicles),
+    ]
+
+
+def _run_once(fn, trace_memory: bool = False):
+    counter = _QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    db = SessionLocal()
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        fn(db)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        db.close()
+        event.remove(engine, "before_cursor_execute", counter)
+
+    return elapsed, counter.count, peak
+
+
+def _measure(fn, repeat: int) -> dict:
+    _run_once(fn)
+
+    timings, queries = [], 0
+    for _ in range(repeat):
+        elapsed, queries, _ = _run_once(fn)
+        timings.append(elapsed)
+
+    # Memory is traced in a run of its own, tracemalloc slows everything down
+    _, _, peak = _run_once(fn, trace_memory=True)
+
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "queries": queries,
+        "peak_kib": peak / 1024,
+    }
+
+
+def _cleanup(organization_id, user, vehicle_id, created_ids):
+    # Leave the organization as seeded, so the next run measures the same data
+    db = SessionLocal()
+    try:
+        service = VehiclesService(db)
+        if vehicle_id is not None:
+            service.mark_as_unsold(vehicle_id, user, organization_id)
+        for created_id in created_ids:
+            service.delete(created_id, organization_id, user)
+
+        # The seeder builds the rollup the same way, this also drops any float drift of the revenue
+        StatisticsRollupService(db).rebuild(organization_id)
+    finally:
+        db.close()
+
+
+def _compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+
+    for key, metrics in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+
+        for metric in COMPARED_METRICS:
+            # Query counts are exact, timings and memory get the tolerance
+            limit = expected[metric] if metric == "queries" else expected[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(f"{key}: {metric} {metrics[metric]:.2f} > {expected[metric]:.2f}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the service layer against benchmark organizations seeded into DATABASE_URL. "
+            "Wall time, query count and tracemalloc peak memory are recorded per service call, "
+            "and compared against a stored baseline."
+        )
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1000,100000",
+        help="Comma separated vehicle counts of the benchmark organizations (default: 1000,100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per benchmark (default: 10)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the generated data (default: 1)")
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=SEED_AS_OF,
+        help=f"Day the seeded history ends on, YYYY-MM-DD (default: {SEED_AS_OF})",
+    )
+    parser.add_argument("--baseline", help="Baseline JSON file to compare the results with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown and memory growth over the baseline (default: 0.25)",
+    )
+    parser.add_argument("--save", help="Write the results to this JSON file, e.g. to use as the next baseline")
+    args = parser.parse_args()
+
+    results = {}
+    for size in [int(size) for size in args.sizes.split(",")]:
+        started = time.perf_counter()
+        organization_id, user, brand_id, customer_id, vehicle_id = _prepare(args.seed, size, args.as_of)
+        print(f"Organization with {size} vehicles ready in {time.perf_counter() - started:.1f}s")
+
+        created_ids = []
+        try:
+            for name, fn in _benchmarks(organization_id, user, brand_id, customer_id, vehicle_id, created_ids):
+                metrics = _measure(fn, args.repeat)
+                results[f"{name} @ {size}"] = metrics
+                print(
+                    f"  {name:<40} {metrics['median_ms']:>9.2f} ms {metrics['min_ms']:>9.2f} ms min "
+                    f"{metrics['queries']:>3} queries {metrics['peak_kib']:>9.1f} KiB peak"
+                )
+        finally:
+            _cleanup(organization_id, user, vehicle_id, created_ids)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = _compare(results, json.load(file), args.tolerance)
+
+        if regressions:
+            print("Regressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
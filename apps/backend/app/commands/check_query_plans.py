@@ -0,0 +1,200 @@
+import argparse
+import sys
+import uuid
+from datetime import date, timedelta
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import event, func
+
+from app.config import config
+from app.database import SessionLocal, engine
+from app.models.customer_model import CustomerFilter
+from app.models.pagination_model import CursorParams
+from app.models.statistics_model import StatisticsGranularity
+from app.models.vehicle_model import VehicleFilter
+from app.schemas import Organization, User, Vehicle
+from app.services.customers_service import CustomerService
+from app.services.statistics_service import StatisticsService
+from app.services.vehicles_service import VehiclesService
+
+# Tables whose hot paths must be served by an index, whatever their size
+HOT_TABLES = {"vehicles", "customers", "organization_daily_statistics"}
+
+
+def _checks(organization_id: UUID, user: User):
+    today = date.today()
+    other_timezone = "Europe/Warsaw" if config.STATISTICS_TIMEZONE == "UTC" else "UTC"
+
+    def dashboard(timezone):
+        return lambda db: StatisticsService(db).compute_dashboard_statistics(
+            organization_id, today - timedelta(days=89), today, StatisticsGranularity.DAY, timezone, True
+        )
+
+    return [
+        ("vehicles: list", lambda db: VehiclesService(db).get_all(user, organization_id, VehicleFilter(), CursorParams())),
+        (
+            "vehicles: list unsold",
+            lambda db: VehiclesService(db).get_all(user, organization_id, VehicleFilter(sale_status="unsold"), CursorParams()),
+        ),
+        *(
+            (
+                f"vehicles: list by {sort_by}",
+                lambda db, sort_by=sort_by: VehiclesService(db).get_all(
+                    user, organization_id, VehicleFilter(sort_by=sort_by), CursorParams()
+                ),
+            )
+            for sort_by in ("price", "kms_driven", "model_year")
+        ),
+        (
+            "vehicles: search",
+            lambda db: VehiclesService(db).get_all(user, organization_id, VehicleFilter(search="corolla"), CursorParams()),
+        ),
+        ("vehicles: detail", lambda db: VehiclesService(db).get_one(uuid.uuid4(), organization_id, user)),
+        (
+            "vehicles: export",
+            lambda db: db.execute(VehiclesService(db).get_export_statement(user, organization_id, VehicleFilter())).first(),
+        ),
+        ("customers: list", lambda db: CustomerService(db).get_all(organization_id, user, CursorParams())),
+        (
+            "customers: search by email",
+            lambda db: CustomerService(db).get_all(
+                organization_id, user, CursorParams(), CustomerFilter(search="john@example.com")
+            ),
+        ),
+        (
+            "customers: search by phone",
+            lambda db: CustomerService(db).get_all(
+                organization_id, user, CursorParams(), CustomerFilter(search="612 345")
+            ),
+        ),
+        (
+            "customers: search by email domain",
+            lambda db: CustomerService(db).get_all(
+                organization_id, user, CursorParams(), CustomerFilter(search="example.com")
+            ),
+        ),
+        (
+            "customers: search by name",
+            lambda db: CustomerService(db).get_all(organization_id, user, CursorParams(), CustomerFilter(search="john")),
+        ),
+        ("customers: detail", lambda db: CustomerService(db).get_one(uuid.uuid4(), organization_id, user)),
+        ("statistics: dashboard", dashboard(config.STATISTICS_TIMEZONE)),
+        ("statistics: dashboard in another time zone", dashboard(other_timezone)),
+    ]
+
+
+def _capture(check):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    db = SessionLocal()
+    try:
+        check(db)
+    except HTTPException:
+        # Not found is expected for made up ids, the query has run by then
+        pass
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return statements
+
+
+def _walk(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def _explain(cursor, statement, parameters):
+    # The same statement and parameters the service sent, so the plan is the one it got
+    if parameters:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    else:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}")
+
+    return list(_walk(cursor.fetchone()[0][0]["Plan"]))
+
+
+def _resolve_organization(organization_id):
+    db = SessionLocal()
+    try:
+        if organization_id is None:
+            # The largest tenant gives the most representative plans
+            organization_id = (
+                db.query(Vehicle.organization_id)
+                .group_by(Vehicle.organization_id)
+                .order_by(func.count().desc())
+                .limit(1)
+                .scalar()
+            )
+        if organization_id is None:
+            organization_id = db.query(Organization.id).limit(1).scalar()
+
+        organization = db.get(Organization, organization_id) if organization_id else None
+        if organization is None:
+            return None, None
+
+        user = db.get(User, organization.created_by_id)
+        db.expunge(user)
+        return organization.id, user
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "EXPLAIN the queries behind the hot service paths and fail when one of them reads "
+            f"{', '.join(sorted(HOT_TABLES))} with a sequential scan. Sequential scans are disabled "
+            "while planning, so any that remain mean no index can serve the query, even on a small database."
+        )
+    )
+    parser.add_argument(
+        "--organization-id",
+        type=UUID,
+        default=None,
+        help="Organization to run the queries for (default: the one with the most vehicles)",
+    )
+    args = parser.parse_args()
+
+    organization_id, user = _resolve_organization(args.organization_id)
+    if organization_id is None:
+        raise SystemExit("No organization to check, seed the database first")
+
+    connection = engine.raw_connection()
+    failures = 0
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SET enable_seqscan = off")
+
+        for name, check in _checks(organization_id, user):
+            sequential, indexes = [], []
+            for statement, parameters in _capture(check):
+                for node in _explain(cursor, statement, parameters):
+                    if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in HOT_TABLES:
+                        sequential.append(node["Relation Name"])
+                    if "Index Name" in node:
+                        indexes.append(node["Index Name"])
+
+            if sequential:
+                failures += 1
+                print(f"FAIL  {name}: sequential scan on {', '.join(sorted(set(sequential)))}")
+            else:
+                print(f"ok    {name}: {', '.join(sorted(set(indexes))) or 'no index needed'}")
+    finally:
+        connection.rollback()
+        connection.close()
+
+    if failures:
+        print(f"{failures} hot path(s) fell back to a sequential scan")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+# Share of each action in the generated traffic, after the initial login
+ACTIONS = {
+    "vehicles.list": 35,
+    "vehicles.search": 15,
+    "vehicles.detail": 10,
+    "customers.list": 10,
+    "statistics.dashboard": 20,
+    "vehicles.mark_as_sold": 5,
+    "vehicles.mark_as_unsold": 5,
+}
+
+PERCENTILES = [50, 95, 99]
+
+# Vehicles per mark-as-unsold request when a user puts back its sales, the API's batch limit
+UNSOLD_BATCH_SIZE = 1000
+
+# Models the seeder generates, kept here so the load test does not need a database configuration
+SEARCH_TERMS = ["corolla", "golf", "focus", "octavia", "sportage", "model 3", "clio", "tucson"]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, name: str, client: httpx.AsyncClient, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        finally:
+            self.latencies[name].append(time.perf_counter() - started)
+
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        return response
+
+
+def _percentile(sorted_values: List[float], percentile: int) -> float:
+    # Nearest rank, so the reported latency is one that was actually observed
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def _virtual_user(tenant: dict, deadline: float, think_time: float, rng: random.Random, recorder: Recorder, base_url: str):
+    organization = f"/organizations/{tenant['organization_id']}"
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        response = await recorder.request(
+            "auth.login", client, "POST", "/auth/login", json={"email": tenant["email"], "password": tenant["password"]}
+        )
+        if response is None or response.status_code != 200:
+            return
+
+        # The access token cookie is Secure, which the cookie jar would not send to a plain http target
+        client.headers["Cookie"] = f"access_token={response.cookies['access_token']}"
+
+        vehicle_ids, sold_ids, customer_ids = [], [], []
+        response = await recorder.request("customers.list", client, "GET", f"{organization}/customers/")
+        if response is not None and response.status_code == 200:
+            customer_ids = [customer["id"] for customer in response.json()["items"]]
+
+        names, weights = list(ACTIONS), list(ACTIONS.values())
+        try:
+            while time.perf_counter() < deadline:
+                name = rng.choices(names, weights)[0]
+
+                if name == "vehicles.list":
+                    params = {"sale_status": rng.choice(["unsold", "sold"])} if rng.random() < 0.3 else None
+                    response = await recorder.request(name, client, "GET", f"{organization}/vehicles/", params=params)
+                    if response is not None and response.status_code == 200:
+                        vehicle_ids = [vehicle["id"] for vehicle in response.json()["items"] if vehicle["sold_to_id"] is None]
+                elif name == "vehicles.search":
+                    await recorder.request(name, client, "GET", f"{organization}/vehicles/", params={"search": rng.choice(SEARCH_TERMS)})
+                elif name == "vehicles.detail" and vehicle_ids:
+                    await recorder.request(name, client, "GET", f"{organization}/vehicles/{rng.choice(vehicle_ids)}")
+                elif name == "customers.list":
+                    await recorder.request(name, client, "GET", f"{organization}/customers/")
+                elif name == "statistics.dashboard":
+                    await recorder.request(name, client, "GET", f"{organization}/statistics/dashboard")
+                elif name == "vehicles.mark_as_sold" and vehicle_ids and customer_ids:
+                    vehicle_id = vehicle_ids.pop(rng.randrange(len(vehicle_ids)))
+                    response = await recorder.request(
+                        name, client, "POST", f"{organization}/vehicles/{vehicle_id}/mark-as-sold",
+                        json={"sold_to_id": rng.choice(customer_ids)},
+                    )
+                    # A request that failed in flight may still have sold it, unselling an unsold vehicle is harmless
+                    if response is None or response.status_code == 200:
+                        sold_ids.append(vehicle_id)
+                elif name == "vehicles.mark_as_unsold" and sold_ids:
+                    # Only vehicles this user sold, the rest is unsold again when the user stops
+                    vehicle_id = sold_ids.pop()
+                    await recorder.request(name, client, "POST", f"{organization}/vehicles/{vehicle_id}/mark-as-unsold")
+
+                if think_time:
+                    await asyncio.sleep(rng.expovariate(1 / think_time))
+        finally:
+            # Put back whatever this user still holds sold, so the seeded sales stay as they were.
+            # Not recorded, it is cleanup rather than traffic.
+            for start in range(0, len(sold_ids), UNSOLD_BATCH_SIZE):
+                batch = sold_ids[start:start + UNSOLD_BATCH_SIZE]
+                try:
+                    response = await client.post(
+                        f"{organization}/vehicles/mark-as-unsold", json={"vehicle_ids": batch, "atomic": False}
+                    )
+                except httpx.HTTPError:
+                    response = None
+                if response is None or response.status_code != 200:
+                    print(f"Could not mark {len(batch)} vehicles of {organization} as unsold again")
+
+
+async def _run(tenants: List[dict], users: int, duration: float, think_time: float, seed: int, base_url: str) -> Recorder:
+    rng = random.Random(seed)
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    # Larger tenants get more of the users, as they get more of the traffic in production
+    weights = [max(tenant["vehicles"], 1) for tenant in tenants]
+    assigned = rng.choices(tenants, weights, k=users)
+
+    await asyncio.gather(
+        *[
+            _virtual_user(tenant, deadline, think_time, random.Random(f"{seed}-{index}"), recorder, base_url)
+            for index, tenant in enumerate(assigned)
+        ]
+    )
+    return recorder
+
+
+def _report(recorder: Recorder, duration: float) -> Dict[str, dict]:
+    report = {}
+    for name in sorted(recorder.latencies):
+        latencies = sorted(recorder.latencies[name])
+        report[name] = {
+            "requests": len(latencies),
+            "errors": recorder.errors[name],
+            "throughput_rps": round(len(latencies) / duration, 2),
+            **{f"p{percentile}_ms": round(_percentile(latencies, percentile) * 1000, 2) for percentile in PERCENTILES},
+        }
+    return report
+
+
+def _print_report(report: Dict[str, dict], previous: Dict[str, dict]):
+    print(f"{'endpoint':<26} {'requests':>9} {'errors':>7} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in report.items():
+        print(
+            f"{name:<26} {row['requests']:>9} {row['errors']:>7} {row['throughput_rps']:>8.2f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+        before = previous.get(name)
+        if before:
+            changes = [
+                f"{key} {(row[key] - before[key]) / before[key] * 100:+.0f}%"
+                for key in ["throughput_rps", "p50_ms", "p95_ms", "p99_ms"]
+                if before[key]
+            ]
+            print(f"{'':<26} vs previous: {', '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Drive mixed traffic against a running API with tenants from seed_tenants: login, listing and "
+            "searching vehicles, vehicle details, customer lists, dashboard polling and marking vehicles as sold. "
+            "Reports per endpoint throughput and p50/p95/p99 latency."
+        )
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API to load (default: http://localhost:8000)")
+    parser.add_argument("--manifest", default="tenants.json", help="Tenant manifest written by seed_tenants (default: tenants.json)")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users (default: 20)")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to generate traffic for (default: 60)")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.5,
+        help="Mean pause between a user's requests in seconds, 0 for none (default: 0.5)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the traffic mix (default: 1)")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--compare", help="Report of a previous run to show changes against")
+    args = parser.parse_args()
+
+    with open(args.manifest) as file:
+        tenants = json.load(file)["tenants"]
+
+    started = time.perf_counter()
+    recorder = asyncio.run(_run(tenants, args.users, args.duration, args.think_time, args.seed, args.base_url))
+    report = _report(recorder, time.perf_counter() - started)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+
+    _print_report(report, previous)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import json
+import time
+from datetime import date
+
+from app.database import SessionLocal
+from app.utilities.seed_utility import SEED_AS_OF, seed_tenants
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed organizations with a skewed size distribution, each owned by its own user, with COPY. "
+            "The same arguments always produce the same rows, organizations that exist already are kept. "
+            "Writes a manifest with the tenants' credentials for the load test."
+        )
+    )
+    parser.add_argument("--organizations", type=int, default=50, help="Number of organizations (default: 50)")
+    parser.add_argument("--vehicles", type=int, default=200000, help="Vehicles across all organizations (default: 200000)")
+    parser.add_argument("--customers", type=int, default=40000, help="Customers across all organizations (default: 40000)")
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=1.1,
+        help="Zipf exponent of the organization sizes, 0 gives equal sizes (default: 1.1)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the generated data (default: 1)")
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=SEED_AS_OF,
+        help=f"Day the seeded history ends on, YYYY-MM-DD (default: {SEED_AS_OF})",
+    )
+    parser.add_argument("--password", default="load-test-password", help="Password of every seeded user")
+    parser.add_argument("--manifest", default="tenants.json", help="Where to write the tenant manifest (default: tenants.json)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        tenants = seed_tenants(
+            db, args.seed, args.organizations, args.vehicles, args.customers, args.skew, args.password, args.as_of
+        )
+    finally:
+        db.close()
+
+    with open(args.manifest, "w") as file:
+        json.dump({"seed": args.seed, "as_of": args.as_of.isoformat(), "tenants": tenants}, file, indent=2)
+
+    largest = tenants[0]
+    print(
+        f"Seeded {len(tenants)} organizations in {time.perf_counter() - started:.1f}s, "
+        f"the largest with {largest['vehicles']} vehicles and {largest['customers']} customers"
+    )
+    print(f"Manifest written to {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
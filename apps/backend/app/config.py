@@ -1,12 +1,67 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 
 load_dotenv()
 
 
+def get_bool(name: str, default: bool = False) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
 class Config:
     DATABASE_URL = os.getenv("DATABASE_URL")
     SECRET_KEY = os.getenv("SECRET_KEY")
 
+    # Serve requests through an async engine/session instead of the threadpool
+    DATABASE_ASYNC = get_bool("DATABASE_ASYNC")
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+        make_url(DATABASE_URL).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+        if DATABASE_URL
+        else None
+    )
+
+    # Connection pool, shared by the sync and async engines
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+    DB_POOL_PRE_PING = get_bool("DB_POOL_PRE_PING")
+    DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "0"))
+
+    # Resolved users are cached per access token to skip the users lookup
+    AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "60"))
+    AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+
+    # Granted (user, organization) access decisions
+    ORGANIZATION_ACCESS_CACHE_TTL = float(os.getenv("ORGANIZATION_ACCESS_CACHE_TTL", "300"))
+    ORGANIZATION_ACCESS_CACHE_SIZE = int(os.getenv("ORGANIZATION_ACCESS_CACHE_SIZE", "10000"))
+
+    # bcrypt runs in a dedicated process pool with a bounded number of pending calls
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+
+    # Computed dashboards are served for DASHBOARD_CACHE_TTL seconds, then for up to
+    # DASHBOARD_CACHE_STALE_TTL more while being recomputed in the background
+    DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "30"))
+    DASHBOARD_CACHE_STALE_TTL = float(os.getenv("DASHBOARD_CACHE_STALE_TTL", "300"))
+    DASHBOARD_CACHE_SIZE = int(os.getenv("DASHBOARD_CACHE_SIZE", "1000"))
+
+    # Day boundaries of the daily statistics rollup
+    STATISTICS_TIMEZONE = os.getenv("STATISTICS_TIMEZONE", "UTC")
+
+    # Responses of at least COMPRESSION_MINIMUM_SIZE bytes, and all streamed ones, are compressed
+    # with the client's preferred encoding. Levels are capped to what each codec supports
+    COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_LEVEL = int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4"))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+    ADMIN_EMAILS = [
+        email.strip().lower()
+        for email in os.getenv("ADMIN_EMAILS", "").split(",")
+        if email.strip()
+    ]
+
 
 config = Config()
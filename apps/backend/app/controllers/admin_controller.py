@@ -0,0 +1,64 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+from fastapi_utils.cbv import cbv
+
+from app.models.admin_model import CacheStatistics, CompressionStatistics, PasswordHasherStatistics, PoolStatistics
+from app.schemas import User
+from app.services.admin_service import AdminService, get_admin_service
+from app.utilities.auth_utility import get_admin_user
+
+router = APIRouter(prefix="/admin")
+
+
+@cbv(router)
+class AdminController:
+    admin_service: AdminService = Depends(get_admin_service)
+
+    @router.get(
+        "/pool",
+        status_code=200,
+        response_model=List[PoolStatistics],
+        description="Get live database connection pool statistics",
+    )
+    async def get_pool_statistics(
+        self,
+        current_user: User = Depends(get_admin_user),
+    ):
+        return self.admin_service.get_pool_statistics()
+
+    @router.get(
+        "/caches",
+        status_code=200,
+        response_model=List[CacheStatistics],
+        description="Get hit/miss statistics for the in-process caches",
+    )
+    async def get_cache_statistics(
+        self,
+        current_user: User = Depends(get_admin_user),
+    ):
+        return self.admin_service.get_cache_statistics()
+
+    @router.get(
+        "/password-hasher",
+        status_code=200,
+        response_model=PasswordHasherStatistics,
+        description="Get password hashing worker pool statistics",
+    )
+    async def get_password_hasher_statistics(
+        self,
+        current_user: User = Depends(get_admin_user),
+    ):
+        return self.admin_service.get_password_hasher_statistics()
+
+    @router.get(
+        "/compression",
+        status_code=200,
+        response_model=CompressionStatistics,
+        description="Get response compression cost and ratio per content encoding",
+    )
+    async def get_compression_statistics(
+        self,
+        current_user: User = Depends(get_admin_user),
+    ):
+        return self.admin_service.get_compression_statistics()
@@ -1,23 +1,24 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi_utils.cbv import cbv
-from sqlalchemy.orm import Session
 
 from app.models.brand_model import BrandCreate, BrandResponse
+from app.models.pagination_model import CursorPage, CursorParams
 from app.schemas import User, Brand
-from app.database import get_db
-from app.services.brands_service import BrandService, get_brand_service
+from app.services.async_service import AsyncService
+from app.services.brands_service import get_brand_service
 from app.utilities.auth_utility import get_current_user
+from app.utilities.etag_utility import make_etag
+from app.utilities.response_utility import conditional_json_response
 
 router = APIRouter(prefix="/brands")
 
 
 @cbv(router)
 class BrandsController:
-    db: Session = Depends(get_db)
-    brand_service: BrandService = Depends(get_brand_service)
+    brand_service: AsyncService = Depends(get_brand_service)
 
     @router.post(
         "/",
@@ -25,23 +26,30 @@ class BrandsController:
         response_model=BrandResponse,
         description="Create a new brand",
     )
-    def create_brand(
+    async def create_brand(
         self,
         form_data: BrandCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.brand_service.create(form_data, current_user)
+        return await self.brand_service.create(form_data, current_user)
 
     @router.get(
         "/",
         status_code=200,
-        response_model=List[BrandResponse],
+        response_model=CursorPage[BrandResponse],
         description="Get a list of brands",
     )
-    def get_brands(
+    async def get_brands(
         self,
+        request: Request,
+        page_params: CursorParams = Depends(),
     ):
-        return self.brand_service.get_all()
+        version = await self.brand_service.get_list_version()
+        return await conditional_json_response(
+            request,
+            make_etag(request, version),
+            lambda: self.brand_service.get_all(page_params),
+        )
 
     @router.get(
         "/{brand_id}",
@@ -49,12 +57,18 @@ class BrandsController:
         response_model=BrandResponse,
         description="Get a brand by its ID",
     )
-    def get_brand(
+    async def get_brand(
         self,
         brand_id: UUID,
+        request: Request,
         current_user: User = Depends(get_current_user),
     ):
-        return self.brand_service.get_one(brand_id, current_user)
+        async def load():
+            brand = await self.brand_service.get_one(brand_id, current_user)
+            return BrandResponse.model_validate(brand, from_attributes=True)
+
+        version = await self.brand_service.get_version(brand_id, current_user)
+        return await conditional_json_response(request, make_etag(request, version), load)
 
     @router.put(
         "/{brand_id}",
@@ -62,23 +76,23 @@ class BrandsController:
         response_model=BrandResponse,
         description="Update an existing brand",
     )
-    def update_brand(
+    async def update_brand(
         self,
         brand_id: UUID,
         form_data: BrandCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.brand_service.update(brand_id, form_data, current_user)
+        return await self.brand_service.update(brand_id, form_data, current_user)
 
     @router.delete(
         "/{brand_id}",
         status_code=204,
         description="Delete a brand",
     )
-    def delete_brand(
+    async def delete_brand(
         self,
         brand_id: UUID,
         current_user: User = Depends(get_current_user),
     ):
-        self.brand_service.delete(brand_id, current_user)
+        await self.brand_service.delete(brand_id, current_user)
         return
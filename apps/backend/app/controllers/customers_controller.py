@@ -1,23 +1,29 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
-from sqlalchemy.orm import Session
 
 from app.models.customer_model import CustomerCreate, CustomerFilter, CustomerResponse
+from app.models.export_model import ExportFormat
+from app.models.import_model import ImportResult
+from app.models.pagination_model import CursorPage, CursorParams
 from app.schemas import User
-from app.database import get_db
 from app.utilities.auth_utility import get_current_user
-from app.services.customers_service import CustomerService, get_customer_service
+from app.services.async_service import AsyncService
+from app.services.customers_service import CUSTOMER_EXPORT_COLUMNS, CUSTOMER_IMPORT_CHUNK_SIZE, get_customer_service
+from app.utilities.export_utility import export_response
+from app.utilities.etag_utility import make_etag
+from app.utilities.response_utility import conditional_json_response
+from app.utilities.import_utility import IMPORT_REQUEST_BODY, read_import_rows, run_import
 
 router = APIRouter(prefix="/organizations/{organization_id}/customers")
 
 
 @cbv(router)
 class CustomersController:
-    db: Session = Depends(get_db)
-    customer_service: CustomerService = Depends(get_customer_service)
+    customer_service: AsyncService = Depends(get_customer_service)
 
     @router.post(
         "/",
@@ -25,28 +31,78 @@ class CustomersController:
         response_model=CustomerResponse,
         description="Create a new customer for an organization",
     )
-    def create_customer(
+    async def create_customer(
         self,
         organization_id: UUID,
         form_data: CustomerCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.customer_service.create(organization_id, form_data, current_user)
+        return await self.customer_service.create(organization_id, form_data, current_user)
+
+    @router.post(
+        "/import",
+        status_code=200,
+        response_model=ImportResult,
+        description=(
+            "Bulk create customers from a CSV (with a header row) or NDJSON body. "
+            "Emails are deduplicated within the upload, customers whose email already exists are updated."
+        ),
+        openapi_extra=IMPORT_REQUEST_BODY,
+    )
+    async def import_customers(
+        self,
+        organization_id: UUID,
+        request: Request,
+        current_user: User = Depends(get_current_user),
+    ):
+        await self.customer_service.prepare_import(organization_id, current_user)
+        seen_emails = set()
+
+        return await run_import(
+            read_import_rows(request),
+            lambda rows: self.customer_service.import_rows(organization_id, current_user, seen_emails, rows),
+            chunk_size=CUSTOMER_IMPORT_CHUNK_SIZE,
+        )
 
     @router.get(
         "/",
         status_code=200,
-        response_model=List[CustomerResponse],
+        response_model=CursorPage[CustomerResponse],
         description="Get a list of customers for an organization",
     )
-    def get_customers(
+    async def get_customers(
+        self,
+        organization_id: UUID,
+        request: Request,
+        search: str = Query(None, description="Search term for filtering customers"),
+        page_params: CursorParams = Depends(),
+        fields: str = Query(None, description="Comma separated response fields to return, all fields when omitted"),
+        current_user: User = Depends(get_current_user),
+    ):
+        filter = CustomerFilter(search=search) if search else None
+        version = await self.customer_service.get_list_version(organization_id, current_user)
+        return await conditional_json_response(
+            request,
+            make_etag(request, current_user.id, version),
+            lambda: self.customer_service.get_all(organization_id, current_user, page_params, filter, fields),
+        )
+
+    @router.get(
+        "/export",
+        status_code=200,
+        response_class=StreamingResponse,
+        description="Stream every customer matching the search as CSV or NDJSON",
+    )
+    async def export_customers(
         self,
         organization_id: UUID,
         search: str = Query(None, description="Search term for filtering customers"),
+        format: ExportFormat = Query(default=ExportFormat.CSV, description="Export file format"),
         current_user: User = Depends(get_current_user),
     ):
         filter = CustomerFilter(search=search) if search else None
-        return self.customer_service.get_all(organization_id, current_user, filter)
+        statement = await self.customer_service.get_export_statement(organization_id, current_user, filter)
+        return export_response(statement, CUSTOMER_EXPORT_COLUMNS, format, "customers")
 
     @router.get(
         "/{customer_id}",
@@ -54,13 +110,20 @@ class CustomersController:
         response_model=CustomerResponse,
         description="Get a customer by its ID",
     )
-    def get_customer(
+    async def get_customer(
         self,
         organization_id: UUID,
         customer_id: UUID,
+        request: Request,
+        fields: str = Query(None, description="Comma separated response fields to return, all fields when omitted"),
         current_user: User = Depends(get_current_user),
     ):
-        return self.customer_service.get_one(customer_id, organization_id, current_user)
+        version = await self.customer_service.get_version(customer_id, organization_id, current_user)
+        return await conditional_json_response(
+            request,
+            make_etag(request, version),
+            lambda: self.customer_service.get_one(customer_id, organization_id, current_user, fields),
+        )
 
     @router.put(
         "/{customer_id}",
@@ -68,25 +131,25 @@ class CustomersController:
         response_model=CustomerResponse,
         description="Update an existing customer",
     )
-    def update_customer(
+    async def update_customer(
         self,
         organization_id: UUID,
         customer_id: UUID,
         form_data: CustomerCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.customer_service.update(customer_id, organization_id, form_data, current_user)
+        return await self.customer_service.update(customer_id, organization_id, form_data, current_user)
 
     @router.delete(
         "/{customer_id}",
         status_code=204,
         description="Delete a customer",
     )
-    def delete_customer(
+    async def delete_customer(
         self,
         organization_id: UUID,
         customer_id: UUID,
         current_user: User = Depends(get_current_user),
     ):
-        self.customer_service.delete(customer_id, organization_id, current_user)
+        await self.customer_service.delete(customer_id, organization_id, current_user)
         return
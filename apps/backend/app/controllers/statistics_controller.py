@@ -1,19 +1,21 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi_utils.cbv import cbv
 
-from app.models.statistics_model import DashboardStatistics
+from app.models.statistics_model import DashboardStatistics, StatisticsParams
 from app.schemas import User
 from app.utilities.auth_utility import get_current_user
-from app.services.statistics_service import StatisticsService, get_statistics_service
+from app.services.async_service import AsyncService
+from app.services.statistics_service import get_statistics_service
+from app.utilities.response_utility import threadpool_json_response
 
 router = APIRouter(prefix="/organizations/{organization_id}/statistics")
 
 
 @cbv(router)
 class StatisticsController:
-    statistics_service: StatisticsService = Depends(get_statistics_service)
+    statistics_service: AsyncService = Depends(get_statistics_service)
 
     @router.get(
         "/dashboard",
@@ -21,9 +23,11 @@ class StatisticsController:
         response_model=DashboardStatistics,
         description="Get dashboard statistics for an organization"
     )
-    def get_dashboard_statistics(
+    async def get_dashboard_statistics(
         self,
         organization_id: UUID,
+        params: StatisticsParams = Query(),
         current_user: User = Depends(get_current_user),
     ):
-        return self.statistics_service.get_dashboard_statistics(organization_id) 
\ No newline at end of file
+        statistics = await self.statistics_service.get_dashboard_statistics(organization_id, current_user, params)
+        return await threadpool_json_response(statistics)
\ No newline at end of file
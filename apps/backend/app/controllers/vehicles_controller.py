@@ -1,110 +1,208 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
-from fastapi_pagination import Page
 
-from app.models.vehicle_model import VehicleCreate, VehicleResponse, VehicleFilter, VehicleMarkAsSold
+from app.models.export_model import ExportFormat
+from app.models.import_model import ImportResult
+from app.models.pagination_model import CursorPage, CursorParams
+from app.models.vehicle_model import (
+    VehicleBatchMarkAsSold,
+    VehicleBatchMarkAsUnsold,
+    VehicleBatchResult,
+    VehicleCreate,
+    VehicleFilter,
+    VehicleMarkAsSold,
+    VehicleResponse,
+)
 from app.schemas import User
 from app.utilities.auth_utility import get_current_user
-from app.services.vehicles_service import VehiclesService, get_vehicles_service
+from app.services.async_service import AsyncService
+from app.services.vehicles_service import VEHICLE_EXPORT_COLUMNS, get_vehicles_service
+from app.utilities.export_utility import export_response
+from app.utilities.etag_utility import make_etag
+from app.utilities.response_utility import conditional_json_response
+from app.utilities.import_utility import IMPORT_REQUEST_BODY, read_import_rows, run_import
 
 router = APIRouter(prefix="/organizations/{organization_id}/vehicles")
 
 
 @cbv(router)
 class VehiclesController:
-    vehicles_service: VehiclesService = Depends(get_vehicles_service)
+    vehicles_service: AsyncService = Depends(get_vehicles_service)
 
     @router.post(
         "/",
         status_code=201,
         response_model=VehicleResponse,
     )
-    def create_vehicle(
+    async def create_vehicle(
         self,
         organization_id: UUID,
         form_data: VehicleCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.create(form_data, current_user, organization_id)
+        return await self.vehicles_service.create(form_data, current_user, organization_id)
+
+    @router.post(
+        "/import",
+        status_code=200,
+        response_model=ImportResult,
+        description=(
+            "Bulk create vehicles from a CSV (with a header row) or NDJSON body. "
+            "Rows are validated and stored in chunks, rejected rows are reported without aborting the import."
+        ),
+        openapi_extra=IMPORT_REQUEST_BODY,
+    )
+    async def import_vehicles(
+        self,
+        organization_id: UUID,
+        request: Request,
+        current_user: User = Depends(get_current_user),
+    ):
+        brand_ids = await self.vehicles_service.prepare_import(organization_id, current_user)
+
+        return await run_import(
+            read_import_rows(request),
+            lambda rows: self.vehicles_service.import_rows(organization_id, current_user, brand_ids, rows),
+        )
 
     @router.get(
         "/",
         status_code=200,
-        response_model=Page[VehicleResponse],
+        response_model=CursorPage[VehicleResponse],
+    )
+    async def get_vehicles(
+        self,
+        organization_id: UUID,
+        request: Request,
+        filter_params: VehicleFilter = Depends(),
+        page_params: CursorParams = Depends(),
+        fields: str = Query(None, description="Comma separated response fields to return, all fields when omitted"),
+        current_user: User = Depends(get_current_user),
+    ):
+        version = await self.vehicles_service.get_list_version(current_user, organization_id)
+        return await conditional_json_response(
+            request,
+            make_etag(request, current_user.id, version),
+            lambda: self.vehicles_service.get_all(current_user, organization_id, filter_params, page_params, fields),
+        )
+
+    @router.get(
+        "/export",
+        status_code=200,
+        response_class=StreamingResponse,
+        description="Stream every vehicle matching the filters as CSV or NDJSON",
     )
-    def get_vehicles(
+    async def export_vehicles(
         self,
         organization_id: UUID,
         filter_params: VehicleFilter = Depends(),
+        format: ExportFormat = Query(default=ExportFormat.CSV, description="Export file format"),
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.get_all(current_user, organization_id, filter_params)
+        statement = await self.vehicles_service.get_export_statement(current_user, organization_id, filter_params)
+        return export_response(statement, VEHICLE_EXPORT_COLUMNS, format, "vehicles")
 
     @router.get(
         "/{vehicle_id}",
         status_code=200,
         response_model=VehicleResponse,
     )
-    def get_vehicle(
+    async def get_vehicle(
         self,
         organization_id: UUID,
         vehicle_id: UUID,
+        request: Request,
+        fields: str = Query(None, description="Comma separated response fields to return, all fields when omitted"),
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.get_one(vehicle_id, organization_id, current_user)
+        version = await self.vehicles_service.get_version(vehicle_id, organization_id, current_user)
+        return await conditional_json_response(
+            request,
+            make_etag(request, version),
+            lambda: self.vehicles_service.get_one(vehicle_id, organization_id, current_user, fields),
+        )
 
     @router.put(
         "/{vehicle_id}",
         status_code=200,
         response_model=VehicleResponse,
     )
-    def update_vehicle(
+    async def update_vehicle(
         self,
         organization_id: UUID,
         vehicle_id: UUID,
         form_data: VehicleCreate,
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.update(vehicle_id, form_data, current_user, organization_id)
+        return await self.vehicles_service.update(vehicle_id, form_data, current_user, organization_id)
         
+    @router.post(
+        "/mark-as-sold",
+        status_code=200,
+        response_model=VehicleBatchResult,
+        description="Mark several vehicles as sold to one customer in a single update",
+    )
+    async def mark_vehicles_as_sold(
+        self,
+        organization_id: UUID,
+        form_data: VehicleBatchMarkAsSold,
+        current_user: User = Depends(get_current_user),
+    ):
+        return await self.vehicles_service.mark_many_as_sold(form_data, current_user, organization_id)
+
+    @router.post(
+        "/mark-as-unsold",
+        status_code=200,
+        response_model=VehicleBatchResult,
+        description="Mark several vehicles as unsold in a single update",
+    )
+    async def mark_vehicles_as_unsold(
+        self,
+        organization_id: UUID,
+        form_data: VehicleBatchMarkAsUnsold,
+        current_user: User = Depends(get_current_user),
+    ):
+        return await self.vehicles_service.mark_many_as_unsold(form_data, current_user, organization_id)
+
     @router.post(
         "/{vehicle_id}/mark-as-sold",
         status_code=200,
         response_model=VehicleResponse,
     )
-    def mark_vehicle_as_sold(
+    async def mark_vehicle_as_sold(
         self,
         organization_id: UUID,
         vehicle_id: UUID,
         form_data: VehicleMarkAsSold,
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.mark_as_sold(vehicle_id, form_data, current_user, organization_id)
+        return await self.vehicles_service.mark_as_sold(vehicle_id, form_data, current_user, organization_id)
         
     @router.post(
         "/{vehicle_id}/mark-as-unsold",
         status_code=200,
         response_model=VehicleResponse,
     )
-    def mark_vehicle_as_unsold(
+    async def mark_vehicle_as_unsold(
         self,
         organization_id: UUID,
         vehicle_id: UUID,
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.mark_as_unsold(vehicle_id, current_user, organization_id)
+        return await self.vehicles_service.mark_as_unsold(vehicle_id, current_user, organization_id)
 
     @router.delete(
         "/{vehicle_id}",
         status_code=204,
     )
-    def delete_vehicle(
+    async def delete_vehicle(
         self,
         organization_id: UUID,
         vehicle_id: UUID,
         current_user: User = Depends(get_current_user),
     ):
-        return self.vehicles_service.delete(vehicle_id, organization_id, current_user) 
\ No newline at end of file
+        return await self.vehicles_service.delete(vehicle_id, organization_id, current_user) 
\ No newline at end of file
@@ -1,16 +1,38 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
 from app.config import config
+from app.utilities.pool_utility import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 
 load_dotenv()
 
-engine = create_engine(config.DATABASE_URL)
+pool_options = {
+    "pool_size": config.DB_POOL_SIZE,
+    "max_overflow": config.DB_MAX_OVERFLOW,
+    "pool_timeout": config.DB_POOL_TIMEOUT,
+    "pool_recycle": config.DB_POOL_RECYCLE,
+    "pool_pre_ping": config.DB_POOL_PRE_PING,
+}
+
+engine = create_engine(config.DATABASE_URL, poolclass=InstrumentedQueuePool, **pool_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+
+if config.DATABASE_ASYNC:
+    async_engine = create_async_engine(
+        config.ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncAdaptedQueuePool, **pool_options
+    )
+    # Objects are read after commit by the response serializer, outside of the session greenlet
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
 Base = declarative_base()
 
 def get_db():
@@ -18,4 +40,32 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_session = get_async_db if config.DATABASE_ASYNC else get_db
+
+
+async def prewarm_pool():
+    count = min(config.DB_POOL_PREWARM, config.DB_POOL_SIZE)
+
+    if config.DATABASE_ASYNC:
+        connections = [await async_engine.connect() for _ in range(count)]
+        for connection in connections:
+            await connection.close()
+    else:
+        connections = [engine.connect() for _ in range(count)]
+        for connection in connections:
+            connection.close()
+
+
+def get_pool_engines():
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    return engines
@@ -1,16 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_pagination import add_pagination
+from app.controllers import admin_controller
 from app.controllers import auth_controller
 from app.controllers import vehicles_controller
 from app.controllers import organizations_controller
 from app.controllers import brands_controller
 from app.controllers import customers_controller
 from app.controllers import statistics_controller
+from app.config import config
+from app.database import prewarm_pool
+from app.services.statistics_service import dashboard_refresher
+from app.utilities.compression_utility import CompressionMiddleware
+from app.utilities.password_utility import password_hasher, pending_capacity
 from scalar_fastapi import get_scalar_api_reference
 import os
 
-app = FastAPI(title="DealerHub API", version="1.0.0", docs_url=None)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await prewarm_pool()
+    password_hasher.limit_pending(pending_capacity())
+    yield
+    password_hasher.shutdown()
+    dashboard_refresher.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="DealerHub API", version="1.0.0", docs_url=None, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,14 +37,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    levels={
+        "zstd": config.COMPRESSION_ZSTD_LEVEL,
+        "br": config.COMPRESSION_BROTLI_LEVEL,
+        "gzip": config.COMPRESSION_GZIP_LEVEL,
+    },
+)
+
 app.include_router(auth_controller.router, tags=["Auth"])
 app.include_router(vehicles_controller.router, tags=["Vehicles"])
 app.include_router(organizations_controller.router, tags=["Organizations"])
 app.include_router(brands_controller.router, tags=["Brands"])
 app.include_router(customers_controller.router, tags=["Customers"])
 app.include_router(statistics_controller.router, tags=["Statistics"])
-
-add_pagination(app)
+app.include_router(admin_controller.router, tags=["Admin"])
 
 @app.get("/docs", include_in_schema=False)
 async def scalar_html():
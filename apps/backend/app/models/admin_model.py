@@ -0,0 +1,70 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatistics(BaseModel):
+    engine: str = Field(description="Engine the pool belongs to", examples=["sync"])
+    size: int = Field(description="Configured number of persistent connections")
+    max_overflow: int = Field(description="Configured number of overflow connections")
+    checked_in: int = Field(description="Idle connections in the pool")
+    checked_out: int = Field(description="Connections currently checked out")
+    overflow: int = Field(description="Overflow connections currently open")
+    checkouts: int = Field(description="Successful checkouts since startup")
+    checkout_timeouts: int = Field(description="Checkouts that timed out waiting for a connection")
+    wait_time_avg_ms: float = Field(description="Average time spent waiting for a connection")
+    wait_time_max_ms: float = Field(description="Longest time spent waiting for a connection")
+
+    class Config:
+        json_schema_extra = {"description": "Live connection pool statistics"}
+
+
+class CacheStatistics(BaseModel):
+    name: str = Field(description="Name of the cache", examples=["principals"])
+    size: int = Field(description="Number of cached entries")
+    max_size: int = Field(description="Maximum number of cached entries")
+    ttl_seconds: float = Field(description="Default entry lifetime")
+    hits: int = Field(description="Lookups served from the cache")
+    misses: int = Field(description="Lookups that missed or found an expired entry")
+    evictions: int = Field(description="Entries evicted to stay within max_size")
+    stale_hits: int = Field(description="Hits served from an entry past its ttl while it was being refreshed")
+    hit_rate: float = Field(description="Share of lookups served from the cache")
+
+    class Config:
+        json_schema_extra = {"description": "In-process cache statistics"}
+
+
+class PasswordHasherStatistics(BaseModel):
+    workers: int = Field(description="Worker processes hashing passwords")
+    max_pending: int = Field(description="Maximum admitted operations before new ones are rejected")
+    in_flight: int = Field(description="Operations currently running or queued")
+    queued: int = Field(description="Operations waiting for a free worker")
+    completed: int = Field(description="Operations finished since startup")
+    rejected: int = Field(description="Operations rejected by admission control")
+    duration_avg_ms: float = Field(description="Average time per operation, including queueing")
+
+    class Config:
+        json_schema_extra = {"description": "Password hashing worker pool statistics"}
+
+
+class EncodingStatistics(BaseModel):
+    encoding: str = Field(description="Content encoding", examples=["br"])
+    level: int = Field(description="Compression level in use")
+    responses: int = Field(description="Responses compressed with this encoding")
+    streamed_responses: int = Field(description="Of those, responses compressed chunk by chunk")
+    bytes_in: int = Field(description="Uncompressed bytes")
+    bytes_out: int = Field(description="Compressed bytes sent")
+    ratio: float = Field(description="Uncompressed bytes per compressed byte")
+    duration_total_ms: float = Field(description="Time spent compressing")
+    duration_per_mb_ms: float = Field(description="Average time spent compressing one uncompressed megabyte")
+
+    class Config:
+        json_schema_extra = {"description": "Compression statistics for one content encoding"}
+
+
+class CompressionStatistics(BaseModel):
+    skipped: int = Field(description="Responses sent uncompressed: too small, not compressible or no acceptable encoding")
+    encodings: List[EncodingStatistics] = Field(description="Statistics per content encoding")
+
+    class Config:
+        json_schema_extra = {"description": "Response compression statistics"}
@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class ImportRowError(BaseModel):
+    row: int = Field(description="1-based data row (CSV header and blank lines excluded)", examples=[42])
+    detail: str = Field(description="Why the row was rejected", examples=["vin_number: Field required"])
+
+
+class ImportResult(BaseModel):
+    received: int = Field(description="Number of data rows read from the request body")
+    imported: int = Field(description="Number of rows stored as new records")
+    updated: int = Field(default=0, description="Number of rows that updated an existing record")
+    failed: int = Field(description="Number of rejected rows")
+    errors: List[ImportRowError] = Field(description="Rejected rows, capped at the first 1000")
+    duration_seconds: float = Field(description="Time spent reading, validating and storing the rows")
+    rows_per_second: float = Field(description="Received rows per second")
+
+    class Config:
+        json_schema_extra = {"description": "Outcome of a bulk import"}
@@ -0,0 +1,40 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 100
+
+
+class CursorParams(BaseModel):
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor returned as next_cursor by the previous page",
+    )
+    size: int = Field(
+        default=50,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Number of items per page",
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Whether to compute the total number of matching items",
+    )
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T] = Field(description="Items on this page")
+    size: int = Field(description="Requested page size", examples=[50])
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page, null when this is the last page",
+    )
+    total: Optional[int] = Field(
+        default=None,
+        description="Total number of matching items, only set when include_total is requested",
+    )
+
+    class Config:
+        json_schema_extra = {"description": "Cursor paginated list of items"}
@@ -1,6 +1,55 @@
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 from datetime import date
+from enum import Enum
+
+
+class StatisticsGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class StatisticsParams(BaseModel):
+    from_date: Optional[date] = Field(
+        default=None,
+        alias="from",
+        description="First day of the time series, defaults to 6 days before to",
+        examples=["2025-01-01"],
+    )
+    to_date: Optional[date] = Field(
+        default=None,
+        alias="to",
+        description="Last day of the time series, defaults to today",
+        examples=["2025-12-31"],
+    )
+    granularity: StatisticsGranularity = Field(
+        default=StatisticsGranularity.DAY,
+        description="Bucket size of the time series, buckets are keyed by their first day",
+    )
+    timezone: Optional[str] = Field(
+        default=None,
+        description="IANA time zone whose calendar days are used, defaults to the server's statistics time zone",
+        examples=["Europe/Warsaw"],
+    )
+    compare_previous: bool = Field(
+        default=False,
+        description="Also return the series for the equally long period right before from",
+    )
+
+    class Config:
+        populate_by_name = True
+        json_schema_extra = {"description": "Time range and bucketing of the statistics time series"}
+
+
+class DaysToSellStatistics(BaseModel):
+    sold_count: int = Field(description="Number of sold vehicles the figures are based on")
+    avg_days_to_sell: Optional[float] = Field(description="Average days from listing to sale", default=None)
+    median_days_to_sell: Optional[float] = Field(description="Median days from listing to sale", default=None)
+    p90_days_to_sell: Optional[float] = Field(description="90th percentile of days from listing to sale", default=None)
+
+    class Config:
+        schema_extra = {"description": "Time to sell of sold vehicles"}
 
 class VehicleStatistics(BaseModel):
     total_count: int = Field(description="Total number of vehicles")
@@ -9,6 +58,16 @@ class VehicleStatistics(BaseModel):
     brand_distribution: Dict[str, int] = Field(description="Count of vehicles by brand")
     sales_by_month: Dict[str, int] = Field(description="Number of vehicles sold by month")
     avg_days_to_sell: Optional[float] = Field(description="Average days from listing to sale", default=None)
+    median_days_to_sell: Optional[float] = Field(description="Median days from listing to sale", default=None)
+    p90_days_to_sell: Optional[float] = Field(description="90th percentile of days from listing to sale", default=None)
+    days_to_sell_by_brand: Dict[str, DaysToSellStatistics] = Field(
+        description="Time to sell by brand, for brands with sold vehicles",
+        default_factory=dict,
+    )
+    days_to_sell_by_fuel_type: Dict[str, DaysToSellStatistics] = Field(
+        description="Time to sell by fuel type, for fuel types with sold vehicles",
+        default_factory=dict,
+    )
 
     class Config:
         schema_extra = {"description": "Statistics about vehicles"}
@@ -20,11 +79,25 @@ class CustomerStatistics(BaseModel):
     class Config:
         schema_extra = {"description": "Statistics about customers"}
 
+class PeriodStatistics(BaseModel):
+    from_date: date = Field(description="First day of the period")
+    to_date: date = Field(description="Last day of the period")
+    sales_by_month: Dict[str, int] = Field(description="Number of vehicles sold per bucket")
+    customers_by_month: Dict[str, int] = Field(description="Number of new customers per bucket")
+    revenue_by_month: Dict[str, float] = Field(description="Revenue per bucket")
+
+    class Config:
+        schema_extra = {"description": "Time series of a single period"}
+
 class DashboardStatistics(BaseModel):
     vehicles: VehicleStatistics = Field(description="Vehicle statistics")
     customers: CustomerStatistics = Field(description="Customer statistics")
     total_revenue: float = Field(description="Total revenue from vehicle sales")
     revenue_by_month: Dict[str, float] = Field(description="Revenue by month")
+    previous_period: Optional[PeriodStatistics] = Field(
+        default=None,
+        description="Same series for the preceding period, only set when compare_previous is requested",
+    )
 
     class Config:
         schema_extra = {"description": "Combined statistics for dashboard"}
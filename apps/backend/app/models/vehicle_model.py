@@ -12,6 +12,14 @@ class FuelType(str, Enum):
     HYBRID = "hybrid"
 
 
+class VehicleSortField(str, Enum):
+    CREATED_AT = "created_at"
+    PRICE = "price"
+    KMS_DRIVEN = "kms_driven"
+    MODEL_YEAR = "model_year"
+    RELEVANCE = "relevance"
+
+
 class VehicleCreate(BaseModel):
     registration_number: str = Field(
         description="Vehicle's registration number",
@@ -183,4 +191,49 @@ class VehicleResponse(BaseModel):
 class VehicleFilter(BaseModel):
     search: Optional[str] = Field(default=None)
     vehicle_status: Optional[Literal["new", "used"]] = Field(default=None, description="Filter by vehicle status (new or used)")
-    sale_status: Optional[Literal["sold", "unsold"]] = Field(default=None, description="Filter by sale status (sold or unsold)") 
\ No newline at end of file
+    sale_status: Optional[Literal["sold", "unsold"]] = Field(default=None, description="Filter by sale status (sold or unsold)")
+    sort_by: Optional[VehicleSortField] = Field(default=None, description="Field to sort vehicles by, defaults to relevance when searching and created_at otherwise")
+    sort_order: Literal["asc", "desc"] = Field(default="desc", description="Sort direction") 
+
+# Upper bound on vehicle IDs accepted by the batch endpoints
+MAX_BATCH_SIZE = 1000
+
+
+class VehicleBatchMarkAsUnsold(BaseModel):
+    vehicle_ids: List[UUID4] = Field(
+        description="IDs of the vehicles to update",
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    )
+    atomic: bool = Field(
+        default=True,
+        description="Fail the whole batch when any vehicle is not found, otherwise update the rest and report the missing ones",
+    )
+
+    class Config:
+        json_schema_extra = {"description": "Schema for marking several vehicles as unsold at once"}
+
+
+class VehicleBatchMarkAsSold(VehicleBatchMarkAsUnsold):
+    sold_to_id: UUID4 = Field(
+        description="ID of the customer the vehicles are sold to"
+    )
+
+    class Config:
+        json_schema_extra = {"description": "Schema for marking several vehicles as sold to one customer at once"}
+
+
+class VehicleBatchError(BaseModel):
+    vehicle_id: UUID4 = Field(description="ID of the vehicle that was not updated")
+    detail: str = Field(description="Why the vehicle was not updated", examples=["Vehicle not found"])
+
+
+class VehicleBatchResult(BaseModel):
+    items: List[VehicleResponse] = Field(description="Updated vehicles")
+    failed: List[VehicleBatchError] = Field(
+        default_factory=list,
+        description="Vehicles that were not updated, only when atomic is false",
+    )
+
+    class Config:
+        json_schema_extra = {"description": "Outcome of a batch vehicle update"}
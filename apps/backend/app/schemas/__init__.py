@@ -3,5 +3,8 @@ from app.schemas.organization_schema import Organization
 from app.schemas.brand_schema import Brand
 from app.schemas.vehicle_schema import Vehicle
 from app.schemas.customer_schema import Customer
+from app.schemas.organization_daily_statistics_schema import OrganizationDailyStatistics
+from app.schemas.vehicle_deletion_schema import VehicleDeletion
+from app.schemas.data_version_schema import DataVersion
 
-__all__ = ["User", "Organization", "Brand", "Vehicle", "Customer"]
+__all__ = ["User", "Organization", "Brand", "Vehicle", "Customer", "OrganizationDailyStatistics", "VehicleDeletion", "DataVersion"]
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, UUID, String, DateTime, ForeignKey
+from sqlalchemy import Column, UUID, String, DateTime, ForeignKey, Computed, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,6 +8,49 @@ from app.database import Base
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (
+        Index(
+            "ix_customers_organization_id_email_normalized",
+            "organization_id",
+            "email_normalized",
+            postgresql_ops={"email_normalized": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_customers_organization_id_phone_normalized",
+            "organization_id",
+            "phone_normalized",
+            postgresql_ops={"phone_normalized": "text_pattern_ops"},
+        ),
+        # Substring search within one organization, organization_id is a btree_gin column of each index
+        Index(
+            "ix_customers_organization_id_name_search_trgm",
+            "organization_id",
+            "name_search",
+            postgresql_using="gin",
+            postgresql_ops={"name_search": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_customers_organization_id_email_normalized_trgm",
+            "organization_id",
+            "email_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"email_normalized": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_customers_organization_id_phone_normalized_trgm",
+            "organization_id",
+            "phone_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"phone_normalized": "gin_trgm_ops"},
+        ),
+        # Default list order and new customers in a time range
+        Index(
+            "ix_customers_organization_id_created_at",
+            "organization_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     first_name = Column(String, nullable=False)
@@ -17,6 +60,14 @@ class Customer(Base):
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     organization = relationship("Organization", foreign_keys=[organization_id])
 
+    # Search keys, kept in sync with app.utilities.search_utility
+    email_normalized = Column(String, Computed("lower(email)", persisted=True))
+    phone_normalized = Column(
+        String,
+        Computed("regexp_replace(regexp_replace(phone, '[^0-9]', '', 'g'), '^00', '')", persisted=True),
+    )
+    name_search = Column(String, Computed("lower(first_name || ' ' || last_name)", persisted=True))
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_by = relationship("User", foreign_keys=[created_by_id])
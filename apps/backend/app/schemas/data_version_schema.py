@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger
+from app.database import Base
+
+
+class DataVersion(Base):
+    # Change counters for data that no organization owns (e.g. brands), the counterpart
+    # of organizations.data_version
+    __tablename__ = "data_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
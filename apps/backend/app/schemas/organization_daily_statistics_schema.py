@@ -0,0 +1,16 @@
+from sqlalchemy import Column, UUID, Integer, Float, Date, ForeignKey
+from app.database import Base
+
+
+class OrganizationDailyStatistics(Base):
+    __tablename__ = "organization_daily_statistics"
+
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    # Calendar day in config.STATISTICS_TIMEZONE
+    day = Column(Date, primary_key=True)
+
+    sales_count = Column(Integer, nullable=False, default=0, server_default="0")
+    revenue = Column(Float, nullable=False, default=0.0, server_default="0")
+    new_customers = Column(Integer, nullable=False, default=0, server_default="0")
+    listings = Column(Integer, nullable=False, default=0, server_default="0")
+    delistings = Column(Integer, nullable=False, default=0, server_default="0")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, UUID, String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Column, UUID, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -12,6 +12,8 @@ class Organization(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     name = Column(String, index=True, nullable=False)
     email = Column(String, nullable=False)
+    # Incremented by every vehicle and customer write, list ETags are derived from it
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
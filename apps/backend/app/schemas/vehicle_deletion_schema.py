@@ -0,0 +1,16 @@
+from sqlalchemy import Column, UUID, DateTime, ForeignKey, Index
+from app.database import Base
+
+
+class VehicleDeletion(Base):
+    # Deleted vehicles, so a rollup rebuild still counts their listing and their delisting
+    __tablename__ = "vehicle_deletions"
+    __table_args__ = (
+        Index("ix_vehicle_deletions_organization_id", "organization_id"),
+    )
+
+    vehicle_id = Column(UUID(as_uuid=True), primary_key=True)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    # created_at of the vehicle
+    listed_at = Column(DateTime(timezone=True), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,14 +1,75 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import Column, UUID, String, Boolean, Integer, Float, Date, DateTime, ForeignKey
+from sqlalchemy import Column, UUID, String, Boolean, Integer, Float, Date, DateTime, ForeignKey, Computed, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.database import Base
 
 
 class Vehicle(Base):
     __tablename__ = "vehicles"
+    __table_args__ = (
+        # Search within one organization, organization_id is a btree_gin column of the same index
+        Index(
+            "ix_vehicles_organization_id_search_text_trgm",
+            "organization_id",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # Default list order, also the organization_id prefix for per-organization aggregates
+        Index(
+            "ix_vehicles_organization_id_created_by_id_created_at",
+            "organization_id",
+            "created_by_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_vehicles_unsold_organization_id_created_by_id_created_at",
+            "organization_id",
+            "created_by_id",
+            "created_at",
+            "id",
+            postgresql_where=text("sold_to_id IS NULL"),
+        ),
+        # The other list sort orders
+        Index(
+            "ix_vehicles_organization_id_created_by_id_price",
+            "organization_id",
+            "created_by_id",
+            "price",
+            "id",
+        ),
+        Index(
+            "ix_vehicles_organization_id_created_by_id_kms_driven",
+            "organization_id",
+            "created_by_id",
+            "kms_driven",
+            "id",
+        ),
+        Index(
+            "ix_vehicles_organization_id_created_by_id_model_year",
+            "organization_id",
+            "created_by_id",
+            "model_year",
+            "id",
+        ),
+        # Sales in a time range, for the statistics series and rollup rebuilds
+        Index(
+            "ix_vehicles_organization_id_sold_at",
+            "organization_id",
+            "sold_at",
+            postgresql_where=text("sold_at IS NOT NULL"),
+        ),
+        # Foreign key lookups when a customer is deleted
+        Index(
+            "ix_vehicles_sold_to_id",
+            "sold_to_id",
+            postgresql_where=text("sold_to_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     registration_number = Column(String, index=True, nullable=False)
@@ -26,6 +87,12 @@ class Vehicle(Base):
     description = Column(String, nullable=True)
     price = Column(Float, nullable=False)
     first_registration = Column(Date, nullable=False)
+
+    # Search information
+    search_text = Column(
+        String,
+        Computed("model || ' ' || vin_number || ' ' || registration_number", persisted=True),
+    )
     
     # Sale information
     sold_to_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=True)
@@ -0,0 +1,101 @@
+from typing import List
+
+from app.database import get_pool_engines
+from app.models.admin_model import (
+    CacheStatistics,
+    CompressionStatistics,
+    EncodingStatistics,
+    PasswordHasherStatistics,
+    PoolStatistics,
+)
+from app.utilities.cache_utility import cache_registry
+from app.utilities.compression_utility import compression_metrics
+from app.utilities.password_utility import password_hasher
+
+
+class AdminService:
+    def get_pool_statistics(self) -> List[PoolStatistics]:
+        statistics = []
+
+        for name, engine in get_pool_engines().items():
+            pool = engine.pool
+            metrics = pool.metrics
+            attempts = metrics.checkouts + metrics.checkout_timeouts
+
+            statistics.append(
+                PoolStatistics(
+                    engine=name,
+                    size=pool.size(),
+                    max_overflow=pool._max_overflow,
+                    checked_in=pool.checkedin(),
+                    checked_out=pool.checkedout(),
+                    overflow=max(pool.overflow(), 0),
+                    checkouts=metrics.checkouts,
+                    checkout_timeouts=metrics.checkout_timeouts,
+                    wait_time_avg_ms=metrics.wait_time_total * 1000 / attempts if attempts else 0.0,
+                    wait_time_max_ms=metrics.wait_time_max * 1000,
+                )
+            )
+
+        return statistics
+
+    def get_cache_statistics(self) -> List[CacheStatistics]:
+        statistics = []
+
+        for cache in cache_registry.values():
+            lookups = cache.hits + cache.misses
+
+            statistics.append(
+                CacheStatistics(
+                    name=cache.name,
+                    size=len(cache),
+                    max_size=cache.max_size,
+                    ttl_seconds=cache.ttl,
+                    hits=cache.hits,
+                    misses=cache.misses,
+                    evictions=cache.evictions,
+                    stale_hits=cache.stale_hits,
+                    hit_rate=cache.hits / lookups if lookups else 0.0,
+                )
+            )
+
+        return statistics
+
+    def get_password_hasher_statistics(self) -> PasswordHasherStatistics:
+        completed = password_hasher.completed
+
+        return PasswordHasherStatistics(
+            workers=password_hasher.workers,
+            max_pending=password_hasher.max_pending,
+            in_flight=password_hasher.in_flight,
+            queued=password_hasher.queued,
+            completed=completed,
+            rejected=password_hasher.rejected,
+            duration_avg_ms=password_hasher.duration_total * 1000 / completed if completed else 0.0,
+        )
+
+    def get_compression_statistics(self) -> CompressionStatistics:
+        encodings = []
+
+        for metrics in compression_metrics.encodings.values():
+            megabytes = metrics.bytes_in / (1024 * 1024)
+
+            encodings.append(
+                EncodingStatistics(
+                    encoding=metrics.encoding,
+                    level=metrics.level,
+                    responses=metrics.responses,
+                    streamed_responses=metrics.streamed,
+                    bytes_in=metrics.bytes_in,
+                    bytes_out=metrics.bytes_out,
+                    ratio=metrics.bytes_in / metrics.bytes_out if metrics.bytes_out else 0.0,
+                    duration_total_ms=metrics.duration_total * 1000,
+                    duration_per_mb_ms=metrics.duration_total * 1000 / megabytes if megabytes else 0.0,
+                )
+            )
+
+        return CompressionStatistics(skipped=compression_metrics.skipped, encodings=encodings)
+
+
+def get_admin_service() -> AdminService:
+    return AdminService()
@@ -0,0 +1,58 @@
+from typing import Any, Callable, Type, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal
+
+
+def _run_in_new_session(fn: Callable[..., Any], *args, **kwargs):
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def run_in_session(db: Union[Session, AsyncSession], fn: Callable[..., Any], *args, **kwargs):
+    # Async sessions run the sync ORM code in a greenlet on the event loop,
+    # sync sessions run it on the threadpool like a plain `def` endpoint would
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+async def run_off_loop(db: Union[Session, AsyncSession], fn: Callable[..., Any], *args, **kwargs):
+    # For CPU-bound work, which would block every other request in the async session's greenlet.
+    # It gets its own sync session on the threadpool, outside of the request's transaction.
+    if isinstance(db, AsyncSession):
+        return await run_in_threadpool(_run_in_new_session, fn, *args, **kwargs)
+
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+class AsyncService:
+    def __init__(self, service_class: Type, db: Union[Session, AsyncSession]):
+        self.service_class = service_class
+        self.db = db
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(self.service_class, name, None)):
+            raise AttributeError(name)
+
+        # Services list their CPU-bound methods (row validation, report assembly) in CPU_BOUND_METHODS
+        if name in getattr(self.service_class, "CPU_BOUND_METHODS", ()):
+            run = run_off_loop
+        else:
+            run = run_in_session
+
+        async def method(*args, **kwargs):
+            return await run(
+                self.db,
+                lambda session: getattr(self.service_class(session), name)(*args, **kwargs),
+            )
+
+        method.__name__ = name
+        return method
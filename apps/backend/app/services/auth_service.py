@@ -1,18 +1,19 @@
 import os
 from datetime import datetime, timedelta
+from typing import Union
 
 from jose import jwt
 from fastapi import Depends, HTTPException, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 
 from app.schemas import User
-from app.database import get_db
+from app.database import get_session
 from app.models.user_model import UserCreate, UserResponse, UserLogin
 from app.config import config
+from app.services.async_service import AsyncService
 from app.services.base_service import BaseService
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.utilities.password_utility import password_hasher
 
 
 class AuthService:
@@ -28,7 +29,10 @@ class AuthService:
                 detail="Email already registered",
             )
 
-        hashed_password = pwd_context.hash(user.password)
+        # Hashing takes a while, the connection goes back to the pool meanwhile
+        self.db.commit()
+
+        hashed_password = password_hasher.hash(user.password)
         db_user = User(
             firstname=user.firstname,
             lastname=user.lastname,
@@ -45,7 +49,12 @@ class AuthService:
     def login(self, user: UserLogin, response: Response):
         db_user = self.db.query(User).filter(User.email == user.email).first()
 
-        if not db_user or not pwd_context.verify(user.password, db_user.password):
+        # Release the connection before verifying, a login burst must not drain the pool
+        if db_user:
+            self.db.expunge(db_user)
+        self.db.commit()
+
+        if not db_user or not password_hasher.verify(user.password, db_user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
             )
@@ -75,5 +84,5 @@ class AuthService:
         return {"message": "Successfully logged out"}
 
 
-def get_auth_service(db: Session = Depends(get_db)):
-    return AuthService(db) 
\ No newline at end of file
+def get_auth_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(AuthService, db) 
\ No newline at end of file
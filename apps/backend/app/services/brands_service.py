@@ -1,24 +1,56 @@
+from datetime import datetime
+from typing import Union
 from uuid import UUID
 
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_session
 from app.models.brand_model import BrandCreate, BrandResponse
+from app.models.pagination_model import CursorPage, CursorParams
 from app.schemas import Brand, User
+from app.services.async_service import AsyncService
 from app.services.base_service import BaseService
+from app.utilities.etag_utility import get_data_version, touch_data_version
+from app.utilities.pagination_utility import CursorPaginator
+
+BRAND_RESPONSE_COLUMNS = list(BrandResponse.model_fields)
+
+# Brands are shared by every organization, so they keep their own data version
+BRANDS_DATA_VERSION = "brands"
+
+brand_paginator = CursorPaginator(
+    sort_columns={"name": Brand.name},
+    id_column=Brand.id,
+    default_sort="name",
+)
 
 
 class BrandService(BaseService):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self):
-        brands = (
-            self.db.query(Brand).all()
+    def get_all(self, page_params: CursorParams) -> CursorPage[dict]:
+        query = self.db.query(*[getattr(Brand, name) for name in BRAND_RESPONSE_COLUMNS])
+
+        return brand_paginator.paginate(query, page_params)
+
+    # Cheap checks for conditional requests
+    def get_list_version(self) -> int:
+        return get_data_version(self.db, BRANDS_DATA_VERSION)
+
+    def get_version(self, id: UUID, current_user: User) -> datetime:
+        updated_at = (
+            self.db.query(Brand.updated_at)
+            .filter(Brand.id == id, Brand.created_by_id == current_user.id)
+            .first()
         )
 
-        return brands
+        if not updated_at:
+            raise HTTPException(status_code=404, detail="Brand not found")
+
+        return updated_at[0]
 
     def get_one(self, id: UUID, current_user: User):
         brand = self.db.query(Brand).filter(Brand.id == id, Brand.created_by_id == current_user.id).first()
@@ -35,6 +67,7 @@ class BrandService(BaseService):
         )
 
         self.db.add(brand)
+        touch_data_version(self.db, BRANDS_DATA_VERSION)
         self.db.commit()
         self.db.refresh(brand)
 
@@ -44,6 +77,7 @@ class BrandService(BaseService):
         brand = self.get_one(id, current_user)
 
         brand.name = data.name
+        touch_data_version(self.db, BRANDS_DATA_VERSION)
         self.db.commit()
         self.db.refresh(brand)
 
@@ -53,10 +87,11 @@ class BrandService(BaseService):
         brand = self.get_one(id, current_user)
 
         self.db.delete(brand)
+        touch_data_version(self.db, BRANDS_DATA_VERSION)
         self.db.commit()
 
         return
 
 
-def get_brand_service(db: Session = Depends(get_db)):
-    return BrandService(db)
+def get_brand_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(BrandService, db)
@@ -1,45 +1,134 @@
+from datetime import datetime
+from typing import List, Optional, Set, Tuple, Union
 from uuid import UUID
-from sqlalchemy import or_
+from sqlalchemy import Column, Integer, MetaData, Select, String, Table, exists, func, literal, or_, select
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
 
-from app.database import get_db
+from app.database import get_session
 from app.models.customer_model import CustomerCreate, CustomerFilter, CustomerResponse
-from app.schemas import Customer, User, Organization
+from app.models.import_model import ImportRowError
+from app.models.pagination_model import CursorPage, CursorParams
+from app.schemas import Customer, User
+from app.services.async_service import AsyncService
 from app.services.base_service import BaseService
+from app.services.statistics_rollup_service import StatisticsRollupService
+from app.utilities.copy_utility import copy_rows
+from app.utilities.etag_utility import get_organization_data_version, touch_organization
+from app.utilities.fields_utility import parse_fields
+from app.utilities.import_utility import ImportRow, blank_to_none, format_validation_error
+from app.utilities.organization_access_utility import check_organization_access
+from app.utilities.pagination_utility import CursorPaginator
+from app.utilities.search_utility import (
+    LIKE_ESCAPE,
+    escape_like,
+    looks_like_email,
+    looks_like_phone,
+    normalize_email,
+    normalize_phone,
+)
+
+# Larger than the default chunk, rows are staged with COPY and merged in two statements
+CUSTOMER_IMPORT_CHUNK_SIZE = 5000
+
+# Per-transaction staging table for imports, dropped on commit
+customer_import_staging = Table(
+    "customer_import_staging",
+    MetaData(),
+    Column("row", Integer),
+    Column("first_name", String),
+    Column("last_name", String),
+    Column("email", String),
+    Column("phone", String),
+    Column("email_normalized", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Reads project these columns instead of loading entities, exports carry the same fields
+CUSTOMER_RESPONSE_COLUMNS = list(CustomerResponse.model_fields)
+CUSTOMER_EXPORT_COLUMNS = CUSTOMER_RESPONSE_COLUMNS
+
+customer_paginator = CursorPaginator(
+    sort_columns={"created_at": Customer.created_at},
+    id_column=Customer.id,
+    default_sort="created_at",
+    default_descending=True,
+)
 
 
 class CustomerService(BaseService):
+    # Validating a chunk of import rows is CPU-bound, see AsyncService
+    CPU_BOUND_METHODS = {"import_rows"}
+
     def __init__(self, db: Session):
         self.db = db
+        self.rollup = StatisticsRollupService(db)
 
-    def get_all(self, organization_id: UUID, current_user: User, filter: CustomerFilter = None):
+    def get_all(
+        self,
+        organization_id: UUID,
+        current_user: User,
+        page_params: CursorParams,
+        filter: CustomerFilter = None,
+        fields: Optional[str] = None,
+    ) -> CursorPage[dict]:
         query = (
-            self.db.query(Customer)
+            self.db.query(*self._response_columns(fields))
             .filter(Customer.organization_id == organization_id)
         )
 
-        self._check_organization_access(organization_id, current_user)
-
-        if filter and filter.search:
-            search = f"%{filter.search}%"
-            query = query.filter(
-                or_(
-                    Customer.first_name.ilike(search),
-                    Customer.last_name.ilike(search),
-                    Customer.email.ilike(search),
-                    Customer.phone.ilike(search),
-                )
-            )
+        check_organization_access(self.db, organization_id, current_user)
+
+        search = filter.search.strip() if filter and filter.search else None
+        if search:
+            query = query.filter(self._search_condition(organization_id, search))
+
+        return customer_paginator.paginate(query, page_params)
+
+    def get_export_statement(
+        self,
+        organization_id: UUID,
+        current_user: User,
+        filter: CustomerFilter = None,
+    ) -> Select:
+        check_organization_access(self.db, organization_id, current_user)
+
+        statement = (
+            select(*self._response_columns())
+            .filter(Customer.organization_id == organization_id)
+            .order_by(Customer.created_at.desc(), Customer.id.desc())
+        )
+
+        search = filter.search.strip() if filter and filter.search else None
+        if search:
+            statement = statement.filter(self._search_condition(organization_id, search))
+
+        return statement
+
+    def get_one(self, id: UUID, organization_id: UUID, current_user: User, fields: Optional[str] = None) -> dict:
+        return self._get_customer(id, organization_id, current_user, self._response_columns(fields))._asdict()
 
-        customers = query.all()
-        return customers
+    # Cheap checks for conditional requests, answered without running the main query
+    def get_list_version(self, organization_id: UUID, current_user: User) -> int:
+        check_organization_access(self.db, organization_id, current_user)
 
-    def get_one(self, id: UUID, organization_id: UUID, current_user: User):
-        self._check_organization_access(organization_id, current_user)
+        return get_organization_data_version(self.db, organization_id)
+
+    def get_version(self, id: UUID, organization_id: UUID, current_user: User) -> datetime:
+        return self._get_customer(id, organization_id, current_user, [Customer.updated_at])[0]
+
+    # Only the requested columns are selected, so unused ones are never read or sent
+    def _response_columns(self, fields: Optional[str] = None):
+        return [getattr(Customer, name) for name in parse_fields(fields, CUSTOMER_RESPONSE_COLUMNS)]
+
+    def _get_customer(self, id: UUID, organization_id: UUID, current_user: User, columns=None):
+        check_organization_access(self.db, organization_id, current_user)
 
         customer = (
-            self.db.query(Customer)
+            self.db.query(*(columns or [Customer]))
             .filter(
                 Customer.id == id,
                 Customer.organization_id == organization_id,
@@ -53,7 +142,7 @@ class CustomerService(BaseService):
         return customer
 
     def create(self, organization_id: UUID, form_data: CustomerCreate, current_user: User):
-        self._check_organization_access(organization_id, current_user)
+        check_organization_access(self.db, organization_id, current_user)
 
         customer = Customer(
             first_name=form_data.first_name,
@@ -65,13 +154,100 @@ class CustomerService(BaseService):
         )
 
         self.db.add(customer)
+        self.rollup.record_new_customer(organization_id)
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(customer)
 
         return customer
 
+    def prepare_import(self, organization_id: UUID, current_user: User):
+        check_organization_access(self.db, organization_id, current_user)
+
+    def import_rows(
+        self,
+        organization_id: UUID,
+        current_user: User,
+        seen_emails: Set[str],
+        rows: List[ImportRow],
+    ) -> Tuple[int, int, List[ImportRowError]]:
+        errors = []
+        staged = []
+
+        for row, record, error in rows:
+            if error:
+                errors.append(ImportRowError(row=row, detail=error))
+                continue
+
+            try:
+                form_data = CustomerCreate.model_validate(blank_to_none(record))
+            except ValidationError as e:
+                errors.append(ImportRowError(row=row, detail=format_validation_error(e)))
+                continue
+
+            email = str(form_data.email)
+            email_normalized = normalize_email(email)
+
+            # seen_emails spans every chunk of the upload
+            if email_normalized in seen_emails:
+                errors.append(ImportRowError(row=row, detail="Duplicate email in this import"))
+                continue
+            seen_emails.add(email_normalized)
+
+            staged.append((row, form_data.first_name, form_data.last_name, email, form_data.phone, email_normalized))
+
+        if not staged:
+            return 0, 0, errors
+
+        customers = Customer.__table__
+        staging = customer_import_staging
+        same_customer = (customers.c.organization_id == organization_id) & (
+            customers.c.email_normalized == staging.c.email_normalized
+        )
+
+        # customers.email is not unique, so concurrent imports into one organization take turns
+        self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(organization_id)))))
+
+        staging.create(self.db.connection())
+        copy_rows(self.db, staging.name, [column.name for column in staging.columns], staged)
+
+        # Existing customers with the same email are updated in place...
+        updated = self.db.execute(
+            customers.update()
+            .where(same_customer)
+            .values(
+                first_name=staging.c.first_name,
+                last_name=staging.c.last_name,
+                phone=staging.c.phone,
+                updated_by_id=current_user.id,
+            )
+        ).rowcount
+
+        # ...and the rest are inserted in one statement
+        imported = self.db.execute(
+            customers.insert().from_select(
+                ["id", "first_name", "last_name", "email", "phone", "organization_id", "created_by_id"],
+                select(
+                    func.gen_random_uuid(),
+                    staging.c.first_name,
+                    staging.c.last_name,
+                    staging.c.email,
+                    staging.c.phone,
+                    literal(organization_id, customers.c.organization_id.type),
+                    literal(current_user.id, customers.c.created_by_id.type),
+                ).where(~exists().where(same_customer)),
+            )
+        ).rowcount
+
+        if imported:
+            self.rollup.record_new_customer(organization_id, count=imported)
+        touch_organization(self.db, organization_id)
+        self.db.commit()
+
+        return imported, updated, errors
+
     def update(self, id: UUID, organization_id: UUID, form_data: CustomerCreate, current_user: User):
-        customer = self.get_one(id, organization_id, current_user)
+        customer = self._get_customer(id, organization_id, current_user)
 
         customer.first_name = form_data.first_name
         customer.last_name = form_data.last_name
@@ -79,32 +255,44 @@ class CustomerService(BaseService):
         customer.phone = form_data.phone
         customer.updated_by_id = current_user.id
 
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(customer)
 
         return customer
 
     def delete(self, id: UUID, organization_id: UUID, current_user: User):
-        customer = self.get_one(id, organization_id, current_user)
+        customer = self._get_customer(id, organization_id, current_user)
 
+        self.rollup.revert_new_customer(organization_id, customer.created_at)
         self.db.delete(customer)
+        touch_organization(self.db, organization_id)
         self.db.commit()
 
         return None
 
-    def _check_organization_access(self, organization_id: UUID, current_user: User):
-        organization = (
-            self.db.query(Organization)
-            .filter(
-                Organization.id == organization_id,
-                Organization.created_by_id == current_user.id,
+    def _search_condition(self, organization_id: UUID, search: str):
+        if looks_like_email(search):
+            email = normalize_email(search)
+            narrow = Customer.email_normalized == email
+            wide = Customer.email_normalized.like(f"%{escape_like(email)}%", escape=LIKE_ESCAPE)
+        elif looks_like_phone(search):
+            digits = normalize_phone(search)
+            narrow = Customer.phone_normalized.like(f"{digits}%")
+            wide = Customer.phone_normalized.like(f"%{digits}%")
+        else:
+            term = escape_like(search.lower())
+            return or_(
+                Customer.name_search.like(f"%{term}%", escape=LIKE_ESCAPE),
+                Customer.email_normalized.like(f"%{term}%", escape=LIKE_ESCAPE),
             )
-            .first()
-        )
 
-        if not organization:
-            raise HTTPException(status_code=404, detail="Organization not found")
+        # The exact/prefix match is a btree lookup. Substrings (a local number without the
+        # country code, a domain) go through the trigram indexes, only when it finds nothing.
+        # Every page checks again, so a cursor keeps getting the same condition.
+        found = self.db.query(exists().where(Customer.organization_id == organization_id, narrow)).scalar()
+        return narrow if found else wide
 
 
-def get_customer_service(db: Session = Depends(get_db)):
-    return CustomerService(db)
+def get_customer_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(CustomerService, db)
@@ -1,26 +1,35 @@
+from typing import Union
 from uuid import UUID
 
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_session
 from app.models.organization_model import OrganizationCreate, OrganizationResponse
+from app.models.pagination_model import CursorPage, CursorParams
 from app.schemas import Organization, User
+from app.services.async_service import AsyncService
 from app.services.base_service import BaseService
+from app.utilities.pagination_utility import CursorPaginator
+
+organization_paginator = CursorPaginator(
+    sort_columns={"name": Organization.name},
+    id_column=Organization.id,
+    default_sort="name",
+)
 
 
 class OrganizationService(BaseService):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, current_user: User):
-        organizations = (
-            self.db.query(Organization)
-            .filter(Organization.created_by_id == current_user.id)
-            .all()
+    def get_all(self, current_user: User, page_params: CursorParams) -> CursorPage[OrganizationResponse]:
+        query = self.db.query(Organization).filter(
+            Organization.created_by_id == current_user.id
         )
 
-        return organizations
+        return organization_paginator.paginate(query, page_params)
 
     def get_one(self, id: UUID, current_user: User):
         organization = (
@@ -70,5 +79,5 @@ class OrganizationService(BaseService):
         return None
 
 
-def get_organization_service(db: Session = Depends(get_db)):
-    return OrganizationService(db) 
\ No newline at end of file
+def get_organization_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(OrganizationService, db) 
\ No newline at end of file
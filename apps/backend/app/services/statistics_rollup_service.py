@@ -0,0 +1,143 @@
+from datetime import date, datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Date, cast, func, literal_column, or_, select, true, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.schemas import Customer, OrganizationDailyStatistics, Vehicle, VehicleDeletion
+
+# Every column is recomputed from the vehicles, customers and vehicle_deletions rows. A deleted
+# vehicle keeps its listing and adds a delisting on the day of the delete, a deleted customer
+# or sale is reverted.
+REBUILT_COLUMNS = ("sales_count", "revenue", "new_customers", "listings", "delistings")
+
+# Revenue is summed in a different order by the two paths
+REVENUE_TOLERANCE = 0.005
+
+
+class StatisticsRollupService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_listing(self, organization_id: UUID, at: Optional[datetime] = None, count: int = 1):
+        self._increment(organization_id, at, listings=count)
+
+    def record_delisting(self, organization_id: UUID, at: Optional[datetime] = None):
+        self._increment(organization_id, at, delistings=1)
+
+    # price is the total of all count sales
+    def record_sale(self, organization_id: UUID, at: datetime, price: float, count: int = 1):
+        self._increment(organization_id, at, sales_count=count, revenue=price)
+
+    def revert_sale(self, organization_id: UUID, at: datetime, price: float, count: int = 1):
+        self._increment(organization_id, at, sales_count=-count, revenue=-price)
+
+    def adjust_revenue(self, organization_id: UUID, at: datetime, amount: float):
+        self._increment(organization_id, at, revenue=amount)
+
+    def record_new_customer(self, organization_id: UUID, at: Optional[datetime] = None, count: int = 1):
+        self._increment(organization_id, at, new_customers=count)
+
+    def revert_new_customer(self, organization_id: UUID, at: datetime):
+        self._increment(organization_id, at, new_customers=-1)
+
+    def rebuild(self, organization_id: Optional[UUID] = None) -> int:
+        aggregated = self._aggregated(organization_id)
+
+        rollup = OrganizationDailyStatistics.__table__
+        scope = rollup.c.organization_id == organization_id if organization_id else true()
+
+        self.db.execute(rollup.update().where(scope).values({name: 0 for name in REBUILT_COLUMNS}))
+
+        upsert = insert(rollup).from_select(["organization_id", "day", *REBUILT_COLUMNS], aggregated)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[rollup.c.organization_id, rollup.c.day],
+            set_={name: upsert.excluded[name] for name in REBUILT_COLUMNS},
+        )
+        rebuilt = self.db.execute(upsert).rowcount
+
+        self.db.execute(rollup.delete().where(scope, *[rollup.c[name] == 0 for name in REBUILT_COLUMNS]))
+        self.db.commit()
+
+        return rebuilt
+
+    def find_drift(self, organization_id: Optional[UUID] = None) -> List[dict]:
+        # Days where the incrementally maintained rollup differs from a rebuild
+        expected = self._aggregated(organization_id).subquery()
+        rollup = OrganizationDailyStatistics.__table__
+        stored = select(rollup).where(
+            rollup.c.organization_id == organization_id if organization_id else true()
+        ).subquery()
+
+        def differs(name):
+            difference = func.abs(func.coalesce(stored.c[name], 0) - func.coalesce(expected.c[name], 0))
+            return difference > (REVENUE_TOLERANCE if name == "revenue" else 0)
+
+        rows = self.db.execute(
+            select(
+                func.coalesce(stored.c.organization_id, expected.c.organization_id).label("organization_id"),
+                func.coalesce(stored.c.day, expected.c.day).label("day"),
+                *[stored.c[name].label(f"stored_{name}") for name in REBUILT_COLUMNS],
+                *[expected.c[name].label(f"expected_{name}") for name in REBUILT_COLUMNS],
+            )
+            .select_from(
+                stored.outerjoin(
+                    expected,
+                    (stored.c.organization_id == expected.c.organization_id) & (stored.c.day == expected.c.day),
+                    full=True,
+                )
+            )
+            .where(or_(*[differs(name) for name in REBUILT_COLUMNS]))
+            .order_by("organization_id", "day")
+        )
+
+        return [dict(row._mapping) for row in rows]
+
+    def _aggregated(self, organization_id: Optional[UUID]):
+        def events(organization_column, at_column, sales_count, revenue, new_customers, listings, delistings):
+            query = select(
+                organization_column.label("organization_id"),
+                cast(func.timezone(config.STATISTICS_TIMEZONE, at_column), Date).label("day"),
+                sales_count.label("sales_count"),
+                revenue.label("revenue"),
+                new_customers.label("new_customers"),
+                listings.label("listings"),
+                delistings.label("delistings"),
+            ).where(at_column.is_not(None))
+            return query.where(organization_column == organization_id) if organization_id else query
+
+        zero, one = literal_column("0"), literal_column("1")
+        all_events = union_all(
+            events(Vehicle.organization_id, Vehicle.created_at, zero, zero, zero, one, zero),
+            events(Vehicle.organization_id, Vehicle.sold_at, one, Vehicle.price, zero, zero, zero),
+            events(Customer.organization_id, Customer.created_at, zero, zero, one, zero, zero),
+            events(VehicleDeletion.organization_id, VehicleDeletion.listed_at, zero, zero, zero, one, zero),
+            events(VehicleDeletion.organization_id, VehicleDeletion.deleted_at, zero, zero, zero, zero, one),
+        ).subquery()
+
+        return select(
+            all_events.c.organization_id,
+            all_events.c.day,
+            *[func.sum(all_events.c[name]).label(name) for name in REBUILT_COLUMNS],
+        ).group_by(all_events.c.organization_id, all_events.c.day)
+
+    # The rollup row a change at `at` lands in
+    @staticmethod
+    def day_of(at: Optional[datetime]) -> date:
+        return (at or datetime.now(timezone.utc)).astimezone(ZoneInfo(config.STATISTICS_TIMEZONE)).date()
+
+    def _increment(self, organization_id: UUID, at: Optional[datetime], **deltas):
+        day = self.day_of(at)
+        rollup = OrganizationDailyStatistics.__table__
+
+        # Upsert in the caller's transaction, so the rollup commits or rolls back with the change
+        upsert = insert(rollup).values(organization_id=organization_id, day=day, **deltas)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[rollup.c.organization_id, rollup.c.day],
+            set_={name: rollup.c[name] + upsert.excluded[name] for name in deltas},
+        )
+        self.db.execute(upsert)
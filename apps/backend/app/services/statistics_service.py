@@ -1,154 +1,348 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, extract, text
+from sqlalchemy import Date, DateTime, Float, cast, extract, func, literal_column, select, tuple_, union_all
 from datetime import datetime, timedelta, date
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from uuid import UUID
 from fastapi import Depends, HTTPException
-from typing import Dict
+from typing import Dict, Optional, Tuple, Union
+
+from app.config import config
+from app.database import SessionLocal, get_session
+from app.services.async_service import AsyncService
+from app.schemas import Vehicle, Customer, Brand, User, OrganizationDailyStatistics
+from app.models.statistics_model import (
+    VehicleStatistics,
+    CustomerStatistics,
+    DashboardStatistics,
+    DaysToSellStatistics,
+    PeriodStatistics,
+    StatisticsGranularity,
+    StatisticsParams,
+)
+from app.utilities.etag_utility import get_organization_data_version
+from app.utilities.organization_access_utility import check_organization_access
+from app.utilities.statistics_cache_utility import dashboard_cache
+
+logger = logging.getLogger(__name__)
+
+# Default number of days covered by the time series, including today
+SERIES_DAYS = 7
+
+# Longest time series a single request may ask for
+MAX_SERIES_BUCKETS = 1000
+
+# grouping() bitmasks for the (fuel_type, brand) grouping sets
+GROUPING_TOTAL = 0b11
+GROUPING_FUEL_TYPE = 0b01
+GROUPING_BRAND = 0b10
+
+# Recomputes stale dashboards off the request path, one at a time
+dashboard_refresher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-refresh")
 
-from app.database import get_db
-from app.schemas import Vehicle, Customer, Brand
-from app.models.statistics_model import VehicleStatistics, CustomerStatistics, DashboardStatistics
 
 class StatisticsService:
+    # Assembling the dashboard from a few thousand rows is CPU-bound, see AsyncService
+    CPU_BOUND_METHODS = {"get_dashboard_statistics"}
+
     def __init__(self, db: Session):
         self.db = db
 
-    def get_vehicle_statistics(self, organization_id: UUID) -> VehicleStatistics:
-        # Total count of vehicles
-        total_count = self.db.query(func.count(Vehicle.id)).filter(
-            Vehicle.organization_id == organization_id
-        ).scalar() or 0
-
-        # Count of available (unsold) vehicles
-        available_count = self.db.query(func.count(Vehicle.id)).filter(
-            Vehicle.organization_id == organization_id,
-            Vehicle.sold_to_id.is_(None)
-        ).scalar() or 0
-
-        # Fuel type distribution
-        fuel_type_query = self.db.query(
-            Vehicle.fuel_type,
-            func.count(Vehicle.id)
-        ).filter(
-            Vehicle.organization_id == organization_id
-        ).group_by(Vehicle.fuel_type).all()
-
-        fuel_type_distribution = {fuel_type: count for fuel_type, count in fuel_type_query}
-
-        # Brand distribution
-        brand_query = self.db.query(
-            Brand.name,
-            func.count(Vehicle.id)
-        ).join(Vehicle, Vehicle.brand_id == Brand.id).filter(
-            Vehicle.organization_id == organization_id
-        ).group_by(Brand.name).all()
-
-        brand_distribution = {brand_name: count for brand_name, count in brand_query}
-
-        # Sales by day (last 7 days)
-        current_date = datetime.now()
-        start_date = (current_date - timedelta(days=7))
-
-        # Create a dictionary with all 7 days
-        sales_by_month = {}
-        for i in range(7):
-            day = current_date - timedelta(days=i)
-            day_str = day.strftime('%Y-%m-%d')
-            sales_by_month[day_str] = 0
-
-        # Fill in actual sales data
-        sales_query = self.db.query(
-            func.to_char(Vehicle.sold_at, 'YYYY-MM-DD'),
-            func.count(Vehicle.id)
-        ).filter(
-            Vehicle.organization_id == organization_id,
-            Vehicle.sold_at.is_not(None),
-            Vehicle.sold_at >= start_date
-        ).group_by(func.to_char(Vehicle.sold_at, 'YYYY-MM-DD')).all()
-
-        # Update the dictionary with actual data
-        for day, count in sales_query:
-            sales_by_month[day] = count
-
-        return VehicleStatistics(
+    def get_vehicle_statistics(self, organization_id: UUID, params: Optional[StatisticsParams] = None) -> VehicleStatistics:
+        from_date, to_date, granularity, timezone, _ = self._resolve_window(params or StatisticsParams())
+        series = self._get_series(organization_id, from_date, to_date, granularity, timezone)
+        vehicle_stats, _ = self._aggregate_vehicles(organization_id, series)
+        return vehicle_stats
+
+    def get_customer_statistics(self, organization_id: UUID, params: Optional[StatisticsParams] = None) -> CustomerStatistics:
+        from_date, to_date, granularity, timezone, _ = self._resolve_window(params or StatisticsParams())
+        series = self._get_series(organization_id, from_date, to_date, granularity, timezone)
+        return self._count_customers(organization_id, series)
+
+    def get_dashboard_statistics(
+        self,
+        organization_id: UUID,
+        current_user: User,
+        params: Optional[StatisticsParams] = None,
+    ) -> DashboardStatistics:
+        check_organization_access(self.db, organization_id, current_user)
+
+        window = self._resolve_window(params or StatisticsParams())
+        key = (organization_id, *window)
+        # Read before the statistics, so a cached value is never tagged newer than its data
+        version = get_organization_data_version(self.db, organization_id)
+        statistics, refresh = dashboard_cache.lookup(key, version)
+
+        if refresh:
+            dashboard_refresher.submit(_refresh_dashboard_statistics, key)
+
+        if statistics is None:
+            statistics = self.compute_dashboard_statistics(organization_id, *window)
+            dashboard_cache.store(key, version, statistics)
+
+        return statistics
+
+    def compute_dashboard_statistics(
+        self,
+        organization_id: UUID,
+        from_date: date,
+        to_date: date,
+        granularity: StatisticsGranularity,
+        timezone: str,
+        compare_previous: bool,
+    ) -> DashboardStatistics:
+        series = self._get_series(organization_id, from_date, to_date, granularity, timezone)
+        vehicle_stats, total_revenue = self._aggregate_vehicles(organization_id, series)
+
+        previous_period = None
+        if compare_previous:
+            previous_to = from_date - timedelta(days=1)
+            previous_from = previous_to - (to_date - from_date)
+            previous_period = PeriodStatistics(
+                from_date=previous_from,
+                to_date=previous_to,
+                **self._get_series(organization_id, previous_from, previous_to, granularity, timezone),
+            )
+
+        return DashboardStatistics(
+            vehicles=vehicle_stats,
+            customers=self._count_customers(organization_id, series),
+            total_revenue=total_revenue,
+            revenue_by_month=series["revenue_by_month"],
+            previous_period=previous_period,
+        )
+
+    def _count_customers(self, organization_id: UUID, series: Dict[str, dict]) -> CustomerStatistics:
+        total_count = (
+            self.db.query(func.count(Customer.id))
+            .filter(Customer.organization_id == organization_id)
+            .scalar()
+        )
+
+        return CustomerStatistics(
+            total_count=total_count,
+            customers_by_month=series["customers_by_month"]
+        )
+
+    def _aggregate_vehicles(self, organization_id: UUID, series: Dict[str, dict]) -> Tuple[VehicleStatistics, float]:
+        sold = Vehicle.sold_at.is_not(None)
+        days_to_sell = cast(extract("epoch", Vehicle.sold_at - Vehicle.created_at), Float) / 86400
+
+        # One scan over the organization's vehicles, grouped into totals,
+        # fuel types and brands at the same time. Sell-through figures are
+        # ordered-set aggregates over the sold vehicles of each group.
+        rows = (
+            self.db.query(
+                func.grouping(Vehicle.fuel_type, Brand.name),
+                Vehicle.fuel_type,
+                Brand.name,
+                func.count(Vehicle.id),
+                func.count(Vehicle.id).filter(Vehicle.sold_to_id.is_(None)),
+                func.coalesce(func.sum(Vehicle.price).filter(Vehicle.sold_to_id.is_not(None)), 0.0),
+                func.count(Vehicle.id).filter(sold),
+                func.avg(days_to_sell).filter(sold),
+                func.percentile_cont(0.5).within_group(days_to_sell).filter(sold),
+                func.percentile_cont(0.9).within_group(days_to_sell).filter(sold),
+            )
+            .join(Brand, Vehicle.brand_id == Brand.id)
+            .filter(Vehicle.organization_id == organization_id)
+            .group_by(func.grouping_sets(tuple_(), Vehicle.fuel_type, Brand.name))
+            .all()
+        )
+
+        total_count = 0
+        available_count = 0
+        total_revenue = 0.0
+        fuel_type_distribution = {}
+        brand_distribution = {}
+        days_to_sell_total = DaysToSellStatistics(sold_count=0)
+        days_to_sell_by_fuel_type = {}
+        days_to_sell_by_brand = {}
+
+        for grouping, fuel_type, brand_name, count, unsold_count, sold_revenue, sold_count, *days in rows:
+            days_to_sell_stats = DaysToSellStatistics(
+                sold_count=sold_count,
+                avg_days_to_sell=float(days[0]) if days[0] is not None else None,
+                median_days_to_sell=days[1],
+                p90_days_to_sell=days[2],
+            )
+
+            if grouping == GROUPING_TOTAL:
+                total_count = count
+                available_count = unsold_count
+                total_revenue = float(sold_revenue)
+                days_to_sell_total = days_to_sell_stats
+            elif grouping == GROUPING_FUEL_TYPE:
+                fuel_type_distribution[fuel_type] = count
+                if sold_count:
+                    days_to_sell_by_fuel_type[fuel_type] = days_to_sell_stats
+            elif grouping == GROUPING_BRAND:
+                brand_distribution[brand_name] = count
+                if sold_count:
+                    days_to_sell_by_brand[brand_name] = days_to_sell_stats
+
+        vehicle_stats = VehicleStatistics(
             total_count=total_count,
             available_count=available_count,
             fuel_type_distribution=fuel_type_distribution,
             brand_distribution=brand_distribution,
-            sales_by_month=sales_by_month,
+            sales_by_month=series["sales_by_month"],
+            avg_days_to_sell=days_to_sell_total.avg_days_to_sell,
+            median_days_to_sell=days_to_sell_total.median_days_to_sell,
+            p90_days_to_sell=days_to_sell_total.p90_days_to_sell,
+            days_to_sell_by_brand=days_to_sell_by_brand,
+            days_to_sell_by_fuel_type=days_to_sell_by_fuel_type,
         )
 
-    def get_customer_statistics(self, organization_id: UUID) -> CustomerStatistics:
-        total_count = self.db.query(func.count(Customer.id)).filter(
-            Customer.organization_id == organization_id
-        ).scalar() or 0
+        return vehicle_stats, total_revenue
 
-        current_date = datetime.now()
-        start_date = (current_date - timedelta(days=7))
-        customers_by_month = {}
+    def _get_series(
+        self,
+        organization_id: UUID,
+        from_date: date,
+        to_date: date,
+        granularity: StatisticsGranularity,
+        timezone: str,
+    ) -> Dict[str, dict]:
+        unit = granularity.value
 
-        for i in range(7):
-            day = current_date - timedelta(days=i)
-            day_str = day.strftime('%Y-%m-%d')
-            customers_by_month[day_str] = 0
+        def bucket_of(local_time):
+            return cast(func.date_trunc(unit, local_time), Date).label("bucket")
 
-        customers_query = self.db.query(
-            func.to_char(Customer.created_at, 'YYYY-MM-DD'),
-            func.count(Customer.id)
-        ).filter(
-            Customer.organization_id == organization_id,
-            Customer.created_at >= start_date
-        ).group_by(func.to_char(Customer.created_at, 'YYYY-MM-DD')).all()
+        zero, one = literal_column("0"), literal_column("1")
 
-        for day, count in customers_query:
-            customers_by_month[day] = count
+        if timezone == config.STATISTICS_TIMEZONE:
+            # The rollup already holds one row per day in this time zone
+            events = select(
+                bucket_of(cast(OrganizationDailyStatistics.day, DateTime)),
+                OrganizationDailyStatistics.sales_count,
+                OrganizationDailyStatistics.revenue,
+                OrganizationDailyStatistics.new_customers,
+            ).where(
+                OrganizationDailyStatistics.organization_id == organization_id,
+                OrganizationDailyStatistics.day.between(from_date, to_date),
+            )
+        else:
+            start = func.timezone(timezone, cast(from_date, DateTime))
+            end = func.timezone(timezone, cast(to_date + timedelta(days=1), DateTime))
+            events = union_all(
+                select(
+                    bucket_of(func.timezone(timezone, Vehicle.sold_at)),
+                    one.label("sales_count"),
+                    Vehicle.price.label("revenue"),
+                    zero.label("new_customers"),
+                ).where(
+                    Vehicle.organization_id == organization_id,
+                    Vehicle.sold_at >= start,
+                    Vehicle.sold_at < end,
+                ),
+                select(
+                    bucket_of(func.timezone(timezone, Customer.created_at)),
+                    zero.label("sales_count"),
+                    zero.label("revenue"),
+                    one.label("new_customers"),
+                ).where(
+                    Customer.organization_id == organization_id,
+                    Customer.created_at >= start,
+                    Customer.created_at < end,
+                ),
+            )
 
-        return CustomerStatistics(
-            total_count=total_count,
-            customers_by_month=customers_by_month
+        events = events.subquery()
+        totals = (
+            select(
+                events.c.bucket,
+                func.sum(events.c.sales_count).label("sales_count"),
+                func.sum(events.c.revenue).label("revenue"),
+                func.sum(events.c.new_customers).label("new_customers"),
+            )
+            .group_by(events.c.bucket)
+            .subquery()
         )
 
-    def get_dashboard_statistics(self, organization_id: UUID) -> DashboardStatistics:
-        vehicle_stats = self.get_vehicle_statistics(organization_id)
-        customer_stats = self.get_customer_statistics(organization_id)
-
-        # Total revenue
-        total_revenue = self.db.query(func.sum(Vehicle.price)).filter(
-            Vehicle.organization_id == organization_id,
-            Vehicle.sold_to_id.is_not(None)
-        ).scalar() or 0.0
+        # Gap-fill in the database: one row per bucket, whether or not anything happened in it
+        buckets = (
+            func.generate_series(
+                func.date_trunc(unit, cast(from_date, DateTime)),
+                cast(to_date, DateTime),
+                literal_column(f"interval '1 {unit}'"),
+            )
+            .table_valued("bucket")
+            .render_derived()
+        )
+        bucket = cast(buckets.c.bucket, Date)
 
-        # Revenue by day (last 7 days)
-        current_date = datetime.now()
-        start_date = (current_date - timedelta(days=7))
+        rows = self.db.execute(
+            select(
+                bucket,
+                func.coalesce(totals.c.sales_count, 0),
+                func.coalesce(totals.c.revenue, 0),
+                func.coalesce(totals.c.new_customers, 0),
+            )
+            .select_from(buckets.outerjoin(totals, totals.c.bucket == bucket))
+            .order_by(buckets.c.bucket)
+        ).all()
 
-        # Create a dictionary with all 7 days
+        sales_by_month = {}
         revenue_by_month = {}
-        for i in range(7):
-            day = current_date - timedelta(days=i)
+        customers_by_month = {}
+
+        for day, sales_count, revenue, new_customers in rows:
             day_str = day.strftime('%Y-%m-%d')
-            revenue_by_month[day_str] = 0.0
-
-        # Fill in actual revenue data
-        revenue_query = self.db.query(
-            func.to_char(Vehicle.sold_at, 'YYYY-MM-DD'),
-            func.sum(Vehicle.price)
-        ).filter(
-            Vehicle.organization_id == organization_id,
-            Vehicle.sold_at.is_not(None),
-            Vehicle.sold_at >= start_date
-        ).group_by(func.to_char(Vehicle.sold_at, 'YYYY-MM-DD')).all()
-
-        # Update the dictionary with actual data
-        for day, revenue in revenue_query:
-            revenue_by_month[day] = float(revenue)
+            sales_by_month[day_str] = int(sales_count)
+            revenue_by_month[day_str] = float(revenue)
+            customers_by_month[day_str] = int(new_customers)
+
+        return {
+            "sales_by_month": sales_by_month,
+            "revenue_by_month": revenue_by_month,
+            "customers_by_month": customers_by_month,
+        }
+
+    def _resolve_window(self, params: StatisticsParams) -> Tuple[date, date, StatisticsGranularity, str, bool]:
+        timezone = params.timezone or config.STATISTICS_TIMEZONE
+        try:
+            today = datetime.now(ZoneInfo(timezone)).date()
+        except (ZoneInfoNotFoundError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid timezone")
+
+        to_date = params.to_date or today
+        from_date = params.from_date or to_date - timedelta(days=SERIES_DAYS - 1)
+
+        if from_date > to_date:
+            raise HTTPException(status_code=400, detail="from must not be after to")
+
+        if params.granularity == StatisticsGranularity.MONTH:
+            buckets = (to_date.year - from_date.year) * 12 + to_date.month - from_date.month + 1
+        elif params.granularity == StatisticsGranularity.WEEK:
+            buckets = (to_date - from_date).days // 7 + 2
+        else:
+            buckets = (to_date - from_date).days + 1
+
+        if buckets > MAX_SERIES_BUCKETS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Time series can have at most {MAX_SERIES_BUCKETS} buckets",
+            )
+
+        return from_date, to_date, params.granularity, timezone, params.compare_previous
+
+
+def _refresh_dashboard_statistics(key: tuple):
+    db = SessionLocal()
+    try:
+        version = get_organization_data_version(db, key[0])
+        statistics = StatisticsService(db).compute_dashboard_statistics(*key)
+        dashboard_cache.store(key, version, statistics)
+    except Exception:
+        logger.exception("Refreshing dashboard statistics for organization %s failed", key[0])
+    finally:
+        dashboard_cache.refresh_done(key)
+        db.close()
 
-        return DashboardStatistics(
-            vehicles=vehicle_stats,
-            customers=customer_stats,
-            total_revenue=total_revenue,
-            revenue_by_month=revenue_by_month
-        )
 
-def get_statistics_service(db: Session = Depends(get_db)) -> StatisticsService:
-    return StatisticsService(db)
+def get_statistics_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(StatisticsService, db)
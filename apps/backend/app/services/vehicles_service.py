@@ -1,36 +1,181 @@
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple, Union
 from uuid import UUID
-from sqlalchemy import or_
-from datetime import datetime
+from sqlalchemy import Numeric, Select, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
 
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from fastapi_pagination import Page, paginate
-from fastapi_pagination.utils import disable_installed_extensions_check
-
-from app.models.vehicle_model import VehicleCreate, VehicleResponse, VehicleFilter, VehicleMarkAsSold
-from app.schemas import User, Vehicle, Brand, Organization, Customer
-from app.database import get_db
+from pydantic import ValidationError
+
+from app.models.import_model import ImportRowError
+from app.models.pagination_model import CursorPage, CursorParams
+from app.models.vehicle_model import (
+    VehicleBatchError,
+    VehicleBatchMarkAsSold,
+    VehicleBatchMarkAsUnsold,
+    VehicleBatchResult,
+    VehicleCreate,
+    VehicleFilter,
+    VehicleMarkAsSold,
+    VehicleResponse,
+)
+from app.schemas import User, Vehicle, VehicleDeletion, Brand, Customer
+from app.database import get_session
+from app.services.async_service import AsyncService
 from app.services.base_service import BaseService
+from app.services.statistics_rollup_service import StatisticsRollupService
+from app.utilities.etag_utility import get_organization_data_version, touch_organization
+from app.utilities.fields_utility import parse_fields
+from app.utilities.import_utility import ImportRow, blank_to_none, format_validation_error
+from app.utilities.organization_access_utility import check_organization_access
+from app.utilities.pagination_utility import CursorPaginator
+from app.utilities.search_utility import LIKE_ESCAPE, escape_like
+
+# Reads project these columns instead of loading entities, exports carry the same fields
+VEHICLE_RESPONSE_COLUMNS = list(VehicleResponse.model_fields)
+VEHICLE_EXPORT_COLUMNS = VEHICLE_RESPONSE_COLUMNS
+
+vehicle_paginator = CursorPaginator(
+    sort_columns={
+        "created_at": Vehicle.created_at,
+        "price": Vehicle.price,
+        "kms_driven": Vehicle.kms_driven,
+        "model_year": Vehicle.model_year,
+    },
+    id_column=Vehicle.id,
+    default_sort="created_at",
+    default_descending=True,
+)
 
 
 class VehiclesService(BaseService):
+    # Validating a chunk of import rows is CPU-bound, see AsyncService
+    CPU_BOUND_METHODS = {"import_rows"}
+
     def __init__(self, db: Session):
         self.db = db
+        self.rollup = StatisticsRollupService(db)
+
+    def get_all(
+        self,
+        current_user: User,
+        organization_id: UUID,
+        filter_params: VehicleFilter,
+        page_params: CursorParams,
+        fields: Optional[str] = None,
+    ) -> CursorPage[dict]:
+        query = self.db.query(*self._response_columns(fields)).filter(
+            Vehicle.created_by_id == current_user.id,
+            Vehicle.organization_id == organization_id
+        )
+        query, relevance, sort = self._apply_filters(query, filter_params)
+
+        page = vehicle_paginator.paginate(
+            query,
+            page_params,
+            sort=sort,
+            descending=sort == "relevance" or filter_params.sort_order == "desc",
+            sort_column=relevance if sort == "relevance" else None,
+        )
+
+        return page
 
-    def get_all(self, current_user: User, organization_id: UUID, filter_params: VehicleFilter):
-        query = self.db.query(Vehicle).filter(
+    def get_export_statement(self, current_user: User, organization_id: UUID, filter_params: VehicleFilter) -> Select:
+        check_organization_access(self.db, organization_id, current_user)
+
+        # Plain columns instead of entities, nothing is tracked by a session while streaming
+        statement = select(*self._response_columns()).filter(
             Vehicle.created_by_id == current_user.id,
             Vehicle.organization_id == organization_id
         )
+        statement, relevance, sort = self._apply_filters(statement, filter_params)
+
+        sort_column = relevance if sort == "relevance" else vehicle_paginator.sort_columns[sort]
+        if sort == "relevance" or filter_params.sort_order == "desc":
+            return statement.order_by(sort_column.desc(), Vehicle.id.desc())
+
+        return statement.order_by(sort_column.asc(), Vehicle.id.asc())
+
+    def _set_sale_many(
+        self,
+        vehicle_ids: List[UUID],
+        atomic: bool,
+        current_user: User,
+        organization_id: UUID,
+        sold_to_id: Optional[UUID],
+        sold_at: Optional[datetime],
+    ) -> VehicleBatchResult:
+        vehicle_ids = list(dict.fromkeys(vehicle_ids))
+        vehicles = Vehicle.__table__
+
+        # Lock the matching rows and remember their previous sale for the rollup
+        previous = (
+            select(vehicles.c.id, vehicles.c.sold_at, vehicles.c.price)
+            .where(
+                vehicles.c.id.in_(vehicle_ids),
+                vehicles.c.created_by_id == current_user.id,
+                vehicles.c.organization_id == organization_id,
+            )
+            .with_for_update()
+            .cte("previous")
+        )
+
+        rows = self.db.execute(
+            vehicles.update()
+            .where(vehicles.c.id == previous.c.id)
+            .values(sold_to_id=sold_to_id, sold_at=sold_at, updated_by_id=current_user.id)
+            .returning(*vehicles.c, previous.c.sold_at.label("previous_sold_at"))
+        ).all()
+
+        updated_ids = {row.id for row in rows}
+        missing_ids = [vehicle_id for vehicle_id in vehicle_ids if vehicle_id not in updated_ids]
+
+        if missing_ids and atomic:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=404,
+                detail=f"Vehicles not found: {', '.join(str(vehicle_id) for vehicle_id in missing_ids)}",
+            )
+
+        # One rollup upsert per affected day rather than per vehicle, any sale of the day stands in for it
+        reverted = {}
+        for row in rows:
+            if row.previous_sold_at is not None:
+                day = self.rollup.day_of(row.previous_sold_at)
+                at, count, revenue = reverted.get(day, (row.previous_sold_at, 0, 0.0))
+                reverted[day] = (at, count + 1, revenue + row.price)
+
+        for at, count, revenue in reverted.values():
+            self.rollup.revert_sale(organization_id, at, revenue, count=count)
 
-        if filter_params.search:
-            search_term = f"%{filter_params.search}%"
+        if sold_at is not None and rows:
+            self.rollup.record_sale(organization_id, sold_at, sum(row.price for row in rows), count=len(rows))
+
+        touch_organization(self.db, organization_id)
+        self.db.commit()
+
+        items = {row.id: VehicleResponse.model_validate(row._mapping) for row in rows}
+
+        return VehicleBatchResult(
+            items=[items[vehicle_id] for vehicle_id in vehicle_ids if vehicle_id in items],
+            failed=[VehicleBatchError(vehicle_id=vehicle_id, detail="Vehicle not found") for vehicle_id in missing_ids],
+        )
+
+    # Works on both Query and Select, which share filter()
+    def _apply_filters(self, query, filter_params: VehicleFilter):
+        relevance = None
+        search = filter_params.search.strip() if filter_params.search else None
+        if search:
+            # Both predicates are served by the trigram index on search_text
+            # word_similarity is a float4, which changes value when compared with the float8 cursor
+            # value. Rounded to a numeric, the cursor holds exactly the value SQL orders by
+            relevance = func.round(cast(func.word_similarity(search, Vehicle.search_text), Numeric), 6, type_=Numeric)
             query = query.filter(
                 or_(
-                    Vehicle.model.ilike(search_term),
-                    Vehicle.vin_number.ilike(search_term),
-                    Vehicle.registration_number.ilike(search_term)
+                    Vehicle.search_text.ilike(f"%{escape_like(search)}%", escape=LIKE_ESCAPE),
+                    Vehicle.search_text.op("%>")(search),
                 )
             )
 
@@ -46,18 +191,22 @@ class VehiclesService(BaseService):
             elif filter_params.sale_status == "unsold":
                 query = query.filter(Vehicle.sold_to_id == None)
 
-        vehicles = query.all()
+        sort = filter_params.sort_by.value if filter_params.sort_by else None
+        if sort is None:
+            sort = "relevance" if relevance is not None else "created_at"
 
-        vehicle_responses = []
+        if sort == "relevance" and relevance is None:
+            raise HTTPException(status_code=400, detail="Sorting by relevance requires a search term")
 
-        for vehicle in vehicles:
-            vehicle_responses.append(VehicleResponse.model_validate(vehicle))
+        return query, relevance, sort
 
-        return paginate(vehicle_responses)
+    # Only the requested columns are selected, so unused ones are never read or sent
+    def _response_columns(self, fields: Optional[str] = None):
+        return [getattr(Vehicle, name) for name in parse_fields(fields, VEHICLE_RESPONSE_COLUMNS)]
 
-    def get_one(self, id: UUID, organization_id: UUID, current_user: User):
+    def get_one(self, id: UUID, organization_id: UUID, current_user: User, fields: Optional[str] = None) -> dict:
         vehicle = (
-            self.db.query(Vehicle)
+            self.db.query(*self._response_columns(fields))
             .filter(
                 Vehicle.id == id,
                 Vehicle.created_by_id == current_user.id,
@@ -69,16 +218,34 @@ class VehiclesService(BaseService):
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found")
 
-        return vehicle
+        return vehicle._asdict()
+
+    # Cheap checks for conditional requests, answered without running the main query
+    def get_list_version(self, current_user: User, organization_id: UUID) -> Optional[int]:
+        return get_organization_data_version(self.db, organization_id)
+
+    def get_version(self, id: UUID, organization_id: UUID, current_user: User) -> datetime:
+        updated_at = (
+            self.db.query(Vehicle.updated_at)
+            .filter(
+                Vehicle.id == id,
+                Vehicle.created_by_id == current_user.id,
+                Vehicle.organization_id == organization_id
+            )
+            .first()
+        )
+
+        if not updated_at:
+            raise HTTPException(status_code=404, detail="Vehicle not found")
+
+        return updated_at[0]
 
     def create(self, form_data: VehicleCreate, current_user: User, organization_id: UUID):
         brand = self.db.query(Brand).filter(Brand.id == form_data.brand_id).first()
         if not brand:
             raise HTTPException(status_code=404, detail="Brand not found")
 
-        organization = self.db.query(Organization).filter(Organization.id == organization_id).first()
-        if not organization:
-            raise HTTPException(status_code=404, detail="Organization not found")
+        check_organization_access(self.db, organization_id, current_user)
 
         vehicle = Vehicle(
             registration_number=form_data.registration_number,
@@ -97,19 +264,96 @@ class VehiclesService(BaseService):
             created_by_id=current_user.id,
         )
         self.db.add(vehicle)
+        self.rollup.record_listing(organization_id)
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(vehicle)
 
         return vehicle
 
+    def prepare_import(self, organization_id: UUID, current_user: User) -> Set[UUID]:
+        check_organization_access(self.db, organization_id, current_user)
+
+        # Every row's brand is checked against this instead of a query per row
+        return {brand_id for brand_id, in self.db.query(Brand.id)}
+
+    def import_rows(
+        self,
+        organization_id: UUID,
+        current_user: User,
+        brand_ids: Set[UUID],
+        rows: List[ImportRow],
+    ) -> Tuple[int, int, List[ImportRowError]]:
+        errors = []
+        vehicles = {}
+
+        for row, record, error in rows:
+            if error:
+                errors.append(ImportRowError(row=row, detail=error))
+                continue
+
+            try:
+                form_data = VehicleCreate.model_validate(blank_to_none(record))
+            except ValidationError as e:
+                errors.append(ImportRowError(row=row, detail=format_validation_error(e)))
+                continue
+
+            if form_data.brand_id not in brand_ids:
+                errors.append(ImportRowError(row=row, detail="Brand not found"))
+                continue
+
+            if form_data.vin_number in vehicles:
+                errors.append(ImportRowError(row=row, detail="Duplicate VIN in this import"))
+                continue
+
+            vehicles[form_data.vin_number] = (row, {
+                "registration_number": form_data.registration_number,
+                "vin_number": form_data.vin_number,
+                "is_new": form_data.is_new,
+                "kms_driven": form_data.kms_driven,
+                "brand_id": form_data.brand_id,
+                "organization_id": organization_id,
+                "model": form_data.model,
+                "model_year": form_data.model_year,
+                "fuel_type": form_data.fuel_type.value,
+                "color": form_data.color,
+                "description": form_data.description,
+                "price": form_data.price,
+                "first_registration": form_data.first_registration,
+                "created_by_id": current_user.id,
+            })
+
+        if not vehicles:
+            return 0, 0, errors
+
+        # One multi-row INSERT per chunk; VINs that already exist are skipped, not fatal
+        inserted = set(
+            self.db.scalars(
+                insert(Vehicle)
+                .on_conflict_do_nothing(index_elements=[Vehicle.vin_number])
+                .returning(Vehicle.vin_number),
+                [values for _, values in vehicles.values()],
+            )
+        )
+
+        for vin_number, (row, _) in vehicles.items():
+            if vin_number not in inserted:
+                errors.append(ImportRowError(row=row, detail="Vehicle with this VIN already exists"))
+
+        if inserted:
+            self.rollup.record_listing(organization_id, count=len(inserted))
+        touch_organization(self.db, organization_id)
+        self.db.commit()
+
+        errors.sort(key=lambda error: error.row)
+        return len(inserted), 0, errors
+
     def update(self, id: UUID, form_data: VehicleCreate, current_user: User, organization_id: UUID):
         brand = self.db.query(Brand).filter(Brand.id == form_data.brand_id).first()
         if not brand:
             raise HTTPException(status_code=404, detail="Brand not found")
 
-        organization = self.db.query(Organization).filter(Organization.id == organization_id).first()
-        if not organization:
-            raise HTTPException(status_code=404, detail="Organization not found")
+        check_organization_access(self.db, organization_id, current_user)
 
         vehicle = (
             self.db.query(Vehicle)
@@ -118,6 +362,8 @@ class VehiclesService(BaseService):
                 Vehicle.created_by_id == current_user.id,
                 Vehicle.organization_id == organization_id
             )
+            # Rollup deltas are computed from this row, concurrent changes to it must wait
+            .with_for_update()
             .first()
         )
 
@@ -135,10 +381,13 @@ class VehiclesService(BaseService):
         vehicle.fuel_type = form_data.fuel_type.value
         vehicle.color = form_data.color
         vehicle.description = form_data.description
+        if vehicle.sold_at is not None and vehicle.price != form_data.price:
+            self.rollup.adjust_revenue(organization_id, vehicle.sold_at, form_data.price - vehicle.price)
         vehicle.price = form_data.price
         vehicle.first_registration = form_data.first_registration
         vehicle.updated_by_id = current_user.id
 
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(vehicle)
         return vehicle
@@ -161,17 +410,22 @@ class VehiclesService(BaseService):
                 Vehicle.created_by_id == current_user.id,
                 Vehicle.organization_id == organization_id
             )
+            .with_for_update()
             .first()
         )
 
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found")
             
-        # Mark as sold
+        # Mark as sold, moving an earlier sale to the new date
+        if vehicle.sold_at is not None:
+            self.rollup.revert_sale(organization_id, vehicle.sold_at, vehicle.price)
         vehicle.sold_to_id = form_data.sold_to_id
-        vehicle.sold_at = datetime.now()
+        vehicle.sold_at = datetime.now(timezone.utc)
         vehicle.updated_by_id = current_user.id
+        self.rollup.record_sale(organization_id, vehicle.sold_at, vehicle.price)
 
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(vehicle)
         return vehicle
@@ -185,6 +439,7 @@ class VehiclesService(BaseService):
                 Vehicle.created_by_id == current_user.id,
                 Vehicle.organization_id == organization_id
             )
+            .with_for_update()
             .first()
         )
 
@@ -192,14 +447,56 @@ class VehiclesService(BaseService):
             raise HTTPException(status_code=404, detail="Vehicle not found")
             
         # Mark as unsold
+        if vehicle.sold_at is not None:
+            self.rollup.revert_sale(organization_id, vehicle.sold_at, vehicle.price)
         vehicle.sold_to_id = None
         vehicle.sold_at = None
         vehicle.updated_by_id = current_user.id
 
+        touch_organization(self.db, organization_id)
         self.db.commit()
         self.db.refresh(vehicle)
         return vehicle
 
+    def mark_many_as_sold(
+        self,
+        form_data: VehicleBatchMarkAsSold,
+        current_user: User,
+        organization_id: UUID,
+    ) -> VehicleBatchResult:
+        # Validate customer once for the whole batch
+        customer = self.db.query(Customer.id).filter(
+            Customer.id == form_data.sold_to_id,
+            Customer.organization_id == organization_id
+        ).first()
+
+        if not customer:
+            raise HTTPException(status_code=404, detail="Customer not found")
+
+        return self._set_sale_many(
+            form_data.vehicle_ids,
+            form_data.atomic,
+            current_user,
+            organization_id,
+            sold_to_id=form_data.sold_to_id,
+            sold_at=datetime.now(timezone.utc),
+        )
+
+    def mark_many_as_unsold(
+        self,
+        form_data: VehicleBatchMarkAsUnsold,
+        current_user: User,
+        organization_id: UUID,
+    ) -> VehicleBatchResult:
+        return self._set_sale_many(
+            form_data.vehicle_ids,
+            form_data.atomic,
+            current_user,
+            organization_id,
+            sold_to_id=None,
+            sold_at=None,
+        )
+
     def delete(self, id: UUID, organization_id: UUID, current_user: User):
         vehicle = (
             self.db.query(Vehicle)
@@ -208,17 +505,32 @@ class VehiclesService(BaseService):
                 Vehicle.created_by_id == current_user.id,
                 Vehicle.organization_id == organization_id
             )
+            .with_for_update()
             .first()
         )
 
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found")
 
+        if vehicle.sold_at is not None:
+            self.rollup.revert_sale(organization_id, vehicle.sold_at, vehicle.price)
+        # The listing stays on the day it was reported, the delete is a delisting of its own
+        deleted_at = datetime.now(timezone.utc)
+        self.db.add(
+            VehicleDeletion(
+                vehicle_id=vehicle.id,
+                organization_id=organization_id,
+                listed_at=vehicle.created_at,
+                deleted_at=deleted_at,
+            )
+        )
+        self.rollup.record_delisting(organization_id, deleted_at)
         self.db.delete(vehicle)
+        touch_organization(self.db, organization_id)
         self.db.commit()
 
         return
 
 
-def get_vehicles_service(db: Session = Depends(get_db)):
-    return VehiclesService(db)
+def get_vehicles_service(db: Union[Session, AsyncSession] = Depends(get_session)) -> AsyncService:
+    return AsyncService(VehiclesService, db)
@@ -1,14 +1,43 @@
+import time
+from typing import Union
+
 from fastapi import Request, Depends, HTTPException
 from jose import jwt, JWTError
 from app.config import config
-from app.database import get_db
+from app.database import get_session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.schemas import User
+from app.services.async_service import run_in_session
+from app.utilities.cache_utility import TTLCache, invalidate_on_commit
 
 ALGORITHM = "HS256"
 
+principal_cache = TTLCache("principals", config.AUTH_CACHE_SIZE, config.AUTH_CACHE_TTL)
+
+
+def _get_user_by_email(db: Session, email: str):
+    user = db.query(User).filter(User.email == email).first()
+
+    # Detach so the cached instance is not expired by later commits in this session
+    if user is not None:
+        db.expunge(user)
+
+    return user
+
+
+def invalidate_principal(user_id):
+    principal_cache.invalidate_where(lambda token, user: user.id == user_id)
+
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_principal(mapper, connection, target):
+    invalidate_on_commit(Session.object_session(target), invalidate_principal, target.id)
+
+
+async def get_current_user(request: Request, db: Union[Session, AsyncSession] = Depends(get_session)):
     token = request.cookies.get("access_token")
 
     if not token:
@@ -17,20 +46,35 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
             detail="Unauthorized",
         )
 
+    user = principal_cache.get(token)
+    if user is not None:
+        return user
+
     try:
         payload = jwt.decode(token, config.SECRET_KEY, algorithms=[ALGORITHM])
-        print(payload)
         user_email: int = payload.get("sub")
 
         if user_email is None:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        user = db.query(User).filter(User.email == user_email).first()
+        user = await run_in_session(db, _get_user_by_email, user_email)
 
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
 
+        # Never serve a cached principal past the token's own expiry
+        ttl = min(config.AUTH_CACHE_TTL, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            principal_cache.set(token, user, ttl=ttl)
+
         return user
 
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+
+async def get_admin_user(current_user: User = Depends(get_current_user)):
+    if current_user.email.lower() not in config.ADMIN_EMAILS:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    return current_user
@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+cache_registry: Dict[str, "TTLCache"] = {}
+
+PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+def invalidate_on_commit(session: Session, invalidate: Callable[..., None], *args):
+    # Mapper events fire at flush, before other transactions can see the change. Evicting
+    # right away would let a concurrent request cache the old row again for the whole TTL.
+    session.info.setdefault(PENDING_INVALIDATIONS, []).append((invalidate, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_invalidations(session: Session):
+    for invalidate, args in session.info.pop(PENDING_INVALIDATIONS, []):
+        invalidate(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_invalidations(session: Session):
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+class TTLCache:
+    def __init__(self, name: str, max_size: int, ttl: float):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_hits = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        cache_registry[name] = self
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]):
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Entries remember the version of the data they were computed from, and only match lookups
+# at that version. Versions are owned by the caller (e.g. organizations.data_version), so a
+# write in any process retires the entry everywhere. Between ttl and ttl + stale_ttl an entry
+# is still served, and the first lookup that sees it stale is asked to refresh it.
+class VersionedCache(TTLCache):
+    def __init__(self, name: str, max_size: int, ttl: float, stale_ttl: float):
+        super().__init__(name, max_size, ttl)
+        self.stale_ttl = stale_ttl
+        self._refreshing = set()
+
+    # Returns the cached value (or None) and whether to refresh it
+    def lookup(self, key: Hashable, version: int) -> Tuple[Optional[Any], bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+
+            if entry is None or entry[0] <= now or entry[1][0] != version:
+                # An entry from a newer version stays for the requests that already see it
+                if entry is not None and entry[1][0] <= version:
+                    del self._entries[key]
+                self.misses += 1
+                return None, False
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _, fresh_until, value = entry[1]
+
+            if fresh_until > now:
+                return value, False
+
+            self.stale_hits += 1
+            refresh = key not in self._refreshing
+            self._refreshing.add(key)
+            return value, refresh
+
+    def store(self, key: Hashable, version: int, value: Any):
+        if self.max_size <= 0:
+            return
+
+        now = time.monotonic()
+
+        with self._lock:
+            # A slow computation must not replace a value computed from newer data
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1][0] > version:
+                return
+
+            self._entries[key] = (now + self.ttl + self.stale_ttl, (version, now + self.ttl, value))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def refresh_done(self, key: Hashable):
+        with self._lock:
+            self._refreshing.discard(key)
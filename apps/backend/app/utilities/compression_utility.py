@@ -0,0 +1,247 @@
+import time
+import zlib
+from typing import Dict, Optional
+
+import brotli
+import zstandard
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Preferred first when the client accepts several with the same weight
+ENCODINGS = ["zstd", "br", "gzip"]
+
+# Highest level each codec supports, configured levels are capped to it
+MAX_LEVELS = {"zstd": 22, "br": 11, "gzip": 9}
+
+# Bodies and chunks larger than this are compressed on the threadpool instead of the event loop
+OFFLOAD_SIZE = 64 * 1024
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # Sync flush so every streamed chunk can be decoded as soon as it arrives
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self.compressor.process(data) + self.compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush()
+
+
+COMPRESSORS = {"zstd": _ZstdCompressor, "br": _BrotliCompressor, "gzip": _GzipCompressor}
+
+
+class EncodingMetrics:
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        self.level = level
+        self.responses = 0
+        self.streamed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.duration_total = 0.0
+
+
+class CompressionMetrics:
+    def __init__(self):
+        self.encodings: Dict[str, EncodingMetrics] = {}
+        # Responses sent as is: nothing acceptable, too small, already encoded or not compressible
+        self.skipped = 0
+
+
+compression_metrics = CompressionMetrics()
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, parameters = part.strip().partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                weight = float(parameter[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int, levels: Dict[str, int]):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {encoding: max(1, min(level, MAX_LEVELS[encoding])) for encoding, level in levels.items()}
+
+        for encoding, level in self.levels.items():
+            compression_metrics.encodings[encoding] = EncodingMetrics(encoding, level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if encoding not in self.levels:
+            encoding = None
+
+        responder = _CompressionResponder(
+            send, encoding, self.levels.get(encoding), self.minimum_size, request_headers.get("if-none-match", "")
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self, send: Send, encoding: Optional[str], level: Optional[int], minimum_size: int, if_none_match: str
+    ):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.if_none_match = if_none_match
+        self.start: Optional[Message] = None
+        self.compressor = None
+        self.metrics = compression_metrics.encodings.get(encoding)
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether the response is worth compressing
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._send_first(start, message)
+            return
+
+        if self.compressor is None:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        body = await self._compress(self.compressor.compress if more_body else self.compressor.finish, body)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _send_first(self, start: Message, message: Message):
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if start["status"] == 304:
+            # Carries the headers of the 200 it stands for, which was negotiated
+            headers.add_vary_header("Accept-Encoding")
+            if self._revalidates_encoded(headers):
+                # Same validator as the compressed 200 the client holds
+                self._weaken_etag(headers)
+        elif self._is_negotiable(headers):
+            # Even when this one is sent as is (too small, nothing acceptable), another client may get it compressed
+            headers.add_vary_header("Accept-Encoding")
+
+        if not self._should_compress(start["status"], headers, body, more_body):
+            compression_metrics.skipped += 1
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self.compressor = COMPRESSORS[self.encoding](self.level)
+        self.metrics.responses += 1
+
+        headers["Content-Encoding"] = self.encoding
+        # The compressed bytes are a different representation of the same resource
+        self._weaken_etag(headers)
+
+        if more_body:
+            self.metrics.streamed += 1
+            if "content-length" in headers:
+                del headers["content-length"]
+            body = await self._compress(self.compressor.compress, body)
+        else:
+            body = await self._compress(self.compressor.finish, body)
+            headers["Content-Length"] = str(len(body))
+
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if self.encoding is None or status < 200 or status in (204, 304):
+            return False
+
+        if not self._is_negotiable(headers):
+            return False
+
+        # Streamed bodies are compressed regardless of their first chunk
+        return more_body or len(body) >= self.minimum_size
+
+    # Whether the body would be compressed for a client that accepts it, size aside
+    def _is_negotiable(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+    # The client revalidates with the weak ETag only a compressed 200 carries
+    def _revalidates_encoded(self, headers: MutableHeaders) -> bool:
+        etag = headers.get("etag")
+        if not etag or etag.startswith("W/"):
+            return False
+
+        return f"W/{etag}" in (tag.strip() for tag in self.if_none_match.split(","))
+
+    def _weaken_etag(self, headers: MutableHeaders):
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def _compress(self, compress, body: bytes) -> bytes:
+        started = time.perf_counter()
+        if len(body) > OFFLOAD_SIZE:
+            compressed = await run_in_threadpool(compress, body)
+        else:
+            compressed = compress(body)
+
+        self.metrics.duration_total += time.perf_counter() - started
+        self.metrics.bytes_in += len(body)
+        self.metrics.bytes_out += len(compressed)
+        return compressed
@@ -0,0 +1,27 @@
+import csv
+import io
+from typing import List, Sequence
+
+from sqlalchemy.orm import Session
+from sqlalchemy.util.concurrency import await_only
+
+
+def copy_rows(db: Session, table_name: str, columns: List[str], rows: Sequence[tuple]):
+    # COPY ... FROM STDIN on the session's own connection, so it joins the current transaction
+    connection = db.connection().connection
+    driver_connection = connection.driver_connection
+
+    if db.get_bind().dialect.driver == "asyncpg":
+        # Inside AsyncSession.run_sync, so the coroutine can be awaited from this greenlet
+        await_only(driver_connection.copy_records_to_table(table_name, records=rows, columns=columns))
+        return
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+
+    with connection.dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
@@ -0,0 +1,58 @@
+import hashlib
+from typing import Any
+from uuid import UUID
+
+from fastapi import Request
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.schemas import DataVersion, Organization
+
+
+def touch_organization(db: Session, organization_id: UUID):
+    # Runs in the writer's transaction, so the version only moves once the change is visible.
+    # updated_at is kept, this is not a change to the organization itself
+    db.execute(
+        update(Organization)
+        .where(Organization.id == organization_id)
+        .values(data_version=Organization.data_version + 1, updated_at=Organization.updated_at)
+    )
+
+
+def get_organization_data_version(db: Session, organization_id: UUID) -> int:
+    return db.query(Organization.data_version).filter(Organization.id == organization_id).scalar()
+
+
+def touch_data_version(db: Session, name: str):
+    # Like touch_organization, for data shared by every organization. The row is created on first write
+    upsert = insert(DataVersion).values(name=name, version=1)
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[DataVersion.name],
+            set_={"version": DataVersion.version + 1},
+        )
+    )
+
+
+def get_data_version(db: Session, name: str) -> int:
+    return db.query(DataVersion.version).filter(DataVersion.name == name).scalar() or 0
+
+
+def make_etag(request: Request, *parts: Any) -> str:
+    # The same version can be rendered differently depending on the query string (fields, cursor, filters)
+    query = sorted(request.query_params.multi_items())
+    digest = hashlib.sha256(repr((request.url.path, query, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
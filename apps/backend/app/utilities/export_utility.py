@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, List, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from starlette.concurrency import run_in_threadpool
+
+from app.config import config
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.export_model import ExportFormat
+
+# Rows fetched per round trip from the server-side cursor, and written per response chunk
+EXPORT_BATCH_SIZE = 1000
+
+# Spreadsheets evaluate a cell starting with one of these as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+async def _stream_batches(statement: Select) -> AsyncIterator[Sequence[Any]]:
+    # The request's session is closed before a streaming body is sent, so exports use their own
+    statement = statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    if config.DATABASE_ASYNC:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(statement)
+            async for rows in result.partitions():
+                yield rows
+        return
+
+    db = SessionLocal()
+    try:
+        result = await run_in_threadpool(db.execute, statement)
+        partitions = result.partitions()
+        while True:
+            rows = await run_in_threadpool(next, partitions, None)
+            if rows is None:
+                break
+            yield rows
+    finally:
+        await run_in_threadpool(db.close)
+
+
+def _json_default(value: Any):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value: Any):
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    # User-entered text such as "=HYPERLINK(...)" is exported as text, not run as a formula
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def _encode(statement: Select, columns: List[str], format: ExportFormat) -> AsyncIterator[str]:
+    if format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # The header goes out before the query runs, so the client sees the first byte right away
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+        async for rows in _stream_batches(statement):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(value) for value in row] for row in rows)
+            yield buffer.getvalue()
+    else:
+        async for rows in _stream_batches(statement):
+            yield "".join(
+                json.dumps(dict(zip(columns, row)), default=_json_default) + "\n" for row in rows
+            )
+
+
+def export_response(statement: Select, columns: List[str], format: ExportFormat, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        _encode(statement, columns, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format.value}"'},
+    )
@@ -0,0 +1,17 @@
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+
+def parse_fields(fields: Optional[str], available: List[str]) -> List[str]:
+    if not fields:
+        return available
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested.difference(available))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    # The id is always returned so items can be told apart, in the same order as the full response
+    requested.add("id")
+    return [name for name in available if name in requested]
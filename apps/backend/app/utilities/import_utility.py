@@ -0,0 +1,202 @@
+import codecs
+import csv
+import json
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from app.models.import_model import ImportResult, ImportRowError
+
+IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+# Lines handed to the threadpool per parsing step
+PARSE_BATCH_LINES = 1000
+
+CSV_CONTENT_TYPES = ("text/csv",)
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Request bodies accepted by the import endpoints, for their OpenAPI description
+IMPORT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string"}},
+            "application/x-ndjson": {"schema": {"type": "string"}},
+        },
+    }
+}
+
+# (row number, parsed record or None, parse error or None)
+ImportRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+async def _read_lines(request: Request) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+class _CsvParser:
+    def __init__(self):
+        self.header = None
+        self.record_lines = []
+        self.quotes = 0
+        self.row = 0
+
+    def feed(self, lines: List[str]) -> List[ImportRow]:
+        rows = []
+
+        for line in lines:
+            # A quoted field may span lines, a record ends once its quotes are balanced
+            self.record_lines.append(line)
+            self.quotes += line.count('"')
+            if self.quotes % 2:
+                continue
+
+            values = next(csv.reader(["\n".join(self.record_lines)]), [])
+            self.record_lines = []
+            self.quotes = 0
+
+            if not any(value.strip() for value in values):
+                continue
+
+            if self.header is None:
+                self.header = [name.strip() for name in values]
+                continue
+
+            self.row += 1
+            if len(values) != len(self.header):
+                rows.append((self.row, None, f"Expected {len(self.header)} columns, got {len(values)}"))
+            else:
+                rows.append((self.row, dict(zip(self.header, values)), None))
+
+        return rows
+
+    def finish(self) -> List[ImportRow]:
+        if self.record_lines:
+            return [(self.row + 1, None, "Unterminated quoted field")]
+        return []
+
+
+class _NdjsonParser:
+    def __init__(self):
+        self.row = 0
+
+    def feed(self, lines: List[str]) -> List[ImportRow]:
+        rows = []
+
+        for line in lines:
+            if not line.strip():
+                continue
+
+            self.row += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                rows.append((self.row, None, "Invalid JSON"))
+                continue
+
+            if isinstance(record, dict):
+                rows.append((self.row, record, None))
+            else:
+                rows.append((self.row, None, "Expected a JSON object"))
+
+        return rows
+
+    def finish(self) -> List[ImportRow]:
+        return []
+
+
+async def _parse_rows(request: Request, parser) -> AsyncIterator[ImportRow]:
+    # The body is read on the event loop, parsing batches of lines is CPU-bound and runs on the threadpool
+    lines = []
+
+    async for line in _read_lines(request):
+        lines.append(line)
+        if len(lines) >= PARSE_BATCH_LINES:
+            for row in await run_in_threadpool(parser.feed, lines):
+                yield row
+            lines = []
+
+    for row in await run_in_threadpool(parser.feed, lines) + parser.finish():
+        yield row
+
+
+def read_import_rows(request: Request) -> AsyncIterator[ImportRow]:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in CSV_CONTENT_TYPES:
+        return _parse_rows(request, _CsvParser())
+    if content_type in NDJSON_CONTENT_TYPES:
+        return _parse_rows(request, _NdjsonParser())
+
+    raise HTTPException(status_code=415, detail="Expected a text/csv or application/x-ndjson body")
+
+
+def blank_to_none(record: dict) -> dict:
+    # CSV has no null, an empty cell stands for a missing optional value
+    return {key: None if value == "" else value for key, value in record.items()}
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+async def run_import(
+    rows: AsyncIterator[ImportRow],
+    import_chunk: Callable[[List[ImportRow]], Awaitable[Tuple[int, int, List[ImportRowError]]]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> ImportResult:
+    # import_chunk stores one chunk and returns (imported, updated, errors)
+    started_at = time.perf_counter()
+    received = 0
+    imported = 0
+    updated = 0
+    failed = 0
+    errors = []
+    chunk = []
+
+    async def flush():
+        nonlocal imported, updated, failed
+        chunk_imported, chunk_updated, chunk_errors = await import_chunk(chunk)
+        imported += chunk_imported
+        updated += chunk_updated
+        failed += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+        chunk.clear()
+
+    async for row in rows:
+        received += 1
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            await flush()
+
+    if chunk:
+        await flush()
+
+    duration = time.perf_counter() - started_at
+
+    return ImportResult(
+        received=received,
+        imported=imported,
+        updated=updated,
+        failed=failed,
+        errors=errors,
+        duration_seconds=duration,
+        rows_per_second=received / duration if duration > 0 else 0.0,
+    )
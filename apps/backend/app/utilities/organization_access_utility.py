@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.schemas import Organization, User
+from app.utilities.cache_utility import TTLCache, invalidate_on_commit
+
+# Only granted (user_id, organization_id) pairs are cached
+organization_access_cache = TTLCache(
+    "organization_access", config.ORGANIZATION_ACCESS_CACHE_SIZE, config.ORGANIZATION_ACCESS_CACHE_TTL
+)
+
+
+def check_organization_access(db: Session, organization_id: UUID, current_user: User):
+    key = (current_user.id, organization_id)
+
+    if organization_access_cache.get(key):
+        return
+
+    organization = (
+        db.query(Organization.id)
+        .filter(
+            Organization.id == organization_id,
+            Organization.created_by_id == current_user.id,
+        )
+        .first()
+    )
+
+    if not organization:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    organization_access_cache.set(key, True)
+
+
+def invalidate_organization_access(organization_id: UUID):
+    organization_access_cache.invalidate_where(lambda key, _: key[1] == organization_id)
+
+
+@event.listens_for(Organization, "after_insert")
+@event.listens_for(Organization, "after_update")
+@event.listens_for(Organization, "after_delete")
+def _invalidate_changed_organization(mapper, connection, target):
+    invalidate_on_commit(Session.object_session(target), invalidate_organization_access, target.id)
@@ -0,0 +1,145 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import ColumnElement
+
+from app.models.pagination_model import MAX_PAGE_SIZE, CursorPage, CursorParams
+
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    payload = {
+        "s": sort,
+        "v": [_serialize(value) for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, columns: List[ColumnElement]) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+
+        if payload["s"] != sort or len(values) != len(columns):
+            raise ValueError("Cursor does not match the requested sort")
+
+        return [_deserialize(value, column) for value, column in zip(values, columns)]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class CursorPaginator:
+    def __init__(
+        self,
+        sort_columns: Dict[str, ColumnElement],
+        id_column: ColumnElement,
+        default_sort: str,
+        default_descending: bool = False,
+        max_size: int = MAX_PAGE_SIZE,
+    ):
+        self.sort_columns = sort_columns
+        self.id_column = id_column
+        self.default_sort = default_sort
+        self.default_descending = default_descending
+        self.max_size = max_size
+
+    def paginate(
+        self,
+        query: Query,
+        params: CursorParams,
+        sort: Optional[str] = None,
+        descending: Optional[bool] = None,
+        sort_column: Optional[ColumnElement] = None,
+    ) -> CursorPage:
+        sort = sort or self.default_sort
+        # Request dependent expressions (e.g. a search rank) are passed explicitly
+        if sort_column is None:
+            sort_column = self.sort_columns[sort]
+        id_column = self.id_column
+        # Column projections page as plain dicts, entity queries as the entities themselves
+        descriptions = query.column_descriptions
+        columns = [description["name"] for description in descriptions]
+        width = len(columns)
+        is_entity = width == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+        size = min(params.size, self.max_size)
+
+        if descending is None:
+            descending = self.default_descending
+
+        total_query = None
+        if params.include_total:
+            total_query = select(func.count()).select_from(query.order_by(None).subquery())
+
+        if params.cursor:
+            last_sort_value, last_id = decode_cursor(
+                params.cursor, sort, [sort_column, id_column]
+            )
+            position = tuple_(sort_column, id_column)
+            last_position = tuple_(last_sort_value, last_id)
+            query = query.filter(
+                position < last_position if descending else position > last_position
+            )
+
+        if descending:
+            query = query.order_by(sort_column.desc(), id_column.desc())
+        else:
+            query = query.order_by(sort_column.asc(), id_column.asc())
+
+        query = query.add_columns(sort_column, id_column)
+        if total_query is not None:
+            query = query.add_columns(total_query.scalar_subquery())
+
+        rows = query.limit(size + 1).all()
+        has_more = len(rows) > size
+        rows = rows[:size]
+
+        total = None
+        if total_query is not None:
+            total = rows[0][-1] if rows else query.session.execute(total_query).scalar()
+
+        next_cursor = None
+        if has_more:
+            last_row = rows[-1]
+            next_cursor = encode_cursor(sort, [last_row[width], last_row[width + 1]])
+
+        if is_entity:
+            items = [row[0] for row in rows]
+        else:
+            items = [dict(zip(columns, row[:width])) for row in rows]
+
+        return CursorPage(
+            items=items,
+            size=size,
+            next_cursor=next_cursor,
+            total=total,
+        )
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _deserialize(value: Any, column: ColumnElement) -> Optional[Any]:
+    if value is None:
+        return None
+
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if issubclass(python_type, UUID):
+        return UUID(value)
+    return python_type(value)
@@ -0,0 +1,126 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from anyio import to_thread
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from app.config import config
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.duration_total = 0.0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash_password, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(_verify_password, password, hashed_password)
+
+    @property
+    def queued(self) -> int:
+        return max(self.in_flight - self.workers, 0)
+
+    def limit_pending(self, capacity: int):
+        self.max_pending = max(min(self.max_pending, capacity), 1)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, fn, *args):
+        # Admission control: reject instead of queueing without bound
+        with self._lock:
+            if self.in_flight >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent password operations, please retry",
+                    headers={"Retry-After": "1"},
+                )
+
+            self.in_flight += 1
+
+        start = time.perf_counter()
+        try:
+            try:
+                return self._submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died, e.g. killed for memory; later calls get a fresh pool
+                return self._submit(fn, *args)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+                self.duration_total += time.perf_counter() - start
+
+    def _submit(self, fn, *args):
+        with self._lock:
+            executor = self._get_executor()
+
+        try:
+            return self._wait(executor.submit(fn, *args))
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers do not inherit the threads of the server process
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._executor
+
+    def _wait(self, future: Future):
+        # Inside an AsyncSession.run_sync greenlet, yield to the event loop
+        # instead of blocking it; on the threadpool, block this thread only
+        if in_greenlet():
+            return await_only(asyncio.wrap_future(future))
+
+        return future.result()
+
+
+def pending_capacity() -> int:
+    # Half of the connections, and in sync mode of the threadpool threads a waiting call
+    # holds, stay free for other requests. Must be called from the event loop
+    capacity = (config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW) // 2
+    if not config.DATABASE_ASYNC:
+        capacity = min(capacity, int(to_thread.current_default_thread_limiter().total_tokens) // 2)
+
+    return capacity
+
+
+password_hasher = PasswordHasher(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_MAX_PENDING)
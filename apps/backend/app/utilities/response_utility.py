@@ -0,0 +1,50 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.utilities.etag_utility import is_not_modified
+
+# UTC datetimes end in "Z", the same as pydantic's own serializer
+JSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any):
+    # Response models are shallow, nested models come back through here
+    if isinstance(value, BaseModel):
+        return dict(value)
+    # asyncpg returns its own UUID subclass, which orjson does not pick up natively
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+
+def json_response(content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    # Returning a Response skips FastAPI's validation and encoding against the response_model,
+    # which is then only used for the OpenAPI schema
+    return Response(content=dumps(content), status_code=status_code, headers=headers, media_type="application/json")
+
+
+async def threadpool_json_response(
+    content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    # Controllers are async, rendering a large body in them would block the event loop
+    return await run_in_threadpool(json_response, content, status_code, headers)
+
+
+async def conditional_json_response(request: Request, etag: str, load: Callable[[], Awaitable[Any]]) -> Response:
+    # Clients may keep the response but have to revalidate it on every use
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return await threadpool_json_response(await load(), headers=headers)
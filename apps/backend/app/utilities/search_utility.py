@@ -0,0 +1,36 @@
+import re
+
+LIKE_ESCAPE = "\\"
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+PHONE_PATTERN = re.compile(r"^\+?[\d\s\-().]+$")
+MIN_PHONE_DIGITS = 3
+
+
+def escape_like(term: str) -> str:
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def normalize_phone(phone: str) -> str:
+    # E.164 digits: drop formatting and the international "00" prefix
+    digits = re.sub(r"[^0-9]", "", phone)
+    return re.sub(r"^00", "", digits)
+
+
+def looks_like_email(term: str) -> bool:
+    return EMAIL_PATTERN.match(term) is not None
+
+
+def looks_like_phone(term: str) -> bool:
+    return (
+        PHONE_PATTERN.match(term) is not None
+        and len(normalize_phone(term)) >= MIN_PHONE_DIGITS
+    )
@@ -0,0 +1,244 @@
+import functools
+import random
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterator, List, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.vehicle_model import FuelType
+from app.schemas import Brand, Organization, User
+from app.services.brands_service import BRANDS_DATA_VERSION
+from app.services.statistics_rollup_service import StatisticsRollupService
+from app.utilities.copy_utility import copy_rows
+from app.utilities.etag_utility import touch_data_version
+from app.utilities.password_utility import pwd_context
+
+# Rows generated and sent per COPY
+SEED_CHUNK_SIZE = 50000
+
+# Seeded data spans this many days back from the start of the as-of day
+SEED_HISTORY_DAYS = 730
+
+# Default as-of day. Fixed, so the same arguments produce the same rows whenever they run
+SEED_AS_OF = date(2026, 10, 1)
+
+SEED_BRANDS = ["Toyota", "Volkswagen", "Ford", "BMW", "Skoda", "Audi", "Kia", "Hyundai", "Renault", "Tesla"]
+SEED_MODELS = ["Corolla", "Golf", "Focus", "Octavia", "Sportage", "Model 3", "Clio", "Tucson", "A4", "X3"]
+SEED_COLORS = ["Red", "Black", "White", "Silver", "Blue", None]
+SEED_FIRST_NAMES = ["John", "Anna", "Piotr", "Maria", "Tom", "Ewa", "Lukas", "Sofia", "Jan", "Eva"]
+SEED_LAST_NAMES = ["Doe", "Nowak", "Smith", "Kowalski", "Muller", "Novak", "Garcia", "Lee", "Brown", "Wood"]
+
+CUSTOMER_COLUMNS = [
+    "id", "first_name", "last_name", "email", "phone", "organization_id", "created_at", "created_by_id", "updated_at",
+]
+VEHICLE_COLUMNS = [
+    "id", "registration_number", "vin_number", "is_new", "kms_driven", "brand_id", "organization_id", "model",
+    "model_year", "fuel_type", "color", "description", "price", "first_registration", "sold_to_id", "sold_at",
+    "created_at", "created_by_id", "updated_at",
+]
+
+
+def seed_uuid(rng: random.Random) -> UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=timezone.utc)
+
+
+@functools.lru_cache
+def _password_hash(password: str) -> str:
+    # bcrypt is slow on purpose, seeded users share one hash per password
+    return pwd_context.hash(password)
+
+
+def seed_user(db: Session, email: str, password: str) -> UUID:
+    user = db.query(User).filter(User.email == email).first()
+
+    if user is None:
+        user = User(email=email, password=_password_hash(password), firstname="Seed", lastname="User")
+        db.add(user)
+        db.commit()
+
+    return user.id
+
+
+def seed_brands(db: Session, user_id: UUID) -> List[UUID]:
+    brands = {brand.name: brand.id for brand in db.query(Brand).filter(Brand.created_by_id == user_id)}
+
+    for name in SEED_BRANDS:
+        if name not in brands:
+            brand = Brand(name=name, created_by_id=user_id)
+            db.add(brand)
+            db.flush()
+            brands[name] = brand.id
+            touch_data_version(db, BRANDS_DATA_VERSION)
+
+    db.commit()
+    return [brands[name] for name in SEED_BRANDS]
+
+
+def seed_organization(
+    db: Session,
+    rng: random.Random,
+    user_id: UUID,
+    brand_ids: Sequence[UUID],
+    name: str,
+    vehicles: int,
+    customers: int,
+    as_of: date = SEED_AS_OF,
+) -> UUID:
+    organization_id = seed_uuid(rng)
+
+    # Seeding is deterministic, so an organization that exists already holds the same rows
+    if db.get(Organization, organization_id) is not None:
+        return organization_id
+
+    db.add(Organization(id=organization_id, name=name, email=f"{organization_id.hex[:12]}@example.com", created_by_id=user_id))
+    db.flush()
+
+    end = _start_of(as_of)
+    customer_ids = []
+    for rows in _chunks(_customer_rows(rng, organization_id, user_id, customers, end)):
+        customer_ids.extend(row[0] for row in rows)
+        copy_rows(db, "customers", CUSTOMER_COLUMNS, rows)
+
+    for rows in _chunks(_vehicle_rows(rng, organization_id, user_id, brand_ids, customer_ids, vehicles, end)):
+        copy_rows(db, "vehicles", VEHICLE_COLUMNS, rows)
+
+    db.commit()
+    StatisticsRollupService(db).rebuild(organization_id)
+
+    return organization_id
+
+
+def tenant_sizes(count: int, total: int, skew: float) -> List[int]:
+    # Zipf-like: a few large dealers and a long tail of small ones, like production tenants
+    weights = [1 / rank ** skew for rank in range(1, count + 1)]
+    scale = total / sum(weights)
+    sizes = [int(weight * scale) for weight in weights]
+    sizes[0] += total - sum(sizes)
+    return sizes
+
+
+def seed_tenants(
+    db: Session,
+    seed: int,
+    organizations: int,
+    vehicles: int,
+    customers: int,
+    skew: float,
+    password: str,
+    as_of: date = SEED_AS_OF,
+) -> List[Dict]:
+    tenants = []
+    brand_ids = None
+
+    for index, (vehicle_count, customer_count) in enumerate(
+        zip(tenant_sizes(organizations, vehicles, skew), tenant_sizes(organizations, customers, skew))
+    ):
+        email = f"tenant-{seed}-{index}@example.com"
+        user_id = seed_user(db, email, password)
+        # Brands are global, the first tenant's are shared by everyone
+        if brand_ids is None:
+            brand_ids = seed_brands(db, user_id)
+
+        organization_id = seed_organization(
+            db,
+            random.Random(f"{seed}-tenant-{index}"),
+            user_id,
+            brand_ids,
+            f"Tenant {index}",
+            vehicle_count,
+            customer_count,
+            as_of,
+        )
+        tenants.append(
+            {
+                "email": email,
+                "password": password,
+                "organization_id": str(organization_id),
+                "vehicles": vehicle_count,
+                "customers": customer_count,
+            }
+        )
+
+    return tenants
+
+
+def _chunks(rows: Iterator[tuple]) -> Iterator[List[tuple]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == SEED_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _customer_rows(rng: random.Random, organization_id: UUID, user_id: UUID, count: int, end: datetime):
+    prefix = organization_id.hex[:8]
+
+    for index in range(count):
+        created_at = end - timedelta(seconds=rng.randrange(SEED_HISTORY_DAYS * 86400))
+        first_name = rng.choice(SEED_FIRST_NAMES)
+        last_name = rng.choice(SEED_LAST_NAMES)
+        yield (
+            seed_uuid(rng),
+            first_name,
+            last_name,
+            f"{first_name.lower()}.{last_name.lower()}.{prefix}.{index}@example.com",
+            f"+48 {rng.randrange(500, 800)}-{rng.randrange(1000):03d}-{rng.randrange(1000):03d}",
+            organization_id,
+            created_at,
+            user_id,
+            created_at,
+        )
+
+
+def _vehicle_rows(
+    rng: random.Random,
+    organization_id: UUID,
+    user_id: UUID,
+    brand_ids: Sequence[UUID],
+    customer_ids: Sequence[UUID],
+    count: int,
+    end: datetime,
+):
+    prefix = organization_id.hex[:8].upper()
+    fuel_types = [fuel_type.value for fuel_type in FuelType]
+
+    for index in range(count):
+        created_at = end - timedelta(seconds=rng.randrange(SEED_HISTORY_DAYS * 86400))
+        model_year = rng.randrange(2005, end.year + 1)
+
+        # About a third of the stock is sold, some time between listing and the as-of day
+        sold_to_id, sold_at = None, None
+        if customer_ids and rng.random() < 0.35:
+            sold_to_id = rng.choice(customer_ids)
+            sold_at = created_at + (end - created_at) * rng.random()
+
+        yield (
+            seed_uuid(rng),
+            f"{prefix[:3]}{index:07d}",
+            f"{prefix}{index:09d}",
+            model_year == end.year,
+            0 if model_year == end.year else rng.randrange(1000, 300000),
+            rng.choice(brand_ids),
+            organization_id,
+            rng.choice(SEED_MODELS),
+            model_year,
+            rng.choice(fuel_types),
+            rng.choice(SEED_COLORS),
+            None if rng.random() < 0.5 else "Well maintained vehicle with all service records available.",
+            round(rng.uniform(2000, 120000), 2),
+            created_at.date() - timedelta(days=rng.randrange(0, 3650)),
+            sold_to_id,
+            sold_at,
+            created_at,
+            user_id,
+            sold_at or created_at,
+        )
@@ -0,0 +1,10 @@
+from app.config import config
+from app.utilities.cache_utility import VersionedCache
+
+# Computed dashboards keyed by (organization_id, *time series window), at the organization's data_version
+dashboard_cache = VersionedCache(
+    "dashboard_statistics",
+    config.DASHBOARD_CACHE_SIZE,
+    config.DASHBOARD_CACHE_TTL,
+    config.DASHBOARD_CACHE_STALE_TTL,
+)
@@ -20,6 +20,7 @@ const CustomersTable = () => {
     setData,
     pagination,
     setPagination,
+    pageCount,
     localSearchTerm,
     handleSearchChange,
     handleSearchClear,
@@ -47,7 +48,7 @@ const CustomersTable = () => {
       pagination,
     },
     manualPagination: true,
-    pageCount: totalPages,
+    pageCount,
   });
 
   const selectedRowsCount = table.getSelectedRowModel().rows.length;
@@ -1,44 +1,23 @@
 'use client';
 
-import { useCallback, useEffect, useState } from 'react';
+import { useCallback, useEffect, useMemo, useState } from 'react';
 import { useParams } from 'next/navigation';
 import { useDebounce } from 'use-debounce';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
-import { useQueryState, parseAsInteger, parseAsString } from 'nuqs';
+import { useQueryState, parseAsString } from 'nuqs';
 import { Customer } from './columns';
 import { client } from '@/lib/openapi-fetch';
-import { PaginationState } from '@tanstack/react-table';
+import { useCursorPagination } from '@/hooks/use-cursor-pagination';
+
+interface CustomersPage {
+  items: Customer[];
+  next_cursor?: string | null;
+}
 
 export const useCustomersData = () => {
   const params = useParams<{ organizationId: string }>();
   const organizationId = params.organizationId;
 
-  const [pageIndex, setPageIndex] = useQueryState(
-    'page',
-    parseAsInteger.withDefault(0)
-  );
-  const [pageSize, setPageSize] = useQueryState(
-    'size',
-    parseAsInteger.withDefault(10)
-  );
-
-  const pagination: PaginationState = {
-    pageIndex: pageIndex,
-    pageSize: pageSize,
-  };
-
-  const setPagination = useCallback(
-    (
-      updater: PaginationState | ((state: PaginationState) => PaginationState)
-    ) => {
-      const newPagination =
-        typeof updater === 'function' ? updater(pagination) : updater;
-      setPageIndex(newPagination.pageIndex);
-      setPageSize(newPagination.pageSize);
-    },
-    [pagination, setPageIndex, setPageSize]
-  );
-
   const [searchTerm, setSearchTerm] = useQueryState(
     'search',
     parseAsString.withDefault('')
@@ -54,18 +33,30 @@ export const useCustomersData = () => {
     setLocalSearchTerm(searchTerm);
   }, [searchTerm]);
 
-  const [total, setTotal] = useState(0);
-  const [totalPages, setTotalPages] = useState(1);
+  const {
+    cursor,
+    includeTotal,
+    pagination,
+    getPaginationHandler,
+    total,
+    setTotal,
+    totalPages,
+  } = useCursorPagination([organizationId, searchTerm].join('|'));
+  const pageSize = pagination.pageSize;
 
   const customersQuery = useQuery({
-    queryKey: ['customers', organizationId, pageIndex, pageSize, searchTerm],
+    queryKey: ['customers', organizationId, cursor, pageSize, searchTerm],
     refetchOnMount: 'always',
-    queryFn: async () => {
+    queryFn: async (): Promise<CustomersPage> => {
       const queryParams: Record<string, string> = {
-        page: String(pageIndex + 1),
         size: String(pageSize),
+        include_total: String(includeTotal),
       };
 
+      if (cursor) {
+        queryParams.cursor = cursor;
+      }
+
       if (searchTerm) {
         queryParams.search = searchTerm;
       }
@@ -86,34 +77,33 @@ export const useCustomersData = () => {
         throw new Error('Failed to fetch data');
       }
 
-      // Simulate paginated response if the backend doesn't support it yet
-      const paginatedData = {
-        items: data,
-        total: data.length,
-        page: pageIndex + 1,
-        size: pageSize,
-        pages: Math.ceil(data.length / pageSize) || 1,
-      };
-
-      setTotal(paginatedData.total);
-      setTotalPages(paginatedData.pages);
+      if (data.total !== null && data.total !== undefined) {
+        setTotal(data.total);
+      }
 
-      return paginatedData.items || [];
+      return { items: data.items, next_cursor: data.next_cursor };
     },
   });
 
-  const data = customersQuery.data || [];
+  const nextCursor = customersQuery.data?.next_cursor;
+  const data = useMemo(
+    () => customersQuery.data?.items || [],
+    [customersQuery.data]
+  );
   const isLoading = customersQuery.isLoading;
   const queryClient = useQueryClient();
 
   const setData = useCallback(
     (newData: Customer[] | ((prev: Customer[]) => Customer[])) => {
-      queryClient.setQueryData(
-        ['customers', organizationId, pageIndex, pageSize, searchTerm],
-        typeof newData === 'function' ? newData(data) : newData
+      queryClient.setQueryData<CustomersPage>(
+        ['customers', organizationId, cursor, pageSize, searchTerm],
+        (page) => ({
+          next_cursor: page?.next_cursor,
+          items: typeof newData === 'function' ? newData(data) : newData,
+        })
       );
     },
-    [queryClient, data, organizationId, pageIndex, pageSize, searchTerm]
+    [queryClient, data, organizationId, cursor, pageSize, searchTerm]
   );
 
   const deleteRowsMutation = useMutation({
@@ -132,7 +122,11 @@ export const useCustomersData = () => {
     isLoading,
     setData,
     pagination,
-    setPagination,
+    setPagination: getPaginationHandler(nextCursor),
+    // Only the next page is known with cursors
+    pageCount: nextCursor
+      ? pagination.pageIndex + 2
+      : pagination.pageIndex + 1,
     localSearchTerm,
     setLocalSearchTerm,
     handleSearchChange: (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -6,6 +6,7 @@ import { Button } from '@/components/ui/button';
 import { useMutation, useQuery } from '@tanstack/react-query';
 
 import { client } from '@/lib/openapi-fetch';
+import { fetchAllPages, MAX_PAGE_SIZE } from '@/lib/pagination';
 
 export const OrganizationList = () => {
   const {
@@ -15,13 +16,17 @@ export const OrganizationList = () => {
   } = useQuery({
     queryKey: ['organizations'],
     queryFn: async () => {
-      const { response, data } = await client.GET('/organizations/');
+      return fetchAllPages(async (cursor) => {
+        const { response, data } = await client.GET('/organizations/', {
+          params: { query: { cursor, size: MAX_PAGE_SIZE } },
+        });
 
-      if (response.status !== 200 || !data) {
-        throw new Error('Failed to fetch organizations');
-      }
+        if (response.status !== 200 || !data) {
+          throw new Error('Failed to fetch organizations');
+        }
 
-      return data;
+        return data;
+      });
     },
     enabled: true,
   });
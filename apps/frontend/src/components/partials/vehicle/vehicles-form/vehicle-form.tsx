@@ -10,6 +10,7 @@ import { FormField } from '../../../ui/form-field';
 import { VehicleFormValues, vehicleSchema } from '@/schemas/vehicle';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { client } from '@/lib/openapi-fetch';
+import { fetchAllPages, MAX_PAGE_SIZE } from '@/lib/pagination';
 import { Loader2 } from 'lucide-react';
 import { SchemaVehicleCreate } from '@/types/__generated__/openapi';
 
@@ -41,13 +42,19 @@ const VehicleForm = () => {
   const brandOptions = useQuery({
     queryKey: ['brand-values'],
     queryFn: async () => {
-      const { response, data } = await client.GET('/brands/');
+      const brands = await fetchAllPages(async (cursor) => {
+        const { response, data } = await client.GET('/brands/', {
+          params: { query: { cursor, size: MAX_PAGE_SIZE } },
+        });
 
-      if (response.status !== 200 || !data) {
-        throw new Error('Failed to fetch brands');
-      }
+        if (response.status !== 200 || !data) {
+          throw new Error('Failed to fetch brands');
+        }
+
+        return data;
+      });
 
-      return data.map((brand) => ({ value: brand.id, label: brand.name }));
+      return brands.map((brand) => ({ value: brand.id, label: brand.name }));
     },
   });
 
@@ -8,6 +8,7 @@ import { useRef, useState, useTransition } from 'react';
 import { useParams, useRouter } from 'next/navigation';
 import { useMutation, useQuery } from '@tanstack/react-query';
 import { client } from '@/lib/openapi-fetch';
+import { MAX_PAGE_SIZE } from '@/lib/pagination';
 import {
   DropdownMenu,
   DropdownMenuContent,
@@ -258,7 +259,10 @@ function CustomerSelectDialog({
   const { data: customers = [], isLoading } = useQuery({
     queryKey: ['customers', organizationId, searchTerm],
     queryFn: async () => {
-      const queryParams: Record<string, string> = {};
+      // Searchable, so the first page of matches is enough
+      const queryParams: Record<string, string> = {
+        size: String(MAX_PAGE_SIZE),
+      };
 
       if (searchTerm) {
         queryParams.search = searchTerm;
@@ -280,7 +284,7 @@ function CustomerSelectDialog({
         throw new Error('Failed to fetch customers');
       }
 
-      return data as Customer[];
+      return data.items as Customer[];
     },
   });
 
@@ -37,7 +37,6 @@ import {
   flexRender,
   getCoreRowModel,
   getPaginationRowModel,
-  PaginationState,
   useReactTable,
 } from '@tanstack/react-table';
 import {
@@ -47,31 +46,23 @@ import {
   RiFilter3Line,
   RiSearch2Line,
 } from '@remixicon/react';
-import {
-  useCallback,
-  useEffect,
-  useId,
-  useMemo,
-  useRef,
-  useState,
-} from 'react';
+import { useCallback, useEffect, useId, useMemo, useRef, useState } from 'react';
 import { client } from '@/lib/openapi-fetch';
 import { useParams } from 'next/navigation';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
-import { useQueryState, parseAsInteger, parseAsString } from 'nuqs';
+import { useQueryState, parseAsString } from 'nuqs';
 import { useDebounce } from 'use-debounce';
 import {
   getColumns,
   Vehicle,
   Customer,
 } from '@/components/partials/vehicle/vehicles-table/columns';
+import { useCursorPagination } from '@/hooks/use-cursor-pagination';
+import { fetchAllPages, MAX_PAGE_SIZE } from '@/lib/pagination';
 
-interface PaginatedVehicleResponse {
+interface VehiclesPage {
   items: Vehicle[];
-  total: number;
-  page: number;
-  size: number;
-  pages: number;
+  next_cursor?: string | null;
 }
 
 const VehiclesTable = () => {
@@ -79,32 +70,6 @@ const VehiclesTable = () => {
   const params = useParams<{ organizationId: string }>();
   const organizationId = params.organizationId;
 
-  const [pageIndex, setPageIndex] = useQueryState(
-    'page',
-    parseAsInteger.withDefault(0)
-  );
-  const [pageSize, setPageSize] = useQueryState(
-    'size',
-    parseAsInteger.withDefault(10)
-  );
-
-  const pagination: PaginationState = {
-    pageIndex: pageIndex,
-    pageSize: pageSize,
-  };
-
-  const setPagination = useCallback(
-    (
-      updater: PaginationState | ((state: PaginationState) => PaginationState)
-    ) => {
-      const newPagination =
-        typeof updater === 'function' ? updater(pagination) : updater;
-      setPageIndex(newPagination.pageIndex);
-      setPageSize(newPagination.pageSize);
-    },
-    [pagination, setPageIndex, setPageSize]
-  );
-
   const [searchTerm, setSearchTerm] = useQueryState(
     'search',
     parseAsString.withDefault('')
@@ -130,21 +95,39 @@ const VehiclesTable = () => {
     parseAsString.withDefault('')
   );
 
-  const [total, setTotal] = useState(0);
-  const [totalPages, setTotalPages] = useState(1);
+  const {
+    cursor,
+    includeTotal,
+    pagination,
+    getPaginationHandler,
+    total,
+    setTotal,
+    totalPages,
+  } = useCursorPagination(
+    [organizationId, searchTerm, vehicleStatus, saleStatus].join('|')
+  );
+  const pageIndex = pagination.pageIndex;
+  const pageSize = pagination.pageSize;
+
   const inputRef = useRef<HTMLInputElement>(null);
 
   const brandsQuery = useQuery({
     queryKey: ['brands'],
     queryFn: async () => {
-      const { response, data } = await client.GET('/brands/');
+      const brandList = await fetchAllPages(async (cursor) => {
+        const { response, data } = await client.GET('/brands/', {
+          params: { query: { cursor, size: MAX_PAGE_SIZE } },
+        });
 
-      if (response.status !== 200 || !data) {
-        throw new Error('Failed to fetch brands');
-      }
+        if (response.status !== 200 || !data) {
+          throw new Error('Failed to fetch brands');
+        }
+
+        return data;
+      });
 
       const brandMap: Record<string, string> = {};
-      data.forEach((brand) => {
+      brandList.forEach((brand) => {
         brandMap[brand.id] = brand.name;
       });
 
@@ -152,55 +135,27 @@ const VehiclesTable = () => {
     },
   });
 
-  const customersQuery = useQuery({
-    queryKey: ['customers', organizationId],
-    queryFn: async () => {
-      const { response, data } = await client.GET(
-        '/organizations/{organization_id}/customers/',
-        {
-          params: {
-            path: {
-              organization_id: organizationId,
-            },
-          },
-        }
-      );
-
-      if (response.status !== 200 || !data) {
-        throw new Error('Failed to fetch customers');
-      }
-
-      const customerMap: Record<string, string> = {};
-      data.forEach((customer: Customer) => {
-        customerMap[
-          customer.id
-        ] = `${customer.first_name} ${customer.last_name}`;
-      });
-
-      return customerMap;
-    },
-  });
-
-  const brands = brandsQuery.data || {};
-  const customers = customersQuery.data || {};
-
   const vehiclesQuery = useQuery({
     queryKey: [
       'vehicles',
       organizationId,
-      pageIndex,
+      cursor,
       pageSize,
       searchTerm,
       vehicleStatus,
       saleStatus,
     ],
     refetchOnMount: 'always',
-    queryFn: async () => {
+    queryFn: async (): Promise<VehiclesPage> => {
       const queryParams: Record<string, string> = {
-        page: (pageIndex + 1).toString(),
         size: pageSize.toString(),
+        include_total: includeTotal.toString(),
       };
 
+      if (cursor) {
+        queryParams.cursor = cursor;
+      }
+
       if (searchTerm) {
         queryParams.search = searchTerm;
       }
@@ -229,37 +184,99 @@ const VehiclesTable = () => {
         throw new Error('Failed to fetch data');
       }
 
-      const paginatedData = data as unknown as PaginatedVehicleResponse;
-      setTotal(paginatedData.total);
-      setTotalPages(paginatedData.pages);
-      return paginatedData.items || [];
+      if (data.total !== null && data.total !== undefined) {
+        setTotal(data.total);
+      }
+
+      return { items: data.items, next_cursor: data.next_cursor };
     },
   });
 
-  const data = vehiclesQuery.data || [];
+  const nextCursor = vehiclesQuery.data?.next_cursor;
+  const data = useMemo(
+    () => vehiclesQuery.data?.items || [],
+    [vehiclesQuery.data]
+  );
   const isLoading = vehiclesQuery.isLoading;
+
+  // Only the buyers of the vehicles on this page, not every customer
+  const buyerIds = useMemo(
+    () =>
+      Array.from(
+        new Set(
+          data
+            .map((vehicle) => vehicle.sold_to_id)
+            .filter((soldToId): soldToId is string => Boolean(soldToId))
+        )
+      ).sort(),
+    [data]
+  );
+
+  const customersQuery = useQuery({
+    queryKey: ['customer-names', organizationId, buyerIds],
+    enabled: buyerIds.length > 0,
+    queryFn: async () => {
+      const buyers = await Promise.all(
+        buyerIds.map(async (customerId) => {
+          const { response, data: customer } = await client.GET(
+            '/organizations/{organization_id}/customers/{customer_id}',
+            {
+              params: {
+                path: {
+                  organization_id: organizationId,
+                  customer_id: customerId,
+                },
+                query: { fields: 'first_name,last_name' },
+              },
+            }
+          );
+
+          if (response.status !== 200 || !customer) {
+            throw new Error('Failed to fetch customers');
+          }
+
+          return customer as Customer;
+        })
+      );
+
+      const customerMap: Record<string, string> = {};
+      buyers.forEach((customer) => {
+        customerMap[
+          customer.id
+        ] = `${customer.first_name} ${customer.last_name}`;
+      });
+
+      return customerMap;
+    },
+  });
+
+  const brands = brandsQuery.data || {};
+  const customers = customersQuery.data || {};
   const queryClient = useQueryClient();
 
   const setData = useCallback(
     (newData: Vehicle[] | ((prev: Vehicle[]) => Vehicle[])) => {
-      queryClient.setQueryData(
+      queryClient.setQueryData<VehiclesPage>(
         [
           'vehicles',
           organizationId,
-          pageIndex,
+          cursor,
           pageSize,
           searchTerm,
           vehicleStatus,
           saleStatus,
         ],
-        typeof newData === 'function' ? newData(data) : newData
+        (page) => ({
+          next_cursor: page?.next_cursor,
+          items: typeof newData === 'function' ? newData(data) : newData,
+        })
       );
     },
     [
       queryClient,
       data,
       organizationId,
-      pageIndex,
+      cursor,
       pageSize,
       searchTerm,
       vehicleStatus,
@@ -294,9 +311,10 @@ const VehiclesTable = () => {
     columns,
     getCoreRowModel: getCoreRowModel(),
     getPaginationRowModel: getPaginationRowModel(),
-    onPaginationChange: setPagination,
+    onPaginationChange: getPaginationHandler(nextCursor),
     manualPagination: true,
-    pageCount: totalPages,
+    // Only the next page is known with cursors
+    pageCount: nextCursor ? pageIndex + 2 : pageIndex + 1,
     state: {
       pagination,
     },
@@ -0,0 +1,60 @@
+import { useCallback, useEffect, useState } from 'react';
+import { PaginationState, Updater } from '@tanstack/react-table';
+import { useQueryState, parseAsInteger } from 'nuqs';
+
+/**
+ * Keeps the cursors of the pages visited so far, so a table can go back to
+ * earlier pages of a cursor paginated endpoint. Changing `resetKey` (the
+ * active filters) or the page size starts again from the first page.
+ */
+export const useCursorPagination = (resetKey: string) => {
+  const [pageSize, setPageSize] = useQueryState(
+    'size',
+    parseAsInteger.withDefault(10)
+  );
+  const [cursors, setCursors] = useState<(string | undefined)[]>([undefined]);
+  const [total, setTotal] = useState(0);
+
+  useEffect(() => {
+    setCursors([undefined]);
+  }, [resetKey, pageSize]);
+
+  const pageIndex = cursors.length - 1;
+
+  const pagination: PaginationState = {
+    pageIndex,
+    pageSize,
+  };
+
+  const getPaginationHandler = useCallback(
+    (nextCursor: string | null | undefined) =>
+      (updater: Updater<PaginationState>) => {
+        const newPagination =
+          typeof updater === 'function'
+            ? updater({ pageIndex, pageSize })
+            : updater;
+
+        if (newPagination.pageSize !== pageSize) {
+          setPageSize(newPagination.pageSize);
+        } else if (newPagination.pageIndex > pageIndex && nextCursor) {
+          setCursors((current) => [...current, nextCursor]);
+        } else if (newPagination.pageIndex < pageIndex) {
+          setCursors((current) =>
+            current.slice(0, Math.max(newPagination.pageIndex, 0) + 1)
+          );
+        }
+      },
+    [pageIndex, pageSize, setPageSize]
+  );
+
+  return {
+    cursor: cursors[pageIndex],
+    // The total costs a count query, it is only requested for the first page
+    includeTotal: pageIndex === 0,
+    pagination,
+    getPaginationHandler,
+    total,
+    setTotal,
+    totalPages: Math.max(Math.ceil(total / pageSize), pageIndex + 1),
+  };
+};
@@ -0,0 +1,28 @@
+/**
+ * Largest page size the API accepts for cursor paginated lists
+ */
+export const MAX_PAGE_SIZE = 100;
+
+interface CursorPage<T> {
+  items: T[];
+  next_cursor?: string | null;
+}
+
+/**
+ * Follows next_cursor until the last page and returns the items of all pages,
+ * for pickers and lookups that need the complete list
+ */
+export async function fetchAllPages<T>(
+  fetchPage: (cursor: string | undefined) => Promise<CursorPage<T>>
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | undefined;
+
+  do {
+    const page = await fetchPage(cursor);
+    items.push(...page.items);
+    cursor = page.next_cursor ?? undefined;
+  } while (cursor);
+
+  return items;
+}
@@ -91,6 +91,46 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/organizations/{organization_id}/vehicles/import": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Vehiclescontroller.Import Vehicles
+         * @description Bulk create vehicles from a CSV (with a header row) or NDJSON body. Rows are validated and stored in chunks, rejected rows are reported without aborting the import.
+         */
+        post: operations["VehiclesController_import_vehicles_organizations__organization_id__vehicles_import_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/organizations/{organization_id}/vehicles/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Vehiclescontroller.Export Vehicles
+         * @description Stream every vehicle matching the filters as CSV or NDJSON
+         */
+        get: operations["VehiclesController_export_vehicles_organizations__organization_id__vehicles_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/organizations/{organization_id}/vehicles/{vehicle_id}": {
         parameters: {
             query?: never;
@@ -110,6 +150,46 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/organizations/{organization_id}/vehicles/mark-as-sold": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Vehiclescontroller.Mark Vehicles As Sold
+         * @description Mark several vehicles as sold to one customer in a single update
+         */
+        post: operations["VehiclesController_mark_vehicles_as_sold_organizations__organization_id__vehicles_mark_as_sold_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/organizations/{organization_id}/vehicles/mark-as-unsold": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Vehiclescontroller.Mark Vehicles As Unsold
+         * @description Mark several vehicles as unsold in a single update
+         */
+        post: operations["VehiclesController_mark_vehicles_as_unsold_organizations__organization_id__vehicles_mark_as_unsold_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/organizations/{organization_id}/vehicles/{vehicle_id}/mark-as-sold": {
         parameters: {
             query?: never;
@@ -272,6 +352,46 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/organizations/{organization_id}/customers/import": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Customerscontroller.Import Customers
+         * @description Bulk create customers from a CSV (with a header row) or NDJSON body. Emails are deduplicated within the upload, customers whose email already exists are updated.
+         */
+        post: operations["CustomersController_import_customers_organizations__organization_id__customers_import_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/organizations/{organization_id}/customers/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Customerscontroller.Export Customers
+         * @description Stream every customer matching the search as CSV or NDJSON
+         */
+        get: operations["CustomersController_export_customers_organizations__organization_id__customers_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/organizations/{organization_id}/customers/{customer_id}": {
         parameters: {
             query?: never;
@@ -320,6 +440,86 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/admin/pool": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Admincontroller.Get Pool Statistics
+         * @description Get live database connection pool statistics
+         */
+        get: operations["AdminController_get_pool_statistics_admin_pool_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/admin/caches": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Admincontroller.Get Cache Statistics
+         * @description Get hit/miss statistics for the in-process caches
+         */
+        get: operations["AdminController_get_cache_statistics_admin_caches_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/admin/password-hasher": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Admincontroller.Get Password Hasher Statistics
+         * @description Get password hashing worker pool statistics
+         */
+        get: operations["AdminController_get_password_hasher_statistics_admin_password_hasher_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/admin/compression": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Admincontroller.Get Compression Statistics
+         * @description Get response compression cost and ratio per content encoding
+         */
+        get: operations["AdminController_get_compression_statistics_admin_compression_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
 }
 export type webhooks = Record<string, never>;
 export interface components {
@@ -352,6 +552,177 @@ export interface components {
              */
             created_at: string;
         };
+        /**
+         * CacheStatistics
+         * @description In-process cache statistics
+         */
+        CacheStatistics: {
+            /**
+             * Name
+             * @description Name of the cache
+             */
+            name: string;
+            /**
+             * Size
+             * @description Number of cached entries
+             */
+            size: number;
+            /**
+             * Max Size
+             * @description Maximum number of cached entries
+             */
+            max_size: number;
+            /**
+             * Ttl Seconds
+             * @description Default entry lifetime
+             */
+            ttl_seconds: number;
+            /**
+             * Hits
+             * @description Lookups served from the cache
+             */
+            hits: number;
+            /**
+             * Misses
+             * @description Lookups that missed or found an expired entry
+             */
+            misses: number;
+            /**
+             * Evictions
+             * @description Entries evicted to stay within max_size
+             */
+            evictions: number;
+            /**
+             * Stale Hits
+             * @description Hits served from an entry past its ttl while it was being refreshed
+             */
+            stale_hits: number;
+            /**
+             * Hit Rate
+             * @description Share of lookups served from the cache
+             */
+            hit_rate: number;
+        };
+        /**
+         * CompressionStatistics
+         * @description Response compression statistics
+         */
+        CompressionStatistics: {
+            /**
+             * Skipped
+             * @description Responses sent uncompressed: too small, not compressible or no acceptable encoding
+             */
+            skipped: number;
+            /**
+             * Encodings
+             * @description Statistics per content encoding
+             */
+            encodings: components["schemas"]["EncodingStatistics"][];
+        };
+        /**
+         * CursorPage[BrandResponse]
+         * @description Cursor paginated list of items
+         */
+        CursorPage_BrandResponse_: {
+            /**
+             * Items
+             * @description Items on this page
+             */
+            items: components["schemas"]["BrandResponse"][];
+            /**
+             * Size
+             * @description Requested page size
+             */
+            size: number;
+            /**
+             * Next Cursor
+             * @description Cursor for the next page, null when this is the last page
+             */
+            next_cursor?: string | null;
+            /**
+             * Total
+             * @description Total number of matching items, only set when include_total is requested
+             */
+            total?: number | null;
+        };
+        /**
+         * CursorPage[CustomerResponse]
+         * @description Cursor paginated list of items
+         */
+        CursorPage_CustomerResponse_: {
+            /**
+             * Items
+             * @description Items on this page
+             */
+            items: components["schemas"]["CustomerResponse"][];
+            /**
+             * Size
+             * @description Requested page size
+             */
+            size: number;
+            /**
+             * Next Cursor
+             * @description Cursor for the next page, null when this is the last page
+             */
+            next_cursor?: string | null;
+            /**
+             * Total
+             * @description Total number of matching items, only set when include_total is requested
+             */
+            total?: number | null;
+        };
+        /**
+         * CursorPage[OrganizationResponse]
+         * @description Cursor paginated list of items
+         */
+        CursorPage_OrganizationResponse_: {
+            /**
+             * Items
+             * @description Items on this page
+             */
+            items: components["schemas"]["OrganizationResponse"][];
+            /**
+             * Size
+             * @description Requested page size
+             */
+            size: number;
+            /**
+             * Next Cursor
+             * @description Cursor for the next page, null when this is the last page
+             */
+            next_cursor?: string | null;
+            /**
+             * Total
+             * @description Total number of matching items, only set when include_total is requested
+             */
+            total?: number | null;
+        };
+        /**
+         * CursorPage[VehicleResponse]
+         * @description Cursor paginated list of items
+         */
+        CursorPage_VehicleResponse_: {
+            /**
+             * Items
+             * @description Items on this page
+             */
+            items: components["schemas"]["VehicleResponse"][];
+            /**
+             * Size
+             * @description Requested page size
+             */
+            size: number;
+            /**
+             * Next Cursor
+             * @description Cursor for the next page, null when this is the last page
+             */
+            next_cursor?: string | null;
+            /**
+             * Total
+             * @description Total number of matching items, only set when include_total is requested
+             */
+            total?: number | null;
+        };
         /** CustomerCreate */
         CustomerCreate: {
             /**
@@ -440,18 +811,99 @@ export interface components {
             /** @description Customer statistics */
             customers: components["schemas"]["CustomerStatistics"];
             /**
-             * Total Revenue
-             * @description Total revenue from vehicle sales
+             * Total Revenue
+             * @description Total revenue from vehicle sales
+             */
+            total_revenue: number;
+            /**
+             * Revenue By Month
+             * @description Revenue by month
+             */
+            revenue_by_month: {
+                [key: string]: number;
+            };
+            /** @description Same series for the preceding period, only set when compare_previous is requested */
+            previous_period?: components["schemas"]["PeriodStatistics"] | null;
+        };
+        /** DaysToSellStatistics */
+        DaysToSellStatistics: {
+            /**
+             * Sold Count
+             * @description Number of sold vehicles the figures are based on
+             */
+            sold_count: number;
+            /**
+             * Avg Days To Sell
+             * @description Average days from listing to sale
+             */
+            avg_days_to_sell?: number | null;
+            /**
+             * Median Days To Sell
+             * @description Median days from listing to sale
+             */
+            median_days_to_sell?: number | null;
+            /**
+             * P90 Days To Sell
+             * @description 90th percentile of days from listing to sale
+             */
+            p90_days_to_sell?: number | null;
+        };
+        /**
+         * EncodingStatistics
+         * @description Compression statistics for one content encoding
+         */
+        EncodingStatistics: {
+            /**
+             * Encoding
+             * @description Content encoding
+             */
+            encoding: string;
+            /**
+             * Level
+             * @description Compression level in use
+             */
+            level: number;
+            /**
+             * Responses
+             * @description Responses compressed with this encoding
+             */
+            responses: number;
+            /**
+             * Streamed Responses
+             * @description Of those, responses compressed chunk by chunk
+             */
+            streamed_responses: number;
+            /**
+             * Bytes In
+             * @description Uncompressed bytes
+             */
+            bytes_in: number;
+            /**
+             * Bytes Out
+             * @description Compressed bytes sent
+             */
+            bytes_out: number;
+            /**
+             * Ratio
+             * @description Uncompressed bytes per compressed byte
              */
-            total_revenue: number;
+            ratio: number;
             /**
-             * Revenue By Month
-             * @description Revenue by month
+             * Duration Total Ms
+             * @description Time spent compressing
              */
-            revenue_by_month: {
-                [key: string]: number;
-            };
+            duration_total_ms: number;
+            /**
+             * Duration Per Mb Ms
+             * @description Average time spent compressing one uncompressed megabyte
+             */
+            duration_per_mb_ms: number;
         };
+        /**
+         * ExportFormat
+         * @enum {string}
+         */
+        ExportFormat: "csv" | "ndjson";
         /**
          * FuelType
          * @enum {string}
@@ -462,6 +914,61 @@ export interface components {
             /** Detail */
             detail?: components["schemas"]["ValidationError"][];
         };
+        /**
+         * ImportResult
+         * @description Outcome of a bulk import
+         */
+        ImportResult: {
+            /**
+             * Received
+             * @description Number of data rows read from the request body
+             */
+            received: number;
+            /**
+             * Imported
+             * @description Number of rows stored as new records
+             */
+            imported: number;
+            /**
+             * Updated
+             * @description Number of rows that updated an existing record
+             * @default 0
+             */
+            updated?: number;
+            /**
+             * Failed
+             * @description Number of rejected rows
+             */
+            failed: number;
+            /**
+             * Errors
+             * @description Rejected rows, capped at the first 1000
+             */
+            errors: components["schemas"]["ImportRowError"][];
+            /**
+             * Duration Seconds
+             * @description Time spent reading, validating and storing the rows
+             */
+            duration_seconds: number;
+            /**
+             * Rows Per Second
+             * @description Received rows per second
+             */
+            rows_per_second: number;
+        };
+        /** ImportRowError */
+        ImportRowError: {
+            /**
+             * Row
+             * @description 1-based data row (CSV header and blank lines excluded)
+             */
+            row: number;
+            /**
+             * Detail
+             * @description Why the row was rejected
+             */
+            detail: string;
+        };
         /** OrganizationCreate */
         OrganizationCreate: {
             /**
@@ -502,19 +1009,144 @@ export interface components {
              */
             created_at: string;
         };
-        /** Page[VehicleResponse] */
-        Page_VehicleResponse_: {
-            /** Items */
-            items: components["schemas"]["VehicleResponse"][];
-            /** Total */
-            total?: number | null;
-            /** Page */
-            page: number | null;
-            /** Size */
-            size: number | null;
-            /** Pages */
-            pages?: number | null;
+        /**
+         * PasswordHasherStatistics
+         * @description Password hashing worker pool statistics
+         */
+        PasswordHasherStatistics: {
+            /**
+             * Workers
+             * @description Worker processes hashing passwords
+             */
+            workers: number;
+            /**
+             * Max Pending
+             * @description Maximum admitted operations before new ones are rejected
+             */
+            max_pending: number;
+            /**
+             * In Flight
+             * @description Operations currently running or queued
+             */
+            in_flight: number;
+            /**
+             * Queued
+             * @description Operations waiting for a free worker
+             */
+            queued: number;
+            /**
+             * Completed
+             * @description Operations finished since startup
+             */
+            completed: number;
+            /**
+             * Rejected
+             * @description Operations rejected by admission control
+             */
+            rejected: number;
+            /**
+             * Duration Avg Ms
+             * @description Average time per operation, including queueing
+             */
+            duration_avg_ms: number;
+        };
+        /** PeriodStatistics */
+        PeriodStatistics: {
+            /**
+             * From Date
+             * Format: date
+             * @description First day of the period
+             */
+            from_date: string;
+            /**
+             * To Date
+             * Format: date
+             * @description Last day of the period
+             */
+            to_date: string;
+            /**
+             * Sales By Month
+             * @description Number of vehicles sold per bucket
+             */
+            sales_by_month: {
+                [key: string]: number;
+            };
+            /**
+             * Customers By Month
+             * @description Number of new customers per bucket
+             */
+            customers_by_month: {
+                [key: string]: number;
+            };
+            /**
+             * Revenue By Month
+             * @description Revenue per bucket
+             */
+            revenue_by_month: {
+                [key: string]: number;
+            };
+        };
+        /**
+         * PoolStatistics
+         * @description Live connection pool statistics
+         */
+        PoolStatistics: {
+            /**
+             * Engine
+             * @description Engine the pool belongs to
+             */
+            engine: string;
+            /**
+             * Size
+             * @description Configured number of persistent connections
+             */
+            size: number;
+            /**
+             * Max Overflow
+             * @description Configured number of overflow connections
+             */
+            max_overflow: number;
+            /**
+             * Checked In
+             * @description Idle connections in the pool
+             */
+            checked_in: number;
+            /**
+             * Checked Out
+             * @description Connections currently checked out
+             */
+            checked_out: number;
+            /**
+             * Overflow
+             * @description Overflow connections currently open
+             */
+            overflow: number;
+            /**
+             * Checkouts
+             * @description Successful checkouts since startup
+             */
+            checkouts: number;
+            /**
+             * Checkout Timeouts
+             * @description Checkouts that timed out waiting for a connection
+             */
+            checkout_timeouts: number;
+            /**
+             * Wait Time Avg Ms
+             * @description Average time spent waiting for a connection
+             */
+            wait_time_avg_ms: number;
+            /**
+             * Wait Time Max Ms
+             * @description Longest time spent waiting for a connection
+             */
+            wait_time_max_ms: number;
         };
+        /**
+         * StatisticsGranularity
+         * @enum {string}
+         */
+        StatisticsGranularity: "day" | "week" | "month";
         /** UserCreate */
         UserCreate: {
             /**
@@ -587,6 +1219,76 @@ export interface components {
             /** Error Type */
             type: string;
         };
+        /** VehicleBatchError */
+        VehicleBatchError: {
+            /**
+             * Vehicle Id
+             * Format: uuid4
+             * @description ID of the vehicle that was not updated
+             */
+            vehicle_id: string;
+            /**
+             * Detail
+             * @description Why the vehicle was not updated
+             */
+            detail: string;
+        };
+        /**
+         * VehicleBatchMarkAsSold
+         * @description Schema for marking several vehicles as sold to one customer at once
+         */
+        VehicleBatchMarkAsSold: {
+            /**
+             * Vehicle Ids
+             * @description IDs of the vehicles to update
+             */
+            vehicle_ids: string[];
+            /**
+             * Atomic
+             * @description Fail the whole batch when any vehicle is not found, otherwise update the rest and report the missing ones
+             * @default true
+             */
+            atomic?: boolean;
+            /**
+             * Sold To Id
+             * Format: uuid4
+             * @description ID of the customer the vehicles are sold to
+             */
+            sold_to_id: string;
+        };
+        /**
+         * VehicleBatchMarkAsUnsold
+         * @description Schema for marking several vehicles as unsold at once
+         */
+        VehicleBatchMarkAsUnsold: {
+            /**
+             * Vehicle Ids
+             * @description IDs of the vehicles to update
+             */
+            vehicle_ids: string[];
+            /**
+             * Atomic
+             * @description Fail the whole batch when any vehicle is not found, otherwise update the rest and report the missing ones
+             * @default true
+             */
+            atomic?: boolean;
+        };
+        /**
+         * VehicleBatchResult
+         * @description Outcome of a batch vehicle update
+         */
+        VehicleBatchResult: {
+            /**
+             * Items
+             * @description Updated vehicles
+             */
+            items: components["schemas"]["VehicleResponse"][];
+            /**
+             * Failed
+             * @description Vehicles that were not updated, only when atomic is false
+             */
+            failed?: components["schemas"]["VehicleBatchError"][];
+        };
         /** VehicleCreate */
         VehicleCreate: {
             /**
@@ -748,6 +1450,11 @@ export interface components {
              */
             created_at: string;
         };
+        /**
+         * VehicleSortField
+         * @enum {string}
+         */
+        VehicleSortField: "created_at" | "price" | "kms_driven" | "model_year" | "relevance";
         /** VehicleStatistics */
         VehicleStatistics: {
             /**
@@ -786,6 +1493,30 @@ export interface components {
              * @description Average days from listing to sale
              */
             avg_days_to_sell?: number | null;
+            /**
+             * Median Days To Sell
+             * @description Median days from listing to sale
+             */
+            median_days_to_sell?: number | null;
+            /**
+             * P90 Days To Sell
+             * @description 90th percentile of days from listing to sale
+             */
+            p90_days_to_sell?: number | null;
+            /**
+             * Days To Sell By Brand
+             * @description Time to sell by brand, for brands with sold vehicles
+             */
+            days_to_sell_by_brand?: {
+                [key: string]: components["schemas"]["DaysToSellStatistics"];
+            };
+            /**
+             * Days To Sell By Fuel Type
+             * @description Time to sell by fuel type, for fuel types with sold vehicles
+             */
+            days_to_sell_by_fuel_type?: {
+                [key: string]: components["schemas"]["DaysToSellStatistics"];
+            };
         };
     };
     responses: never;
@@ -796,22 +1527,41 @@ export interface components {
 }
 export type SchemaBrandCreate = components['schemas']['BrandCreate'];
 export type SchemaBrandResponse = components['schemas']['BrandResponse'];
+export type SchemaCacheStatistics = components['schemas']['CacheStatistics'];
+export type SchemaCompressionStatistics = components['schemas']['CompressionStatistics'];
+export type SchemaCursorPageBrandResponse = components['schemas']['CursorPage_BrandResponse_'];
+export type SchemaCursorPageCustomerResponse = components['schemas']['CursorPage_CustomerResponse_'];
+export type SchemaCursorPageOrganizationResponse = components['schemas']['CursorPage_OrganizationResponse_'];
+export type SchemaCursorPageVehicleResponse = components['schemas']['CursorPage_VehicleResponse_'];
 export type SchemaCustomerCreate = components['schemas']['CustomerCreate'];
 export type SchemaCustomerResponse = components['schemas']['CustomerResponse'];
 export type SchemaCustomerStatistics = components['schemas']['CustomerStatistics'];
 export type SchemaDashboardStatistics = components['schemas']['DashboardStatistics'];
+export type SchemaDaysToSellStatistics = components['schemas']['DaysToSellStatistics'];
+export type SchemaEncodingStatistics = components['schemas']['EncodingStatistics'];
+export type SchemaExportFormat = components['schemas']['ExportFormat'];
 export type SchemaFuelType = components['schemas']['FuelType'];
 export type SchemaHttpValidationError = components['schemas']['HTTPValidationError'];
+export type SchemaImportResult = components['schemas']['ImportResult'];
+export type SchemaImportRowError = components['schemas']['ImportRowError'];
 export type SchemaOrganizationCreate = components['schemas']['OrganizationCreate'];
 export type SchemaOrganizationResponse = components['schemas']['OrganizationResponse'];
-export type SchemaPageVehicleResponse = components['schemas']['Page_VehicleResponse_'];
+export type SchemaPasswordHasherStatistics = components['schemas']['PasswordHasherStatistics'];
+export type SchemaPeriodStatistics = components['schemas']['PeriodStatistics'];
+export type SchemaPoolStatistics = components['schemas']['PoolStatistics'];
+export type SchemaStatisticsGranularity = components['schemas']['StatisticsGranularity'];
 export type SchemaUserCreate = components['schemas']['UserCreate'];
 export type SchemaUserLogin = components['schemas']['UserLogin'];
 export type SchemaUserResponse = components['schemas']['UserResponse'];
 export type SchemaValidationError = components['schemas']['ValidationError'];
+export type SchemaVehicleBatchError = components['schemas']['VehicleBatchError'];
+export type SchemaVehicleBatchMarkAsSold = components['schemas']['VehicleBatchMarkAsSold'];
+export type SchemaVehicleBatchMarkAsUnsold = components['schemas']['VehicleBatchMarkAsUnsold'];
+export type SchemaVehicleBatchResult = components['schemas']['VehicleBatchResult'];
 export type SchemaVehicleCreate = components['schemas']['VehicleCreate'];
 export type SchemaVehicleMarkAsSold = components['schemas']['VehicleMarkAsSold'];
 export type SchemaVehicleResponse = components['schemas']['VehicleResponse'];
+export type SchemaVehicleSortField = components['schemas']['VehicleSortField'];
 export type SchemaVehicleStatistics = components['schemas']['VehicleStatistics'];
 export type $defs = Record<string, never>;
 export interface operations {
@@ -834,7 +1584,122 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["UserResponse"];
+                    "application/json": components["schemas"]["UserResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    AuthController_login_auth_login_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["UserLogin"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["UserResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    AuthController_logout_auth_logout_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
+    AuthController_session_auth_session_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["UserResponse"];
+                };
+            };
+        };
+    };
+    VehiclesController_get_vehicles_organizations__organization_id__vehicles__get: {
+        parameters: {
+            query?: {
+                /** @description Comma separated response fields to return, all fields when omitted */
+                fields?: string;
+                search?: string | null;
+                vehicle_status?: "new" | "used" | null;
+                sale_status?: "sold" | "unsold" | null;
+                sort_by?: components["schemas"]["VehicleSortField"] | null;
+                sort_order?: "asc" | "desc";
+                cursor?: string | null;
+                size?: number;
+                include_total?: boolean;
+            };
+            header?: never;
+            path: {
+                organization_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CursorPage_VehicleResponse_"];
                 };
             };
             /** @description Validation Error */
@@ -848,26 +1713,28 @@ export interface operations {
             };
         };
     };
-    AuthController_login_auth_login_post: {
+    VehiclesController_create_vehicle_organizations__organization_id__vehicles__post: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                organization_id: string;
+            };
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["UserLogin"];
+                "application/json": components["schemas"]["VehicleCreate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            200: {
+            201: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["UserResponse"];
+                    "application/json": components["schemas"]["VehicleResponse"];
                 };
             };
             /** @description Validation Error */
@@ -881,14 +1748,21 @@ export interface operations {
             };
         };
     };
-    AuthController_logout_auth_logout_post: {
+    VehiclesController_import_vehicles_organizations__organization_id__vehicles_import_post: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                organization_id: string;
+            };
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "text/csv": string;
+                "application/x-ndjson": string;
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -896,45 +1770,67 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
+                    "application/json": components["schemas"]["ImportResult"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    AuthController_session_auth_session_get: {
+    VehiclesController_export_vehicles_organizations__organization_id__vehicles_export_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Export file format */
+                format?: components["schemas"]["ExportFormat"];
+                search?: string | null;
+                vehicle_status?: "new" | "used" | null;
+                sale_status?: "sold" | "unsold" | null;
+                sort_by?: components["schemas"]["VehicleSortField"] | null;
+                sort_order?: "asc" | "desc";
+            };
             header?: never;
-            path?: never;
+            path: {
+                organization_id: string;
+            };
             cookie?: never;
         };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["UserResponse"];
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    VehiclesController_get_vehicles_organizations__organization_id__vehicles__get: {
+    VehiclesController_get_vehicle_organizations__organization_id__vehicles__vehicle_id__get: {
         parameters: {
             query?: {
-                search?: string | null;
-                is_new?: string | null;
-                is_sold?: string | null;
-                /** @description Page number */
-                page?: number;
-                /** @description Page size */
-                size?: number;
+                /** @description Comma separated response fields to return, all fields when omitted */
+                fields?: string;
             };
             header?: never;
             path: {
                 organization_id: string;
+                vehicle_id: string;
             };
             cookie?: never;
         };
@@ -946,7 +1842,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["Page_VehicleResponse_"];
+                    "application/json": components["schemas"]["VehicleResponse"];
                 };
             };
             /** @description Validation Error */
@@ -960,12 +1856,13 @@ export interface operations {
             };
         };
     };
-    VehiclesController_create_vehicle_organizations__organization_id__vehicles__post: {
+    VehiclesController_update_vehicle_organizations__organization_id__vehicles__vehicle_id__put: {
         parameters: {
             query?: never;
             header?: never;
             path: {
                 organization_id: string;
+                vehicle_id: string;
             };
             cookie?: never;
         };
@@ -976,7 +1873,7 @@ export interface operations {
         };
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
@@ -995,7 +1892,7 @@ export interface operations {
             };
         };
     };
-    VehiclesController_get_vehicle_organizations__organization_id__vehicles__vehicle_id__get: {
+    VehiclesController_delete_vehicle_organizations__organization_id__vehicles__vehicle_id__delete: {
         parameters: {
             query?: never;
             header?: never;
@@ -1008,13 +1905,11 @@ export interface operations {
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            200: {
+            204: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content: {
-                    "application/json": components["schemas"]["VehicleResponse"];
-                };
+                content?: never;
             };
             /** @description Validation Error */
             422: {
@@ -1027,19 +1922,18 @@ export interface operations {
             };
         };
     };
-    VehiclesController_update_vehicle_organizations__organization_id__vehicles__vehicle_id__put: {
+    VehiclesController_mark_vehicles_as_sold_organizations__organization_id__vehicles_mark_as_sold_post: {
         parameters: {
             query?: never;
             header?: never;
             path: {
                 organization_id: string;
-                vehicle_id: string;
             };
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["VehicleCreate"];
+                "application/json": components["schemas"]["VehicleBatchMarkAsSold"];
             };
         };
         responses: {
@@ -1049,7 +1943,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["VehicleResponse"];
+                    "application/json": components["schemas"]["VehicleBatchResult"];
                 };
             };
             /** @description Validation Error */
@@ -1063,24 +1957,29 @@ export interface operations {
             };
         };
     };
-    VehiclesController_delete_vehicle_organizations__organization_id__vehicles__vehicle_id__delete: {
+    VehiclesController_mark_vehicles_as_unsold_organizations__organization_id__vehicles_mark_as_unsold_post: {
         parameters: {
             query?: never;
             header?: never;
             path: {
                 organization_id: string;
-                vehicle_id: string;
             };
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["VehicleBatchMarkAsUnsold"];
+            };
+        };
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["VehicleBatchResult"];
+                };
             };
             /** @description Validation Error */
             422: {
@@ -1163,7 +2062,11 @@ export interface operations {
     };
     OrganizationsController_get_organizations_organizations__get: {
         parameters: {
-            query?: never;
+            query?: {
+                cursor?: string | null;
+                size?: number;
+                include_total?: boolean;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -1176,7 +2079,16 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["OrganizationResponse"][];
+                    "application/json": components["schemas"]["CursorPage_OrganizationResponse_"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
@@ -1311,7 +2223,11 @@ export interface operations {
     };
     BrandsController_get_brands_brands__get: {
         parameters: {
-            query?: never;
+            query?: {
+                cursor?: string | null;
+                size?: number;
+                include_total?: boolean;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -1324,7 +2240,16 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["BrandResponse"][];
+                    "application/json": components["schemas"]["CursorPage_BrandResponse_"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
@@ -1462,6 +2387,11 @@ export interface operations {
             query?: {
                 /** @description Search term for filtering customers */
                 search?: string;
+                /** @description Comma separated response fields to return, all fields when omitted */
+                fields?: string;
+                cursor?: string | null;
+                size?: number;
+                include_total?: boolean;
             };
             header?: never;
             path: {
@@ -1477,7 +2407,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["CustomerResponse"][];
+                    "application/json": components["schemas"]["CursorPage_CustomerResponse_"];
                 };
             };
             /** @description Validation Error */
@@ -1526,10 +2456,83 @@ export interface operations {
             };
         };
     };
-    CustomersController_get_customer_organizations__organization_id__customers__customer_id__get: {
+    CustomersController_import_customers_organizations__organization_id__customers_import_post: {
         parameters: {
             query?: never;
             header?: never;
+            path: {
+                organization_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "text/csv": string;
+                "application/x-ndjson": string;
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ImportResult"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    CustomersController_export_customers_organizations__organization_id__customers_export_get: {
+        parameters: {
+            query?: {
+                /** @description Search term for filtering customers */
+                search?: string;
+                /** @description Export file format */
+                format?: components["schemas"]["ExportFormat"];
+            };
+            header?: never;
+            path: {
+                organization_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    CustomersController_get_customer_organizations__organization_id__customers__customer_id__get: {
+        parameters: {
+            query?: {
+                /** @description Comma separated response fields to return, all fields when omitted */
+                fields?: string;
+            };
+            header?: never;
             path: {
                 organization_id: string;
                 customer_id: string;
@@ -1626,7 +2629,18 @@ export interface operations {
     };
     StatisticsController_get_dashboard_statistics_organizations__organization_id__statistics_dashboard_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description First day of the time series, defaults to 6 days before to */
+                from?: string | null;
+                /** @description Last day of the time series, defaults to today */
+                to?: string | null;
+                /** @description Bucket size of the time series, buckets are keyed by their first day */
+                granularity?: components["schemas"]["StatisticsGranularity"];
+                /** @description IANA time zone whose calendar days are used, defaults to the server's statistics time zone */
+                timezone?: string | null;
+                /** @description Also return the series for the equally long period right before from */
+                compare_previous?: boolean;
+            };
             header?: never;
             path: {
                 organization_id: string;
@@ -1655,4 +2669,84 @@ export interface operations {
             };
         };
     };
+    AdminController_get_pool_statistics_admin_pool_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PoolStatistics"][];
+                };
+            };
+        };
+    };
+    AdminController_get_cache_statistics_admin_caches_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CacheStatistics"][];
+                };
+            };
+        };
+    };
+    AdminController_get_password_hasher_statistics_admin_password_hasher_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PasswordHasherStatistics"];
+                };
+            };
+        };
+    };
+    AdminController_get_compression_statistics_admin_compression_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CompressionStatistics"];
+                };
+            };
+        };
+    };
 }